@@ -1,7 +1,7 @@
 # cogs/economy.py
-import random
 import discord
 import configparser
+import io
 from discord.ext import commands, tasks
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -9,8 +9,9 @@ from typing import Optional, Set, Dict
 
 from utils.stats import (
     load_stats, save_stats, ensure_user, format_num,
-    spend_points, get_points, add_points
+    spend_points, get_points, add_points, notify_points
 )
+from utils.rng import RNG, format_seed
 
 DAILY_ATTEND_REWARD = 1500
 
@@ -67,7 +68,7 @@ class EconomyCog(commands.Cog):
         )
 
     def _pick_voice_candidates(self, guild: discord.Guild):
-        """AFK/봇 제외하고 음성/스테이지 채널 참여자 수집"""
+        """AFK/봇 제외하고 음성/스테이지 채널 참여자 수집 (유저 ID 순 — 시드 + 후보 목록으로 추첨 재현)"""
         candidates = []
         afk_id = guild.afk_channel.id if guild.afk_channel else None
         voice_like = list(guild.voice_channels) + list(getattr(guild, "stage_channels", []))
@@ -77,8 +78,38 @@ class EconomyCog(commands.Cog):
             for m in ch.members:
                 if not m.bot:
                     candidates.append((m, ch))
+        candidates.sort(key=lambda c: c[0].id)
         return candidates
 
+    @staticmethod
+    def _draw_voice_winner(guild: discord.Guild, candidates):
+        """시드 발급 후 추첨. 재현용으로 시드와 정렬된 후보 ID 목록을 콘솔에 남긴다."""
+        rng = RNG.session()
+        winner, vch = rng.choice(candidates)
+        print(f"[voice-random] guild={guild.id} seed={format_seed(rng.initial_seed)} "
+              f"candidates={[m.id for m, _ in candidates]} winner={winner.id}")
+        return winner, vch, rng
+
+    async def _log_voice_draw(self, guild: discord.Guild, candidates, winner: discord.Member, rng, amount: int) -> None:
+        """지급-로그 채널에 시드 + 정렬된 후보 ID 목록 기록 (이의 제기 시 같은 시드/목록으로 추첨 재현)"""
+        log_ch = self._get_pay_log_channel(guild)
+        if not log_ch:
+            return
+        ids = ", ".join(str(m.id) for m, _ in candidates)
+        log_embed = discord.Embed(
+            title="🎲 보이스 랜덤 로그",
+            description=(f"**당첨자:** {winner.mention}\n"
+                         f"**금액:** {format_num(amount)} P\n"
+                         f"**seed:** `{format_seed(rng.initial_seed)}`\n"
+                         f"**후보 {len(candidates)}명 (유저 ID 순):**"),
+            color=discord.Color.gold()
+        )
+        if len(ids) <= 1000:
+            log_embed.add_field(name="후보 ID", value=ids, inline=False)
+            await log_ch.send(embed=log_embed)
+        else:  # 임베드 한도를 넘으면 파일로
+            await log_ch.send(embed=log_embed, file=discord.File(io.BytesIO(ids.encode()), filename="voice_candidates.txt"))
+
     def _get_announce_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
         """공지 채널 선택:
         1) config.ini의 VOICE_ANNOUNCE_CHANNEL_ID
@@ -142,6 +173,7 @@ class EconomyCog(commands.Cog):
         rec["포인트"] = int(rec.get("포인트", 0)) + DAILY_ATTEND_REWARD
         rec["출석_마지막"] = today_str
         save_stats(stats)
+        notify_points({ctx.author.id: DAILY_ATTEND_REWARD})
 
         embed = discord.Embed(
             title="출석 완료!",
@@ -168,8 +200,13 @@ class EconomyCog(commands.Cog):
             await log_ch.send(embed=log_embed)
 
     @commands.command(name="지갑")
-    async def wallet(self, ctx: commands.Context, member: discord.Member | None = None):
+    async def wallet(self, ctx: commands.Context, member: discord.Member | None = None, option: str | None = None):
+        """사용법: !지갑 [@유저] [카드]"""
         target = member or ctx.author
+        if option == "카드":
+            stats_cog = self.bot.get_cog("StatsCog")
+            if stats_cog is not None and await stats_cog.send_card(ctx, target):
+                return
         stats = load_stats()
         rec = ensure_user(stats, str(target.id))
 
@@ -195,6 +232,7 @@ class EconomyCog(commands.Cog):
         rec = ensure_user(stats, str(member.id))
         rec["포인트"] = int(rec.get("포인트", 0)) + amount
         save_stats(stats)
+        notify_points({member.id: amount})
 
         embed = discord.Embed(
             title="포인트 지급 완료",
@@ -333,8 +371,9 @@ class EconomyCog(commands.Cog):
             await ctx.send("지금은 어떤 음성 채널에도 사람이 없어요. 😴")
             return
 
-        winner, vch = random.choice(candidates)
+        winner, vch, rng = self._draw_voice_winner(guild, candidates)
         new_balance = add_points(winner.id, amount)
+        await self._log_voice_draw(guild, candidates, winner, rng, amount)
 
         embed = discord.Embed(
             title="🎉 보이스 랜덤 지급",
@@ -343,6 +382,7 @@ class EconomyCog(commands.Cog):
                          f"지급액: **{format_num(amount)} P**\n"),
             color=discord.Color.gold()
         )
+        embed.set_footer(text=f"후보 {len(candidates)}명 · seed {format_seed(rng.initial_seed)}")
 
         # 결과는 공지 채널로 전송
         ch = self._get_announce_channel(guild)
@@ -370,8 +410,9 @@ class EconomyCog(commands.Cog):
                 if not candidates:
                     continue
 
-                winner, vch = random.choice(candidates)
+                winner, vch, rng = self._draw_voice_winner(guild, candidates)
                 new_balance = add_points(winner.id, self.voice_grant_amount)
+                await self._log_voice_draw(guild, candidates, winner, rng, self.voice_grant_amount)
 
                 ch = self._get_announce_channel(guild)
                 if not ch:
@@ -385,6 +426,7 @@ class EconomyCog(commands.Cog):
                                  f"현재 보유 포인트: **{format_num(new_balance)} P**"),
                     color=discord.Color.gold()
                 )
+                embed.set_footer(text=f"후보 {len(candidates)}명 · seed {format_seed(rng.initial_seed)}")
                 await ch.send(embed=embed)
             except Exception:
                 continue  # 길드 단위 예외는 넘기고 다음 길드 진행
@@ -1,10 +1,27 @@
 # cogs/fun_cog.py
 import random
-from pathlib import Path
 import discord
 from discord.ext import commands
 from collections import deque
 
+from utils.rng import RNG, format_seed
+from utils.assets import assets, overlay_text
+
+# 주사위 결과별 이미지 (assets/). 꽝/999 이미지가 없으면 주사위 면에 문구를 얹은 변형을 미리 만들어 씀
+DICE_IMAGES = {
+    "1": "1.png",
+    "2": "2.png",
+    "3": "3.png",
+    "4": "4.png",
+    "5": "5.png",
+    "6": "6.png",
+    "꽝": "fail.png",
+    "999": "999.png",
+}
+assets.require(*DICE_IMAGES.values())
+assets.variant("fail.png", "1.png", overlay_text("FAIL", (237, 66, 69), tint=(120, 0, 0)))
+assets.variant("999.png", "6.png", overlay_text("999", (255, 215, 0), tint=(120, 90, 0)))
+
 돌_대답 = [
     "구르는 돌은 방향을 잊어요. 그래서 언덕을 오를 수 없어요.",
     "깊게 가라앉은 돌은, 얕은 물을 싫어했어요.",
@@ -78,7 +95,6 @@ class FunCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.recent = deque(maxlen=5)
-        self.dice_img_dir = (Path(__file__).resolve().parents[1] / "assets").resolve()
 
     @commands.command(name="고민")
     async def 고민(self, ctx: commands.Context, *, 내용: str):
@@ -91,20 +107,9 @@ class FunCog(commands.Cog):
     async def roll_dice(self, ctx: commands.Context):
         outcomes = ["1", "2", "3", "4", "5", "6", "꽝", "999"]
         weights  = [16, 16, 16, 16, 16, 16,   2,   2]
-        result = random.choices(outcomes, weights=weights, k=1)[0]
-
-        # 결과별 파일명 매핑
-        filename_map = {
-            "1": "1.png",
-            "2": "2.png",
-            "3": "3.png",
-            "4": "4.png",
-            "5": "5.png",
-            "6": "6.png",
-            "꽝": "fail.png",
-            "999": "999.png",
-        }
-        fp = self.dice_img_dir / filename_map[result]
+        rng = RNG.session()  # 시드로 결과 재현 가능
+        result = rng.choices(outcomes, weights=weights, k=1)[0]
+        image = DICE_IMAGES[result]
 
         # 결과 메시지/색상
         if result in {"1", "2", "3", "4", "5", "6"}:
@@ -118,12 +123,30 @@ class FunCog(commands.Cog):
             color = discord.Color.gold()
 
         embed = discord.Embed(title=title, color=color)
+        embed.set_footer(text=f"seed {format_seed(rng.initial_seed)}")
 
-        # 이미지가 있으면 첨부해서 Embed에 표시, 없으면 텍스트만
-        if fp.exists():
-            file = discord.File(fp, filename=fp.name)
-            embed.set_image(url=f"attachment://{fp.name}")
+        # 이미지가 있으면 첨부해서 Embed에 표시, 없으면 텍스트만 (메모리에서 바로 첨부)
+        file = assets.file(image)
+        if file:
+            embed.set_image(url=f"attachment://{image}")
             await ctx.send(embed=embed, file=file)
         else:
             # 이미지 누락 시 안전 폴백
             await ctx.send(embed=embed)
+
+    @commands.has_guild_permissions(administrator=True)
+    @commands.command(name="에셋리로드")
+    async def reload_assets(self, ctx: commands.Context):
+        """assets/ 이미지를 다시 읽고 변형을 다시 합성 (재시작 없이 이미지 교체)"""
+        report = assets.reload()
+        lines = [f"이미지 {report.loaded}개 + 합성 {report.variants}개 ({report.bytes / 1024:.0f} KiB)"]
+        if report.missing:
+            lines.append(f"⚠️ 없는 이미지: {', '.join(report.missing)}")
+        if report.failed:
+            lines.append("⚠️ 합성 실패: " + " / ".join(report.failed))
+        await ctx.send(embed=discord.Embed(title="🖼️ 에셋 리로드", description="\n".join(lines), color=0x2F3136))
+
+    @reload_assets.error
+    async def _reload_assets_error(self, ctx: commands.Context, error: Exception):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.reply("이 명령은 **관리자만** 사용할 수 있어요.", delete_after=5)
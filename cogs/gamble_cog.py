@@ -2,19 +2,26 @@
 import asyncio
 import random
 import math
+import time
+import uuid
 import configparser
-from pathlib import Path
 import discord
 from discord.ext import commands
 from discord.ext.commands import BucketType
 
 from utils.stats import format_num, spend_points, add_points, get_points
+from utils.escrow import load_escrows, open_escrow, update_escrow, close_escrow
+from utils.rng import RNG, format_seed, parse_seed
+from utils.gamble_stats import gamble_stats, GAME_LABELS, TOTAL_KEY
+from utils.timers import timers
+from utils.assets import assets
 
 MIN_BET = 1000            # 최소 베팅
 
 # ===== 그래프(크래시) 전용 설정 =====
-TICK_SEC = 0.25           # (그래프) 화면 갱신 간격(초)
-GROWTH_PER_TICK = 1.045   # (그래프) 한 틱마다 배율 * 1.045 (약 4.5% 상승)
+TICK_SEC = 0.25           # (그래프) 화면 갱신 간격(초) — 배율/정산에는 영향 없음
+START_MULTIPLIER = 0.50   # (그래프) 시작 배율
+GROWTH_PER_SEC = 1.045 ** 4  # (그래프) 1초마다 배율 상승 (기존 0.25초당 1.045배와 동일)
 MAX_MULTIPLIER = 30.0     # (그래프) 배율 상한
 
 # ===== config.ini에서 채널 ID 읽기 =====
@@ -36,16 +43,76 @@ def _get_id(section: str, key: str) -> int:
 GAMBLE_CHANNEL_ID     = _get_id("Gamble", "gamble_channel_id")
 GAMBLE_LOG_CHANNEL_ID = _get_id("Gamble", "gamble_log_channel_id")
 
-# ===== 그래프 썸네일 이미지 경로 =====
-ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+# ===== 그래프 썸네일 이미지 (시작 때 메모리에 올려 둔 assets/graph.png) =====
 GRAPH_IMG_NAME = "graph.png"        # assets/graph.png 로 넣어두세요
-GRAPH_IMG_PATH = ASSETS_DIR / GRAPH_IMG_NAME
-
-import random
-
-def roll_crash_point():
+assets.require(GRAPH_IMG_NAME)
+
+# ===== 크래시 지점 분포 (구간 하한, 상한, 가중치) — 총합 101% -> 정규화하여 사용 =====
+CRASH_BUCKETS: list[tuple[float, float, float]] = [
+    (0.51, 1.00,  2.0),
+    (1.10, 1.30, 38.0),
+    (1.31, 1.50, 25.0),
+    (1.51, 1.75, 12.0),
+    (1.76, 2.00,  7.0),
+    (2.01, 2.30,  5.0),
+    (2.31, 2.50,  3.0),
+    (2.51, 3.00,  2.0),
+    (3.01, 4.00,  2.0),
+    (4.01, 5.00,  2.0),
+    (5.00,10.00,  1.5),
+    (10.00,15.00, 1.0),
+    (16.00,30.00, 0.5),
+]
+
+# ===== !도박1 배율칸 고정 목록 =====
+MULTIPLIER_POOL: tuple[float, ...] = (0.5, 0.5, 0.6, 0.6, 0.7, 0.8, 0.9, 1.0, 1.5, 2.0)
+
+# ===== !도박3 승리 배당 범위 =====
+RPS_WIN_MULTI_RANGE = (1.10, 2.00)
+
+# ===== 버튼(마인) 보드 / 제한 시간 =====
+MINES_ROWS, MINES_COLS = 4, 4
+MINES_NCELLS = MINES_ROWS * MINES_COLS
+MINES_NUM_BOMBS = 6
+MINES_TIMEOUT = 120       # 2분 제한
+RPS_TIMEOUT = 15
+
+RPS_CHOICES = ("가위", "바위", "보")
+RPS_EMOJIS = {"가위": "✌️", "바위": "✊", "보": "✋"}
+RPS_WINS = {"가위": "보", "바위": "가위", "보": "바위"}
+
+
+def build_alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+    """
+    Vose 별칭(alias) 테이블 생성 (가중치 합은 자동 정규화).
+    반환: (prob, alias) — 칸 i를 균등 선택 후 random() < prob[i] 이면 i, 아니면 alias[i].
     """
-    크래시 지점 샘플링 (요청한 구간/확률 반영, 총합 101% -> 정규화하여 사용)
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    prob = [0.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = (scaled[l] + scaled[s]) - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    for i in large + small:  # 남은 칸(부동소수 오차 포함)은 확률 1
+        prob[i] = 1.0
+    return prob, alias
+
+
+# 모듈 로드 시 1회만 컴파일
+CRASH_ALIAS_PROB, CRASH_ALIAS_IDX = build_alias_table([w for _, _, w in CRASH_BUCKETS])
+
+
+def roll_crash_point(rng: random.Random | None = None):
+    """
+    크래시 지점 샘플링 (CRASH_BUCKETS 구간/확률 반영, 별칭 테이블로 O(1) 추첨)
+    rng: 세션 PRNG (없으면 전역 random 모듈)
       0.51~1.00 : 2%
       1.10~1.30 : 38%
       1.31~1.50 : 25%
@@ -60,32 +127,261 @@ def roll_crash_point():
       10.00~15.00: 1%
       16.00~30.00: 0.5%
     """
-    buckets = [
-        (0.51, 1.00,  2.0),
-        (1.10, 1.30, 38.0),
-        (1.31, 1.50, 25.0),
-        (1.51, 1.75, 12.0),
-        (1.76, 2.00,  7.0),
-        (2.01, 2.30,  5.0),
-        (2.31, 2.50,  3.0),
-        (2.51, 3.00,  2.0),
-        (3.01, 4.00,  2.0),
-        (4.01, 5.00,  2.0),
-        (5.00,10.00,  1.5),
-        (10.00,15.00, 1.0),
-        (16.00,30.00, 0.5),
-    ]
-    total = sum(w for _, _, w in buckets)  # 101.0
-    # 정규화된 가중치로 1회 샘플
-    pick = random.random() * total
-    acc = 0.0
-    for lo, hi, w in buckets:
-        acc += w
-        if pick < acc:
-            return round(random.uniform(lo, hi), 2)
-    # 이론상 도달 X, 안전망
-    lo, hi, _ = buckets[-1]
-    return round(random.uniform(lo, hi), 2)
+    rng = rng or random
+    i = rng.randrange(len(CRASH_BUCKETS))
+    if rng.random() >= CRASH_ALIAS_PROB[i]:
+        i = CRASH_ALIAS_IDX[i]
+    lo, hi, _ = CRASH_BUCKETS[i]
+    return round(rng.uniform(lo, hi), 2)
+
+
+def crash_multiplier_at(elapsed: float) -> float:
+    """라운드 시작 후 경과 시간(초) → 배율. 화면 갱신 주기와 무관한 결정적 함수."""
+    if elapsed <= 0:
+        return START_MULTIPLIER
+    return min(START_MULTIPLIER * GROWTH_PER_SEC ** elapsed, MAX_MULTIPLIER)
+
+
+def crash_elapsed_for(crash_at: float) -> float:
+    """배율이 crash_at(상한 MAX_MULTIPLIER)에 도달하는 경과 시간(초)."""
+    target = min(crash_at, MAX_MULTIPLIER)
+    if target <= START_MULTIPLIER:
+        return 0.0
+    return math.log(target / START_MULTIPLIER) / math.log(GROWTH_PER_SEC)
+
+
+def rps_draw(rng: random.Random) -> tuple[str, float]:
+    """가위바위보 봇 선택과 (승리 시) 배당을 항상 같은 순서로 추첨 — 시드 재현용"""
+    bot_choice = rng.choice(RPS_CHOICES)
+    multi = round(rng.uniform(*RPS_WIN_MULTI_RANGE), 2)
+    return bot_choice, multi
+
+
+# 배율 표시: 둘째 자리 0 제거, 최소 한 자리 유지 (예: 2 → 2.0)
+def fmt1(x: float) -> str:
+    s = f"{x:.2f}".rstrip("0").rstrip(".")
+    if "." not in s:
+        s += ".0"
+    return s
+
+
+# =================================================================
+# =                 게임 세션 (판 단위 상태, 모듈 공용)                =
+# =================================================================
+class GambleSession:
+    """
+    진행 중인 도박 1판의 공통 상태. 버튼 custom_id에 sid가 들어가 세션을 찾는다.
+    판의 모든 난수는 seed로 만든 세션 PRNG(rng)에서만 뽑으므로 seed로 결과를 재현할 수 있다.
+    """
+    __slots__ = ("sid", "seed", "rng", "user_id", "amount", "guild", "message", "view")
+    kind = ""
+
+    def __init__(self, user_id: int, amount: int, guild: discord.Guild | None, sid: str | None = None,
+                 seed: int | None = None):
+        self.sid = sid or uuid.uuid4().hex[:12]
+        self.rng = RNG.session(seed)
+        self.seed: int = self.rng.initial_seed
+        self.user_id = user_id
+        self.amount = amount
+        self.guild = guild
+        self.message: discord.Message | discord.PartialMessage | None = None
+        self.view: discord.ui.View | None = None
+
+    def custom_id(self, action: str) -> str:
+        return f"gamble:{self.kind}:{self.sid}:{action}"
+
+    def to_state(self) -> dict:
+        """에스크로 저널에 남길 진행 상태"""
+        msg = self.message
+        return {
+            "seed": format_seed(self.seed),
+            "channel_id": msg.channel.id if msg else 0,
+            "message_id": msg.id if msg else 0,
+        }
+
+
+class MinesSession(GambleSession):
+    """!도박1 버튼 도박 상태"""
+    __slots__ = ("bombs", "mult_values", "revealed", "sum_multiplier", "ended", "cashed")
+    kind = "mines"
+
+    def __init__(self, user_id: int, amount: int, guild: discord.Guild | None, sid: str | None = None,
+                 seed: int | None = None):
+        super().__init__(user_id, amount, guild, sid, seed)
+        self.bombs: set[int] = set(self.rng.sample(range(MINES_NCELLS), MINES_NUM_BOMBS))
+
+        pool = list(MULTIPLIER_POOL)
+        self.rng.shuffle(pool)
+        safe_cells = [i for i in range(MINES_NCELLS) if i not in self.bombs]
+        assert len(safe_cells) == len(pool), "보드/폭탄/배율 개수 불일치"
+
+        self.mult_values: dict[int, float] = dict(zip(safe_cells, pool))
+        self.revealed: set[int] = set()
+        self.sum_multiplier = 0.00  # 합연산 누적 배율(초기 0.0)
+        self.ended = False
+        self.cashed = False
+
+    @property
+    def done(self) -> bool:
+        return self.ended or self.cashed
+
+    def to_state(self) -> dict:
+        state = super().to_state()
+        state.update(
+            bombs=sorted(self.bombs),
+            mult_values={str(k): v for k, v in self.mult_values.items()},
+            revealed=sorted(self.revealed),
+            sum_multiplier=self.sum_multiplier,
+        )
+        return state
+
+    @classmethod
+    def from_state(cls, sid: str, user_id: int, amount: int, guild: discord.Guild | None,
+                   state: dict) -> "MinesSession":
+        """에스크로 저널의 상태로 진행 중이던 판을 복원"""
+        seed = parse_seed(state["seed"]) if state.get("seed") else None
+        session = cls(user_id, amount, guild, sid, seed)
+        session.bombs = set(state["bombs"])
+        session.mult_values = {int(k): float(v) for k, v in state["mult_values"].items()}
+        session.revealed = set(state["revealed"])
+        session.sum_multiplier = float(state["sum_multiplier"])
+        return session
+
+    def build_embed(self, title: str | None = None, crashed: bool = False) -> discord.Embed:
+        if title is None:
+            title = "🧨 버튼 도박"
+        expected = int(math.floor(self.amount * self.sum_multiplier))
+        desc = [
+            f"베팅: **{format_num(self.amount)} P**",
+            f"현재 합산 배율: **{fmt1(self.sum_multiplier)}x**",
+            f"예상 수령: **{format_num(expected)} P**"
+        ]
+        color = discord.Color.green() if not crashed else discord.Color.red()
+        return discord.Embed(title=title, description="\n".join(desc), color=color)
+
+
+class CrashSession(GambleSession):
+    """!도박2 그래프 도박 상태 (배율은 started 기준 경과 시간의 함수)"""
+    __slots__ = ("crash_at", "started", "crash_deadline", "cashed_out", "cashed_amount", "cashed_multi")
+    kind = "crash"
+
+    def __init__(self, user_id: int, amount: int, guild: discord.Guild | None, seed: int | None = None):
+        super().__init__(user_id, amount, guild, seed=seed)
+        self.crash_at = roll_crash_point(self.rng)
+        self.started: float | None = None
+        self.crash_deadline = math.inf
+        self.cashed_out = False
+        self.cashed_amount = 0
+        self.cashed_multi = 0.0
+
+    def start(self) -> None:
+        """라운드 시작 시각 기록 + 크래시 시각 사전 계산"""
+        self.started = time.monotonic()
+        self.crash_deadline = self.started + crash_elapsed_for(self.crash_at)
+
+    def multiplier_at(self, now: float) -> float:
+        if self.started is None:
+            return START_MULTIPLIER
+        return crash_multiplier_at(now - self.started)
+
+    def to_state(self) -> dict:
+        state = super().to_state()
+        state["crash_at"] = self.crash_at
+        return state
+
+
+class RPSSession(GambleSession):
+    """!도박3 가위바위보 상태"""
+    __slots__ = ("resolved",)
+    kind = "rps"
+
+    def __init__(self, user_id: int, amount: int, guild: discord.Guild | None, seed: int | None = None):
+        super().__init__(user_id, amount, guild, seed=seed)
+        self.resolved = False
+
+
+# =================================================================
+# =            공용 View / Button (custom_id → 세션 조회)            =
+# =================================================================
+class SessionButton(discord.ui.Button):
+    """custom_id(gamble:<kind>:<sid>:<action>)로 세션을 찾아 GambleCog에 위임하는 버튼"""
+
+    def __init__(self, session: GambleSession, action: str, **kwargs):
+        super().__init__(custom_id=session.custom_id(action), **kwargs)
+
+    @property
+    def action(self) -> str:
+        return self.custom_id.rsplit(":", 1)[1]
+
+    async def callback(self, interaction: discord.Interaction):
+        _, _, sid, action = self.custom_id.split(":", 3)
+        await self.view.cog.dispatch_session_action(interaction, sid, action, self)
+
+
+class GambleView(discord.ui.View):
+    def __init__(self, cog: "GambleCog", session: GambleSession, *, timeout: float | None):
+        super().__init__(timeout=timeout)
+        self.cog = cog
+        self.sid = session.sid
+
+    def disable_all(self) -> None:
+        for c in self.children:
+            c.disabled = True
+
+
+class MinesView(GambleView):
+    def __init__(self, cog: "GambleCog", session: MinesSession):
+        super().__init__(cog, session, timeout=None)  # 시간 제한은 GambleCog._arm_timeout
+        for i in range(MINES_NCELLS):
+            if i in session.revealed:  # 복원된 판: 이미 연 칸 표시
+                self.add_item(SessionButton(session, str(i), label=f"x{fmt1(session.mult_values[i])}",
+                                            style=discord.ButtonStyle.success, row=i // MINES_COLS,
+                                            disabled=True))
+                continue
+            self.add_item(SessionButton(session, str(i), label="?",
+                                        style=discord.ButtonStyle.secondary, row=i // MINES_COLS))
+        self.add_item(SessionButton(session, "cash", label="💸 수령",
+                                    style=discord.ButtonStyle.success, row=MINES_ROWS))
+
+    def reveal_all(self, session: MinesSession) -> None:
+        """결과 시 전칸 공개"""
+        for item in self.children:
+            if isinstance(item, SessionButton) and item.action.isdigit():
+                idx = int(item.action)
+                if idx in session.bombs:
+                    item.style = discord.ButtonStyle.danger
+                    item.emoji = "💣"
+                    item.label = ""
+                else:
+                    item.style = (
+                        discord.ButtonStyle.success if idx in session.revealed else discord.ButtonStyle.secondary
+                    )
+                    item.emoji = None
+                    item.label = f"x{fmt1(session.mult_values[idx])}"
+            item.disabled = True
+
+
+class CrashView(GambleView):
+    def __init__(self, cog: "GambleCog", session: CrashSession):
+        super().__init__(cog, session, timeout=None)
+        self.add_item(SessionButton(session, "cash", label="💸 지금 받기", style=discord.ButtonStyle.success))
+
+
+class RPSView(GambleView):
+    def __init__(self, cog: "GambleCog", session: RPSSession):
+        super().__init__(cog, session, timeout=None)
+        for choice in RPS_CHOICES:
+            self.add_item(SessionButton(session, choice, label=choice,
+                                        style=discord.ButtonStyle.primary, emoji=RPS_EMOJIS[choice]))
+
+
+# 에스크로 종류별 표시 이름 (재시작 복구 요약용)
+ESCROW_KIND_LABELS = {
+    "mines": "버튼 도박",
+    "crash": "그래프 도박",
+    "rps": "가위바위보",
+    "match_bet": "내전 배팅",
+}
 
 
 class GambleCog(commands.Cog):
@@ -93,9 +389,140 @@ class GambleCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.active_mines_users: set[int] = set()   # 버튼 도박 동시 진행 방지
-        self.active_crash_users: set[int] = set()   # 그래프 도박 동시 진행 방지
-        self.active_rps_users: set[int] = set()     # RPS 도박 동시 진행 방지
+        self.sessions: dict[str, GambleSession] = {}              # sid → 진행 중 세션
+        self.user_sessions: dict[tuple[str, int], str] = {}       # (게임 종류, 유저) → sid, 동시 진행 방지
+        self._escrow_recovered = False
+
+    async def cog_unload(self):
+        timers.cancel_prefix("gamble:")
+
+    # ───────────────── 세션 관리 ─────────────────
+    def _open_session(self, session: GambleSession, *, journal: bool = True) -> None:
+        self.sessions[session.sid] = session
+        self.user_sessions[(session.kind, session.user_id)] = session.sid
+        if journal:
+            open_escrow(session.sid, kind=session.kind, user_id=session.user_id, amount=session.amount,
+                        guild_id=session.guild.id if session.guild else 0, state=session.to_state())
+
+    def _journal_session(self, session: GambleSession) -> None:
+        """진행 상태(메시지 위치, 보드 등)를 에스크로 저널에 반영"""
+        update_escrow(session.sid, session.to_state())
+
+    def _settle(self, session: GambleSession, payout: int, *, record: bool = True) -> None:
+        """판 결과 확정: 지급과 에스크로 종료를 붙여 처리 (재시작 시 이중 지급 방지) + 통계 누적"""
+        if payout:
+            add_points(session.user_id, payout)
+        close_escrow(session.sid)
+        if record:
+            gamble_stats.record(session.user_id, session.kind, session.amount, payout)
+
+    def _arm_timeout(self, session: GambleSession, seconds: float, callback) -> None:
+        """세션 시간 제한 예약. 같은 세션에 다시 호출하면 제한 시간이 연장된다."""
+        timers.schedule(f"gamble:{session.sid}:timeout", seconds, callback, session.view)
+
+    def _close_session(self, session: GambleSession) -> None:
+        """메모리 상태만 정리. 정산(_settle) 없이 끝난 판의 에스크로는 남겨 재시작 시 환불."""
+        timers.cancel(f"gamble:{session.sid}:timeout")
+        self.sessions.pop(session.sid, None)
+        if self.user_sessions.get((session.kind, session.user_id)) == session.sid:
+            del self.user_sessions[(session.kind, session.user_id)]
+        if session.view is not None:
+            session.view.stop()
+
+    def _has_session(self, kind: str, user_id: int) -> bool:
+        return (kind, user_id) in self.user_sessions
+
+    def active_sessions(self, kind: str | None = None) -> list[GambleSession]:
+        """진행 중 세션 목록 (지표/종료 처리용)"""
+        return [s for s in self.sessions.values() if kind is None or s.kind == kind]
+
+    async def dispatch_session_action(self, interaction: discord.Interaction, sid: str, action: str,
+                                      button: SessionButton):
+        session = self.sessions.get(sid)
+        if session is None:
+            await interaction.response.send_message("이미 종료된 게임입니다.", ephemeral=True)
+            return
+        if isinstance(session, MinesSession):
+            await self.mines_action(interaction, session, action, button)
+        elif isinstance(session, CrashSession):
+            await self.crash_cashout(interaction, session)
+        elif isinstance(session, RPSSession):
+            await self.rps_choose(interaction, session, action)
+
+    # ───────────────── 재시작 복구 (에스크로) ─────────────────
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if self._escrow_recovered:
+            return
+        self._escrow_recovered = True
+        await self.recover_escrows()
+
+    async def recover_escrows(self):
+        """
+        재시작 전에 차감만 되고 정산되지 않은 판돈 처리.
+        - 버튼 도박: 같은 메시지에 같은 custom_id의 View를 다시 붙여 이어서 진행
+        - 내전 배팅: 복원된 내전에 남아 있으면 그대로 두고, 아니면 환불
+        - 그 외(그래프/가위바위보 등): 판돈 전액 환불
+        길드별 요약은 도박 로그 채널로 전송.
+        """
+        summary: dict[int, list[str]] = {}
+        match_cog = self.bot.get_cog("MatchCog")
+        for eid, rec in load_escrows().items():
+            user_id, amount = int(rec["user_id"]), int(rec["amount"])
+            kind = rec.get("kind", "")
+            # 복원된 내전이 아직 들고 있는 배팅은 그 내전의 결과 정산에 맡김
+            if kind == "match_bet" and match_cog is not None and match_cog.holds_bet_escrow(eid):
+                continue
+            label = ESCROW_KIND_LABELS.get(kind, kind)
+            if kind == "match_bet" and rec.get("state", {}).get("game_id"):
+                label += f" (내전 #{rec['state']['game_id']})"
+
+            if kind == "mines" and await self._resume_mines(eid, rec):
+                outcome = "재개"
+            else:
+                add_points(user_id, amount)
+                close_escrow(eid)
+                outcome = "환불"
+            summary.setdefault(int(rec.get("guild_id", 0)), []).append(
+                f"<@{user_id}> {label} **{format_num(amount)} P** → {outcome}"
+            )
+
+        for guild_id, lines in summary.items():
+            shown = lines[:30]
+            if len(lines) > len(shown):
+                shown.append(f"… 외 {len(lines) - len(shown)}건")
+            await self._send_gamble_log(
+                self.bot.get_guild(guild_id),
+                title="♻️ 재시작 복구 - 진행 중이던 판돈",
+                description="\n".join(shown),
+                color=discord.Color.teal().value
+            )
+
+    async def _resume_mines(self, sid: str, rec: dict) -> bool:
+        """버튼 도박 판 복원. 메시지를 찾지 못하면 False(→ 환불)."""
+        state = rec.get("state", {})
+        guild = self.bot.get_guild(int(rec.get("guild_id", 0)))
+        channel = guild.get_channel(int(state.get("channel_id", 0))) if guild else None
+        if not isinstance(channel, discord.TextChannel) or not state.get("message_id"):
+            return False
+        try:
+            session = MinesSession.from_state(sid, int(rec["user_id"]), int(rec["amount"]), guild, state)
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        view = MinesView(self, session)
+        message = channel.get_partial_message(int(state["message_id"]))
+        try:
+            # 같은 메시지를 새 View로 편집하면 같은 custom_id로 다시 상호작용을 받는다
+            await message.edit(embed=session.build_embed(title="🧨 버튼 도박 (재시작 후 복구)"), view=view)
+        except discord.HTTPException:
+            return False
+
+        session.view = view
+        session.message = message
+        self._open_session(session, journal=False)
+        self._arm_timeout(session, MINES_TIMEOUT, self.mines_timeout)
+        return True
 
     # ───────────────── 공지/채널 유틸 ─────────────────
     def _get_log_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
@@ -109,7 +536,8 @@ class GambleCog(commands.Cog):
                 return c
         return None
 
-    async def _send_gamble_log(self, guild: discord.Guild | None, *, title: str, description: str, color: int):
+    async def _send_gamble_log(self, guild: discord.Guild | None, *, title: str, description: str, color: int,
+                               session: GambleSession | None = None):
         if guild is None:
             return
         ch = self._get_log_channel(guild)
@@ -117,6 +545,8 @@ class GambleCog(commands.Cog):
             return
         try:
             embed = discord.Embed(title=title, description=description, color=color)
+            if session is not None:  # 분쟁 시 !도박재현 으로 같은 판을 재현
+                embed.set_footer(text=f"seed {format_seed(session.seed)} · {session.kind}")
             await ch.send(embed=embed)
         except Exception:
             pass
@@ -130,6 +560,7 @@ class GambleCog(commands.Cog):
     def _allowed_mention(self) -> str:
         return f"<#{GAMBLE_CHANNEL_ID}>" if GAMBLE_CHANNEL_ID else "도박장(관리자 설정 필요)"
         
+
     # =================================================================
     # = !도박1 버튼 도박 (4x4, 폭탄6, 배율10 고정 분배, 결과 시 전칸 공개) =
     # = 곱연산 → 합연산 (수령액 = 베팅 * 합산배율)                         =
@@ -155,219 +586,134 @@ class GambleCog(commands.Cog):
         if amount < MIN_BET:
             await ctx.reply(f"최소 베팅 금액은 {format_num(MIN_BET)} P 입니다.", delete_after=5)
             return
-        if ctx.author.id in self.active_mines_users:
+        if self._has_session("mines", ctx.author.id):
             await ctx.reply("이미 진행 중인 버튼 도박이 있어요. 잠시만요!", delete_after=5)
             return
         if not spend_points(ctx.author.id, amount):
             await ctx.reply("포인트가 부족합니다.", delete_after=5)
             return
 
-        self.active_mines_users.add(ctx.author.id)
-
-        # ----- 보드 구성: 4x4 / 폭탄 6 / 배율 10 -----
-        ROWS, COLS = 4, 4
-        NCELLS = ROWS * COLS
-        NUM_BOMBS = 6
+        session = MinesSession(ctx.author.id, amount, ctx.guild)
+        self._open_session(session)
+
+        view = MinesView(self, session)
+        session.view = view
+        session.message = await ctx.send(embed=session.build_embed(), view=view)
+        self._journal_session(session)
+        self._arm_timeout(session, MINES_TIMEOUT, self.mines_timeout)
+
+    async def mines_action(self, interaction: discord.Interaction, session: MinesSession, action: str,
+                           button: SessionButton):
+        view: MinesView = button.view
+        if interaction.user.id != session.user_id:
+            verb = "수령할" if action == "cash" else "누를"
+            await interaction.response.send_message(f"이 게임은 호출자만 {verb} 수 있어요.", ephemeral=True)
+            return
+        if session.done:
+            await interaction.response.send_message("이미 종료된 게임입니다.", ephemeral=True)
+            return
+        self._arm_timeout(session, MINES_TIMEOUT, self.mines_timeout)  # 누를 때마다 제한 시간 연장
 
-        bomb_positions = set(random.sample(range(NCELLS), NUM_BOMBS))
+        amount = session.amount
 
-        MULTIPLIER_POOL = [0.5, 0.5, 0.6, 0.6, 0.7, 0.8, 0.9, 1.0, 1.5, 2.0]
-        random.shuffle(MULTIPLIER_POOL)
-        safe_cells = [i for i in range(NCELLS) if i not in bomb_positions]
-        assert len(safe_cells) == len(MULTIPLIER_POOL), "보드/폭탄/배율 개수 불일치"
+        if action == "cash":
+            session.cashed = True
+            payout = int(math.floor(amount * session.sum_multiplier))  # 합연산 결과로 지급
+            self._settle(session, payout)
 
-        mult_values: dict[int, float] = {
-            idx: MULTIPLIER_POOL[pos] for idx, pos in zip(safe_cells, range(len(MULTIPLIER_POOL)))
-        }
+            view.reveal_all(session)
 
-        revealed: set[int] = set()
-        ended = False
-        cashed = False
-        sum_multiplier = 0.00  # 합연산 누적 배율(초기 0.0)
-
-        # 배율 표시: 둘째 자리 0 제거, 최소 한 자리 유지 (예: 2 → 2.0)
-        def fmt1(x: float) -> str:
-            s = f"{x:.2f}".rstrip("0").rstrip(".")
-            if "." not in s:
-                s += ".0"
-            return s
-
-        def build_embed(title: str | None = None, crashed: bool = False):
-            if title is None:
-                title = "🧨 버튼 도박"
-            expected = int(math.floor(amount * sum_multiplier))
-            desc = [
-                f"베팅: **{format_num(amount)} P**",
-                f"현재 합산 배율: **{fmt1(sum_multiplier)}x**",
-                f"예상 수령: **{format_num(expected)} P**"
-            ]
-            color = discord.Color.green() if not crashed else discord.Color.red()
-            return discord.Embed(title=title, description="\n".join(desc), color=color)
-
-        view_message: discord.Message | None = None
-        outer_self = self
-
-        # ----- 결과 시 전칸 공개 헬퍼 -----
-        def reveal_all_buttons(view: discord.ui.View):
-            for item in view.children:
-                if isinstance(item, discord.ui.Button) and hasattr(item, "idx"):
-                    idx = getattr(item, "idx")
-                    if idx in bomb_positions:
-                        item.style = discord.ButtonStyle.danger
-                        item.emoji = "💣"
-                        item.label = ""
-                    else:
-                        m = mult_values[idx]
-                        item.style = (
-                            discord.ButtonStyle.success if idx in revealed else discord.ButtonStyle.secondary
-                        )
-                        item.emoji = None
-                        item.label = f"x{fmt1(m)}"
-                    item.disabled = True
-                else:
-                    if isinstance(item, discord.ui.Button):
-                        item.disabled = True
-
-        class CellButton(discord.ui.Button):
-            def __init__(self, idx: int, *, row: int):
-                super().__init__(label="?", style=discord.ButtonStyle.secondary, row=row)
-                self.idx = idx
-
-            async def callback(self, interaction: discord.Interaction):
-                nonlocal ended, cashed, sum_multiplier
-                if interaction.user.id != ctx.author.id:
-                    await interaction.response.send_message("이 게임은 호출자만 누를 수 있어요.", ephemeral=True)
-                    return
-                if ended or cashed:
-                    await interaction.response.send_message("이미 종료된 게임입니다.", ephemeral=True)
-                    return
-                if self.idx in revealed:
-                    await interaction.response.send_message("이미 열린 칸입니다.", ephemeral=True)
-                    return
-
-                revealed.add(self.idx)
-
-                if self.idx in bomb_positions:
-                    # 폭탄 → 종료 + 전칸 공개 + 로그
-                    ended = True
-                    self.style = discord.ButtonStyle.danger
-                    self.emoji = "💣"
-                    self.label = ""
-                    self.disabled = True
-
-                    reveal_all_buttons(view)
-                    end_embed = discord.Embed(
-                        title="💥 폭탄 발동! 게임 종료",
-                        description=(f"😵 {interaction.user.mention} 님이 폭탄을 열었습니다!\n"
-                                    f"베팅 **{format_num(amount)} P** 를 잃었습니다.\n"
-                                    f"진행 중 합산 배율: **{fmt1(sum_multiplier)}x**"),
-                        color=discord.Color.red(),
-                    )
-                    await interaction.response.edit_message(embed=end_embed, view=view)
-
-                    await outer_self._send_gamble_log(
-                        interaction.guild,
-                        title="🎰 도박 로그 - 버튼(폭탄)",
-                        description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
-                                    f"→ **-{format_num(amount)} P** 손실 (합산 **{fmt1(sum_multiplier)}x**)"),
-                        color=discord.Color.red().value
-                    )
-                    view.stop()
-                    return
-
-                # 안전 칸 → '합연산' 반영
-                m = mult_values[self.idx]
-                sum_multiplier = round(sum_multiplier + m, 4)
-                self.style = discord.ButtonStyle.success
-                self.label = f"x{fmt1(m)}"
-                self.disabled = True
-                await interaction.response.edit_message(embed=build_embed(), view=view)
-
-        class CashOutButton(discord.ui.Button):
-            def __init__(self):
-                super().__init__(label="💸 수령", style=discord.ButtonStyle.success, row=ROWS)
-
-            async def callback(self, interaction: discord.Interaction):
-                nonlocal ended, cashed, sum_multiplier
-                if interaction.user.id != ctx.author.id:
-                    await interaction.response.send_message("이 게임은 호출자만 수령할 수 있어요.", ephemeral=True)
-                    return
-                if ended or cashed:
-                    await interaction.response.send_message("이미 종료된 게임입니다.", ephemeral=True)
-                    return
-
-                cashed = True
-                payout = int(math.floor(amount * sum_multiplier))  # 합연산 결과로 지급
-                add_points(ctx.author.id, payout)
-
-                reveal_all_buttons(view)
-
-                done = discord.Embed(
-                    title="🏁 수령 완료",
-                    description=(f"합산 배율 **{fmt1(sum_multiplier)}x** → **{format_num(payout)} P** 지급!\n"
-                                f"현재 보유: **{format_num(get_points(ctx.author.id))} P**"),
-                    color=discord.Color.blurple(),
-                )
-                try:
-                    await interaction.response.edit_message(embed=done, view=view)
-                finally:
-                    net = payout - amount
-                    sign = "+" if net >= 0 else "-"
-                    await outer_self._send_gamble_log(
-                        interaction.guild,
-                        title="🎰 도박 로그 - 버튼(수령)",
-                        description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
-                                    f"→ 수령 **{format_num(payout)} P** (**{sign}{format_num(abs(net))} P**) "
-                                    f"(합산 **{fmt1(sum_multiplier)}x**)"),
-                        color=discord.Color.gold().value
-                    )
-                    view.stop()
-
-        class MinesView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=120)  # 2분 제한
-                for i in range(NCELLS):
-                    row = i // COLS
-                    self.add_item(CellButton(i, row=row))
-                self.add_item(CashOutButton())
-
-            async def on_timeout(self):
-                nonlocal ended, cashed, sum_multiplier
-                if ended or cashed:
-                    self.stop()
-                    return
-                ended = True
-                reveal_all_buttons(self)
-                to = discord.Embed(
-                    title="⏱️ 시간 초과로 종료",
-                    description=(f"선택 시간이 초과되어 베팅 {format_num(amount)} P 를 잃었습니다.\n"
-                                f"진행 중 합산 배율: **{fmt1(sum_multiplier)}x**"),
-                    color=discord.Color.dark_grey(),
+            done = discord.Embed(
+                title="🏁 수령 완료",
+                description=(f"합산 배율 **{fmt1(session.sum_multiplier)}x** → **{format_num(payout)} P** 지급!\n"
+                             f"현재 보유: **{format_num(get_points(session.user_id))} P**"),
+                color=discord.Color.blurple(),
+            )
+            try:
+                await interaction.response.edit_message(embed=done, view=view)
+            finally:
+                net = payout - amount
+                sign = "+" if net >= 0 else "-"
+                await self._send_gamble_log(
+                    interaction.guild,
+                    title="🎰 도박 로그 - 버튼(수령)",
+                    description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
+                                 f"→ 수령 **{format_num(payout)} P** (**{sign}{format_num(abs(net))} P**) "
+                                 f"(합산 **{fmt1(session.sum_multiplier)}x**)"),
+                    color=discord.Color.gold().value,
+                    session=session
                 )
-                try:
-                    if view_message:
-                        await view_message.edit(embed=to, view=self)
-                finally:
-                    await outer_self._send_gamble_log(
-                        view_message.guild if view_message else None,
-                        title="🎰 도박 로그 - 버튼(시간초과)",
-                        description=(f"{ctx.author.mention} 베팅 **{format_num(amount)} P** "
-                                    f"→ **-{format_num(amount)} P** 손실 (합산 **{fmt1(sum_multiplier)}x**)"),
-                        color=discord.Color.dark_grey().value
-                    )
-                    self.stop()
+                self._close_session(session)
+            return
 
-        view = MinesView()
-        msg = await ctx.send(embed=build_embed(), view=view)
-        view_message = msg
+        idx = int(action)
+        if idx in session.revealed:
+            await interaction.response.send_message("이미 열린 칸입니다.", ephemeral=True)
+            return
 
-        async def cleanup():
+        session.revealed.add(idx)
+
+        if idx in session.bombs:
+            # 폭탄 → 종료 + 전칸 공개 + 로그
+            session.ended = True
+            self._settle(session, 0)
+            view.reveal_all(session)
+            end_embed = discord.Embed(
+                title="💥 폭탄 발동! 게임 종료",
+                description=(f"😵 {interaction.user.mention} 님이 폭탄을 열었습니다!\n"
+                             f"베팅 **{format_num(amount)} P** 를 잃었습니다.\n"
+                             f"진행 중 합산 배율: **{fmt1(session.sum_multiplier)}x**"),
+                color=discord.Color.red(),
+            )
             try:
-                await view.wait()
+                await interaction.response.edit_message(embed=end_embed, view=view)
             finally:
-                self.active_mines_users.discard(ctx.author.id)
+                await self._send_gamble_log(
+                    interaction.guild,
+                    title="🎰 도박 로그 - 버튼(폭탄)",
+                    description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
+                                 f"→ **-{format_num(amount)} P** 손실 (합산 **{fmt1(session.sum_multiplier)}x**)"),
+                    color=discord.Color.red().value,
+                    session=session
+                )
+                self._close_session(session)
+            return
 
-        self.bot.loop.create_task(cleanup())
+        # 안전 칸 → '합연산' 반영
+        m = session.mult_values[idx]
+        session.sum_multiplier = round(session.sum_multiplier + m, 4)
+        self._journal_session(session)
+        button.style = discord.ButtonStyle.success
+        button.label = f"x{fmt1(m)}"
+        button.disabled = True
+        await interaction.response.edit_message(embed=session.build_embed(), view=view)
+
+    async def mines_timeout(self, view: MinesView):
+        session = self.sessions.get(view.sid)
+        if not isinstance(session, MinesSession) or session.done:
+            return
+        session.ended = True
+        self._settle(session, 0)
+        view.reveal_all(session)
+        to = discord.Embed(
+            title="⏱️ 시간 초과로 종료",
+            description=(f"선택 시간이 초과되어 베팅 {format_num(session.amount)} P 를 잃었습니다.\n"
+                         f"진행 중 합산 배율: **{fmt1(session.sum_multiplier)}x**"),
+            color=discord.Color.dark_grey(),
+        )
+        try:
+            if session.message:
+                await session.message.edit(embed=to, view=view)
+        finally:
+            await self._send_gamble_log(
+                session.guild,
+                title="🎰 도박 로그 - 버튼(시간초과)",
+                description=(f"<@{session.user_id}> 베팅 **{format_num(session.amount)} P** "
+                             f"→ **-{format_num(session.amount)} P** 손실 (합산 **{fmt1(session.sum_multiplier)}x**)"),
+                color=discord.Color.dark_grey().value,
+                session=session
+            )
+            self._close_session(session)
 
     # =================================================================
     # =                          !도박2  그래프                        =
@@ -382,80 +728,49 @@ class GambleCog(commands.Cog):
         if amount < MIN_BET:
             await ctx.reply(f"최소 베팅 금액은 {format_num(MIN_BET)} P 입니다.", delete_after=5)
             return
-        if ctx.author.id in self.active_crash_users:
+        if self._has_session("crash", ctx.author.id):
             await ctx.reply("이미 진행 중인 그래프 도박이 있어요. 잠시만요!", delete_after=5)
             return
         if not spend_points(ctx.author.id, amount):
             await ctx.reply("포인트가 부족합니다.", delete_after=5)
             return
 
-        self.active_crash_users.add(ctx.author.id)
-        outer_self = self
-
-        crash_at = roll_crash_point()
-        multiplier = 0.50
-        cashed_out = False
-        cashed_amount = 0
+        # 배율은 라운드 시작 시각 기준 경과 시간의 함수, 크래시 시각은 미리 계산
+        session = CrashSession(ctx.author.id, amount, ctx.guild)
+        self._open_session(session)
 
         # ── 썸네일 파일 준비 (첫 메시지에만 첨부) ──
-        thumb_file: discord.File | None = None
-        if GRAPH_IMG_PATH.is_file():
-            thumb_file = discord.File(GRAPH_IMG_PATH, filename=GRAPH_IMG_NAME)
-
-        class CashOutView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=None)
-
-            @discord.ui.button(label="💸 지금 받기", style=discord.ButtonStyle.success)
-            async def cashout(self, interaction: discord.Interaction, button: discord.ui.Button):
-                nonlocal cashed_out, cashed_amount, multiplier
-                if interaction.user.id != ctx.author.id:
-                    await interaction.response.send_message("이 게임은 호출자만 수령할 수 있어요.", ephemeral=True)
-                    return
-                if cashed_out:
-                    await interaction.response.send_message("이미 수령하셨습니다.", ephemeral=True)
-                    return
-                cash_multi = round(multiplier, 2)
-                gain = int(math.floor(amount * cash_multi))
-                add_points(ctx.author.id, gain)
-                cashed_out = True
-                cashed_amount = gain
-                for c in self.children:
-                    c.disabled = True
-                await interaction.response.send_message(
-                    f"✅ {interaction.user.mention} {cash_multi}x 에서 **{format_num(gain)} P** 수령!",
-                    ephemeral=True
-                )
-                net = gain - amount
-                sign = "+" if net >= 0 else "-"
-                await outer_self._send_gamble_log(
-                    interaction.guild,
-                    title="🎰 도박 로그 - 그래프(수령)",
-                    description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
-                                 f"→ 수령 **{format_num(gain)} P** (**{sign}{format_num(abs(net))} P**) "
-                                 f"최종 **{cash_multi}x**"),
-                    color=discord.Color.gold().value
-                )
+        thumb_file = assets.file(GRAPH_IMG_NAME)
 
-        view = CashOutView()
+        view = CrashView(self, session)
+        session.view = view
         embed = discord.Embed(
             title="🎲 그래프 도박 (Crash)",
             description=(f"베팅: **{format_num(amount)} P**\n"
                          f"버튼을 눌러 **크래시 전에** 수령하세요!\n"
-                         f"현재 배율: **{multiplier:.2f}x**"),
+                         f"현재 배율: **{START_MULTIPLIER:.2f}x**"),
             color=discord.Color.blurple()
         )
         if thumb_file:  # 메시지에 첨부될 파일을 가리키는 썸네일
             embed.set_thumbnail(url=f"attachment://{GRAPH_IMG_NAME}")
 
-        # 첫 전송: 파일을 함께 첨부
-        msg = await ctx.send(embed=embed, view=view, file=thumb_file)
-
         try:
-            while multiplier < crash_at and multiplier < MAX_MULTIPLIER and not cashed_out:
-                await asyncio.sleep(TICK_SEC)
-                multiplier *= GROWTH_PER_TICK
-                multiplier = min(multiplier, MAX_MULTIPLIER)
+            # 첫 전송: 파일을 함께 첨부
+            msg = await ctx.send(embed=embed, view=view, file=thumb_file)
+            session.message = msg
+            session.start()
+            self._journal_session(session)
+
+            # 화면 갱신은 표시용일 뿐, 지연되어도 배율/크래시 시각은 변하지 않음
+            while not session.cashed_out:
+                now = time.monotonic()
+                if now >= session.crash_deadline:
+                    break
+                await asyncio.sleep(min(TICK_SEC, session.crash_deadline - now))
+                now = time.monotonic()
+                if session.cashed_out or now >= session.crash_deadline:
+                    break
+                multiplier = session.multiplier_at(now)
                 embed = discord.Embed(
                     title="🎲 그래프 도박 (Crash)",
                     description=(f"베팅: **{format_num(amount)} P**\n"
@@ -468,15 +783,14 @@ class GambleCog(commands.Cog):
                     embed.set_thumbnail(url=f"attachment://{GRAPH_IMG_NAME}")
                 await msg.edit(embed=embed, view=view)
 
-            for c in view.children:
-                c.disabled = True
+            view.disable_all()
 
-            if cashed_out:
+            if session.cashed_out:
                 after = get_points(ctx.author.id)
                 end = discord.Embed(
                     title="🏁 결과",
-                    description=(f"수령 성공! **{format_num(cashed_amount)} P** 획득\n"
-                                 f"최종 배율: **{min(multiplier, crash_at):.2f}x**\n"
+                    description=(f"수령 성공! **{format_num(session.cashed_amount)} P** 획득\n"
+                                 f"최종 배율: **{session.cashed_multi:.2f}x**\n"
                                  f"현재 보유: **{format_num(after)} P**"),
                     color=discord.Color.green()
                 )
@@ -484,24 +798,63 @@ class GambleCog(commands.Cog):
                     end.set_thumbnail(url=f"attachment://{GRAPH_IMG_NAME}")
                 await msg.edit(embed=end, view=view)
             else:
+                self._settle(session, 0)
                 end = discord.Embed(
                     title="💥 CRASHED!",
-                    description=(f"크래시 지점: **{crash_at:.2f}x**\n"
+                    description=(f"크래시 지점: **{min(session.crash_at, MAX_MULTIPLIER):.2f}x**\n"
                                  f"아쉽지만 베팅 {format_num(amount)} P 를 잃었습니다…"),
                     color=discord.Color.red()
                 )
                 if thumb_file:
                     end.set_thumbnail(url=f"attachment://{GRAPH_IMG_NAME}")
                 await msg.edit(embed=end, view=view)
-                await outer_self._send_gamble_log(
+                await self._send_gamble_log(
                     ctx.guild,
                     title="🎰 도박 로그 - 그래프(폭파)",
                     description=(f"{ctx.author.mention} 베팅 **{format_num(amount)} P** → **-{format_num(amount)} P** 손실 "
-                                 f"(지점 **{crash_at:.2f}x**)"),
-                    color=discord.Color.red().value
+                                 f"(지점 **{session.crash_at:.2f}x**)"),
+                    color=discord.Color.red().value,
+                    session=session
                 )
         finally:
-            self.active_crash_users.discard(ctx.author.id)
+            self._close_session(session)
+
+    async def crash_cashout(self, interaction: discord.Interaction, session: CrashSession):
+        received = time.monotonic()  # 수령 배율은 상호작용 수신 시각 기준
+        if interaction.user.id != session.user_id:
+            await interaction.response.send_message("이 게임은 호출자만 수령할 수 있어요.", ephemeral=True)
+            return
+        if session.cashed_out:
+            await interaction.response.send_message("이미 수령하셨습니다.", ephemeral=True)
+            return
+        if received >= session.crash_deadline:
+            await interaction.response.send_message("이미 크래시되었습니다.", ephemeral=True)
+            return
+
+        amount = session.amount
+        cash_multi = round(session.multiplier_at(received), 2)
+        gain = int(math.floor(amount * cash_multi))
+        self._settle(session, gain)
+        session.cashed_out = True
+        session.cashed_amount = gain
+        session.cashed_multi = cash_multi
+        if session.view is not None:
+            session.view.disable_all()
+        await interaction.response.send_message(
+            f"✅ {interaction.user.mention} {cash_multi}x 에서 **{format_num(gain)} P** 수령!",
+            ephemeral=True
+        )
+        net = gain - amount
+        sign = "+" if net >= 0 else "-"
+        await self._send_gamble_log(
+            interaction.guild,
+            title="🎰 도박 로그 - 그래프(수령)",
+            description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
+                         f"→ 수령 **{format_num(gain)} P** (**{sign}{format_num(abs(net))} P**) "
+                         f"최종 **{cash_multi}x**"),
+            color=discord.Color.gold().value,
+            session=session
+        )
 
     # =================================================================
     # =                      !도박3  가위바위보                         =
@@ -516,142 +869,206 @@ class GambleCog(commands.Cog):
         if amount < MIN_BET:
             await ctx.reply(f"최소 베팅 금액은 {format_num(MIN_BET)} P 입니다.", delete_after=5)
             return
-        if ctx.author.id in self.active_rps_users:
+        if self._has_session("rps", ctx.author.id):
             await ctx.reply("이미 진행 중인 RPS 도박이 있어요. 잠시만요!", delete_after=5)
             return
         if not spend_points(ctx.author.id, amount):
             await ctx.reply("포인트가 부족합니다.", delete_after=5)
             return
 
-        self.active_rps_users.add(ctx.author.id)
-
-        user_resolved = False
-        choices = ["가위", "바위", "보"]
-        emojis = {"가위": "✌️", "바위": "✊", "보": "✋"}
-        outer_self = self
+        session = RPSSession(ctx.author.id, amount, ctx.guild)
+        self._open_session(session)
 
         desc = (f"베팅: **{format_num(amount)} P**\n"
                 f"아래 버튼에서 선택하세요! (승: **1.10x~2.00x 랜덤**, 비김: **멘징**, 패배: **소실**)\n"
-                f"시간 제한: 15초")
+                f"시간 제한: {RPS_TIMEOUT}초")
         embed = discord.Embed(title="🎮 가위바위보 도박", description=desc, color=discord.Color.green())
 
-        class RPSView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=15)
-                self.message: discord.Message | None = None
-
-            async def on_timeout(self):
-                nonlocal user_resolved
-                if user_resolved:
-                    return
-                add_points(ctx.author.id, amount)  # 본전 환불
-                for c in self.children:
-                    c.disabled = True
-                try:
-                    if self.message:
-                        to = discord.Embed(
-                            title="⌛ 시간 초과",
-                            description=f"선택 시간이 초과되어 **{format_num(amount)} P** 가 반환되었습니다.",
-                            color=discord.Color.orange()
-                        )
-                        await self.message.edit(embed=to, view=self)
-                except Exception:
-                    pass
-
-            async def _handle_choice(self, interaction: discord.Interaction, user_choice: str):
-                nonlocal user_resolved
-                if interaction.user.id != ctx.author.id:
-                    await interaction.response.send_message("이 게임은 호출자만 선택할 수 있어요.", ephemeral=True)
-                    return
-                if user_resolved:
-                    await interaction.response.send_message("이미 결과가 결정되었습니다.", ephemeral=True)
-                    return
-
-                bot_choice = random.choice(choices)
-                wins = {"가위": "보", "바위": "가위", "보": "바위"}
-
-                if bot_choice == user_choice:
-                    add_points(ctx.author.id, amount)
-                    result_title = "🤝 비겼습니다 (멘징)"
-                    result_desc = (f"당신: {emojis[user_choice]} **{user_choice}** vs "
-                                   f"봇: {emojis[bot_choice]} **{bot_choice}**\n"
-                                   f"본전 **{format_num(amount)} P** 반환되었습니다.")
-                    color = discord.Color.greyple()
-                    await outer_self._send_gamble_log(
-                        interaction.guild,
-                        title="🎰 도박 로그 - 가위바위보(비김)",
-                        description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** → 손익 **±0 P**"),
-                        color=discord.Color.greyple().value
-                    )
-
-                elif wins[user_choice] == bot_choice:
-                    multi = round(random.uniform(1.10, 2.00), 2)
-                    payout = int(math.floor(amount * multi))
-                    add_points(ctx.author.id, payout)
-                    result_title = "🏆 승리!"
-                    result_desc = (f"당신: {emojis[user_choice]} **{user_choice}** vs "
-                                   f"봇: {emojis[bot_choice]} **{bot_choice}**\n"
-                                   f"배당 **{multi}x** → **{format_num(payout)} P** 지급!")
-                    color = discord.Color.gold()
-                    net = payout - amount
-                    sign = "+" if net >= 0 else "-"
-                    await outer_self._send_gamble_log(
-                        interaction.guild,
-                        title="🎰 도박 로그 - 가위바위보(승리)",
-                        description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
-                                     f"→ 수령 **{format_num(payout)} P** (**{sign}{format_num(abs(net))} P**), "
-                                     f"배율 **{multi}x**"),
-                        color=discord.Color.gold().value
-                    )
+        view = RPSView(self, session)
+        session.view = view
+        session.message = await ctx.send(embed=embed, view=view)
+        self._journal_session(session)
+        self._arm_timeout(session, RPS_TIMEOUT, self.rps_timeout)
 
-                else:
-                    result_title = "💣 패배…"
-                    result_desc = (f"당신: {emojis[user_choice]} **{user_choice}** vs "
-                                   f"봇: {emojis[bot_choice]} **{bot_choice}**\n"
-                                   f"베팅 {format_num(amount)} P 를 잃었습니다.")
-                    color = discord.Color.red()
-                    await outer_self._send_gamble_log(
-                        interaction.guild,
-                        title="🎰 도박 로그 - 가위바위보(패배)",
-                        description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
-                                     f"→ **-{format_num(amount)} P** 손실"),
-                        color=discord.Color.red().value
-                    )
+    async def rps_timeout(self, view: RPSView):
+        session = self.sessions.get(view.sid)
+        if not isinstance(session, RPSSession) or session.resolved:
+            return
+        session.resolved = True
+        self._settle(session, session.amount, record=False)  # 본전 환불 (판수 미집계)
+        view.disable_all()
+        try:
+            if session.message:
+                to = discord.Embed(
+                    title="⌛ 시간 초과",
+                    description=f"선택 시간이 초과되어 **{format_num(session.amount)} P** 가 반환되었습니다.",
+                    color=discord.Color.orange()
+                )
+                await session.message.edit(embed=to, view=view)
+        except Exception:
+            pass
+        finally:
+            self._close_session(session)
 
-                user_resolved = True
-                for c in self.children:
-                    c.disabled = True
+    async def rps_choose(self, interaction: discord.Interaction, session: RPSSession, user_choice: str):
+        if interaction.user.id != session.user_id:
+            await interaction.response.send_message("이 게임은 호출자만 선택할 수 있어요.", ephemeral=True)
+            return
+        if session.resolved:
+            await interaction.response.send_message("이미 결과가 결정되었습니다.", ephemeral=True)
+            return
+        session.resolved = True
+
+        amount = session.amount
+        bot_choice, multi = rps_draw(session.rng)
+        matchup = (f"당신: {RPS_EMOJIS[user_choice]} **{user_choice}** vs "
+                   f"봇: {RPS_EMOJIS[bot_choice]} **{bot_choice}**\n")
+
+        if bot_choice == user_choice:
+            self._settle(session, amount)
+            result_title = "🤝 비겼습니다 (멘징)"
+            result_desc = matchup + f"본전 **{format_num(amount)} P** 반환되었습니다."
+            color = discord.Color.greyple()
+            await self._send_gamble_log(
+                interaction.guild,
+                title="🎰 도박 로그 - 가위바위보(비김)",
+                description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** → 손익 **±0 P**"),
+                color=discord.Color.greyple().value,
+                session=session
+            )
+
+        elif RPS_WINS[user_choice] == bot_choice:
+            payout = int(math.floor(amount * multi))
+            self._settle(session, payout)
+            result_title = "🏆 승리!"
+            result_desc = matchup + f"배당 **{multi}x** → **{format_num(payout)} P** 지급!"
+            color = discord.Color.gold()
+            net = payout - amount
+            sign = "+" if net >= 0 else "-"
+            await self._send_gamble_log(
+                interaction.guild,
+                title="🎰 도박 로그 - 가위바위보(승리)",
+                description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
+                             f"→ 수령 **{format_num(payout)} P** (**{sign}{format_num(abs(net))} P**), "
+                             f"배율 **{multi}x**"),
+                color=discord.Color.gold().value,
+                session=session
+            )
+
+        else:
+            self._settle(session, 0)
+            result_title = "💣 패배…"
+            result_desc = matchup + f"베팅 {format_num(amount)} P 를 잃었습니다."
+            color = discord.Color.red()
+            await self._send_gamble_log(
+                interaction.guild,
+                title="🎰 도박 로그 - 가위바위보(패배)",
+                description=(f"{interaction.user.mention} 베팅 **{format_num(amount)} P** "
+                             f"→ **-{format_num(amount)} P** 손실"),
+                color=discord.Color.red().value,
+                session=session
+            )
+
+        view = session.view
+        if view is not None:
+            view.disable_all()
+
+        result = discord.Embed(title=result_title, description=result_desc, color=color)
+        try:
+            await interaction.response.edit_message(embed=result, view=view)
+        except discord.InteractionResponded:
+            if session.message:
+                await session.message.edit(embed=result, view=view)
+        finally:
+            self._close_session(session)
 
-                result = discord.Embed(title=result_title, description=result_desc, color=color)
-                try:
-                    await interaction.response.edit_message(embed=result, view=self)
-                except discord.InteractionResponded:
-                    if self.message:
-                        await self.message.edit(embed=result, view=self)
+    # =================================================================
+    # =                   !도박통계 / !도박랭킹                          =
+    # =================================================================
+    @commands.command(name="도박통계")
+    async def gamble_stats_command(self, ctx: commands.Context, member: discord.Member | None = None):
+        """누적 베팅/지급/순손익/최고 수익 (게임별 + 전체)"""
+        target = member or ctx.author
+        rec = gamble_stats.get(target.id)
+        total = rec.get(TOTAL_KEY)
+        if not total or not total.get("판수"):
+            await ctx.send(f"❌ {target.display_name}님의 도박 기록이 없습니다.")
+            return
 
-            @discord.ui.button(label="가위", style=discord.ButtonStyle.primary, emoji="✌️")
-            async def scissors(self, interaction: discord.Interaction, button: discord.ui.Button):
-                await self._handle_choice(interaction, "가위")
+        def summary(c: dict) -> str:
+            net = c["순손익"]
+            sign = "+" if net >= 0 else "-"
+            return (f"{c['판수']}판 {c['승']}승 · 베팅 {format_num(c['베팅'])} P\n"
+                    f"순손익 **{sign}{format_num(abs(net))} P** · 최고 +{format_num(c['최고수익'])} P")
+
+        rank = gamble_stats.rank_of(target.id)
+        embed = discord.Embed(title=f"🎰 {target.display_name}님의 도박 통계", color=discord.Color.gold())
+        embed.set_thumbnail(url=target.display_avatar.url)
+        embed.add_field(name=f"전체 (순손익 {rank}위)", value=summary(total), inline=False)
+        for kind, label in GAME_LABELS.items():
+            if kind in rec:
+                embed.add_field(name=label, value=summary(rec[kind]), inline=True)
+        await ctx.send(embed=embed)
+
+    @commands.command(name="도박랭킹")
+    async def gamble_rank_command(self, ctx: commands.Context):
+        """순손익 TOP 10 (서버에 남아있는 멤버만)"""
+        lines = []
+        for uid, net in gamble_stats.leaderboard(50):
+            member = ctx.guild.get_member(uid) if ctx.guild else None
+            if not member:
+                continue
+            sign = "+" if net >= 0 else "-"
+            lines.append(f"{len(lines) + 1}. {member.display_name} — **{sign}{format_num(abs(net))} P**")
+            if len(lines) >= 10:
+                break
 
-            @discord.ui.button(label="바위", style=discord.ButtonStyle.primary, emoji="✊")
-            async def rock(self, interaction: discord.Interaction, button: discord.ui.Button):
-                await self._handle_choice(interaction, "바위")
+        embed = discord.Embed(
+            title="🎰 도박 순손익 랭킹 (Top 10)",
+            description="\n".join(lines) or "도박 기록이 없습니다.",
+            color=discord.Color.gold()
+        )
+        await ctx.send(embed=embed)
 
-            @discord.ui.button(label="보", style=discord.ButtonStyle.primary, emoji="✋")
-            async def paper(self, interaction: discord.Interaction, button: discord.ui.Button):
-                await self._handle_choice(interaction, "보")
+    # =================================================================
+    # =                 !도박재현  시드로 판 재현 (관리자)                =
+    # =================================================================
+    @commands.has_guild_permissions(administrator=True)
+    @commands.command(name="도박재현")
+    async def replay_game(self, ctx: commands.Context, kind: str, seed: str):
+        """사용법: !도박재현 <mines|crash|rps> <seed> — 로그 푸터의 시드로 판 결과를 그대로 재현"""
+        try:
+            seed_int = parse_seed(seed)
+        except ValueError:
+            await ctx.reply("시드는 로그에 표시된 16진수 문자열이어야 합니다.", delete_after=5)
+            return
 
-        view = RPSView()
-        msg = await ctx.send(embed=embed, view=view)
-        view.message = msg
+        if kind == MinesSession.kind:
+            board = MinesSession(0, 0, None, seed=seed_int)
+            cells = ["💣" if i in board.bombs else f"x{fmt1(board.mult_values[i])}" for i in range(MINES_NCELLS)]
+            rows = [" ".join(f"`{c:>5}`" for c in cells[r * MINES_COLS:(r + 1) * MINES_COLS])
+                    for r in range(MINES_ROWS)]
+            desc = "\n".join(rows)
+        elif kind == CrashSession.kind:
+            crash = CrashSession(0, 0, None, seed=seed_int)
+            desc = f"크래시 지점: **{crash.crash_at:.2f}x** (도달 {crash_elapsed_for(crash.crash_at):.2f}초)"
+        elif kind == RPSSession.kind:
+            bot_choice, multi = rps_draw(RNG.session(seed_int))
+            desc = f"봇 선택: {RPS_EMOJIS[bot_choice]} **{bot_choice}** / 승리 시 배당 **{multi}x**"
+        else:
+            await ctx.reply("종류는 mines / crash / rps 중 하나입니다.", delete_after=5)
+            return
 
-        async def cleanup():
-            try:
-                await view.wait()
-            finally:
-                self.active_rps_users.discard(ctx.author.id)
+        embed = discord.Embed(title=f"🔁 도박 재현 - {kind}", description=desc, color=discord.Color.dark_teal())
+        embed.set_footer(text=f"seed {format_seed(seed_int)}")
+        await ctx.send(embed=embed)
 
-        self.bot.loop.create_task(cleanup())
+    @replay_game.error
+    async def _replay_error(self, ctx: commands.Context, error: Exception):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.reply("이 명령은 **관리자만** 사용할 수 있어요.", delete_after=5)
+        elif isinstance(error, commands.MissingRequiredArgument):
+            await ctx.reply("사용법: `!도박재현 <mines|crash|rps> <seed>`", delete_after=7)
 
 
 async def setup(bot: commands.Bot):
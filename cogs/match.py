@@ -1,16 +1,32 @@
 # cogs/match.py
-import asyncio
-import random
-import re
+import time
+import uuid
 import urllib.parse
-import json
 import configparser
+from collections import Counter, OrderedDict
+from enum import Enum
 import discord
 from discord.ext import commands
 from discord.ui import View, Button, Select, Modal, TextInput
-from typing import Dict, Set, List, Optional, Tuple
-
-from utils.stats import update_result_dual, MANG_PATH, get_points, spend_points, add_points
+from typing import Dict, List, Optional, Tuple
+
+from utils.stats import record_results, result_record, MODES, get_points, spend_points, add_points_many
+from utils.escrow import open_escrow, close_escrow
+from utils.match_store import load_match_state, save_match_state
+from utils.timers import timers
+from utils.match_history import match_history
+from utils.pair_stats import pair_stats
+from utils.rating import ratings, RATING_MIN_GAMES
+from utils.team_balance import Player, BalanceResult, balance_teams, lane_mask
+from utils.profile import profiles
+from utils.notify import dms
+from utils.betting_pool import BettingPool
+from utils.bet_registry import bet_registry
+from utils.draft import DraftState, snake_order
+from utils.lobbies import LobbyIndex
+from utils.rng import RNG, format_seed
+from utils.rollups import rollups
+from utils.rankings import rankings
 
 # ───────── config.ini 로딩 ─────────
 _cfg = configparser.ConfigParser()
@@ -37,31 +53,210 @@ def create_opgg_multisearch_url(summoner_list: List[str]) -> str:
     encoded = [urllib.parse.quote(s) for s in summoner_list]
     return base_url + ",".join(encoded)
 
-def clean_opgg_name(name: str) -> str:
-    return re.sub(r"[^\w\s가-힣/#]", "", name).split('/')[0].strip()
+TIER_DEFAULT_STRENGTH = 1200.0   # 티어를 읽지 못한 참가자 (골드4 취급)
+
+
+RESULT_TIMEOUT_SEC = 10800   # 팀 확정 후 결과 입력 제한 (3시간)
+BETTING_WINDOW_SEC = 210     # 배팅 마감 (3분 30초)
+MESSAGE_EDIT_INTERVAL = 1.5  # 모집/배팅 메시지 최소 수정 간격 (요청이 몰리면 최신 상태로 한 번만 수정)
+
+AnyMessage = discord.Message | discord.PartialMessage
+
+STALE_GAME_SEC = 21600      # 로비/드래프트가 이 시간 동안 변화 없으면 정리 (6시간)
+SETTLED_KEEP = 20           # 후속 버튼(팀다시뽑기/한판 더/종료)을 위해 남겨 둘 종료 내전 수
+LOBBY_SIZES = range(2, 21, 2)   # !내전 [인원] 허용 값 (짝수, 기본 10)
+MAX_LOBBIES_PER_CHANNEL = 3     # 한 채널에서 동시에 모집 중일 수 있는 로비 수
+
+
+class GameState(str, Enum):
+    """내전 수명주기: lobby → drafting → playing → settled / cancelled / expired"""
+    LOBBY = "lobby"
+    DRAFTING = "drafting"
+    PLAYING = "playing"
+    SETTLED = "settled"      # 결과 기록 완료
+    CANCELLED = "cancelled"  # 모집 종료 / 결과 취소
+    EXPIRED = "expired"      # 결과 입력 시간 초과 또는 방치
+
+
+TERMINAL_STATES = frozenset({GameState.SETTLED, GameState.CANCELLED, GameState.EXPIRED})
+
+_TRANSITIONS: Dict[GameState, frozenset] = {
+    GameState.LOBBY: frozenset({GameState.DRAFTING, GameState.CANCELLED, GameState.EXPIRED}),
+    GameState.DRAFTING: frozenset({GameState.PLAYING, GameState.CANCELLED, GameState.EXPIRED}),
+    GameState.PLAYING: frozenset({GameState.SETTLED, GameState.CANCELLED, GameState.EXPIRED}),
+    GameState.SETTLED: frozenset(),
+    GameState.CANCELLED: frozenset(),
+    GameState.EXPIRED: frozenset(),
+}
+
+# 스냅샷에 메시지 ID로 저장하는 Game 속성
+_MESSAGE_FIELDS = ("message", "result_message", "team_status_message", "captain_message", "draft_message",
+                   "betting_message")
 
 
 # ===== 데이터 구조 =====
 class Game:
-    def __init__(self, game_id: int, host_id: int, channel_id: int, max_players: int = 10):
+    def __init__(self, game_id: int, host_id: int, channel_id: int, max_players: int = 10, guild_id: int = 0,
+                 mode: str = "내전"):
         self.id = game_id
         self.host_id = host_id
         self.channel_id = channel_id
+        self.guild_id = guild_id
         self.max_players = max_players
+        self.mode = mode                     # 전적 반영 모드 ("내전" / "스크림")
         self.participants: List[int] = [host_id]
-        self.started = False
-        self.message: Optional[discord.Message] = None
+        self.state = GameState.LOBBY
+        self.updated_at = time.time()
+        self.message: Optional[AnyMessage] = None
         self.team_captains: List[int] = []
         self.teams: Dict[int, List[int]] = {1: [], 2: []}
-        self.pick_order: List[int] = []
-        self.draft_turn = 0
-        self.finished = False
-        self.result_recorded = False  # 결과 기록 여부 추가
-        self.result_message: Optional[discord.Message] = None
-        self.team_status_message: Optional[discord.Message] = None
-        self.bets: Dict[int, Dict[str, int]] = {}
-        self.pick_history: List[Tuple[int, int]] = []
+        self.draft: Optional[DraftState] = None   # 팀장 드래프트 (픽 대상/순서/픽 기록)
+        self.draft_seed: int = 0             # 드래프트 섞기 시드 (팀 구성 임베드 푸터에 표시, 재현용)
+        self.result_message: Optional[AnyMessage] = None
+        self.team_status_message: Optional[AnyMessage] = None
+        self.captain_message: Optional[AnyMessage] = None
+        self.draft_message: Optional[AnyMessage] = None
+        self.betting_message: Optional[AnyMessage] = None
+        self.pool = BettingPool()            # 배팅 {uid: {"amount", "team", "escrow"}} + 팀별 합계
         self.betting_active = True  # 배팅 활성화 상태 추가
+        self.betting_deadline: float = 0.0   # epoch 초
+        self.result_deadline: float = 0.0    # epoch 초
+        self.views: List[View] = []          # 이 내전에 붙은 View (정리 시 stop, 저장 안 함)
+
+    @property
+    def bets(self) -> Dict[int, Dict]:
+        return self.pool.bets
+
+    # --------- 드래프트 ---------
+    @property
+    def pick_order(self) -> List[int]:
+        return self.draft.order if self.draft else []
+
+    @property
+    def draft_turn(self) -> int:
+        return self.draft.turn if self.draft else 0
+
+    @property
+    def available(self) -> List[int]:
+        """드래프트에서 아직 뽑히지 않은 인원"""
+        return self.draft.available() if self.draft else []
+
+    @property
+    def pick_history(self) -> List[Tuple[int, int]]:
+        return self.draft.history if self.draft else []
+
+    def pick(self, uid: int) -> int:
+        """현재 차례 팀에 uid 배정 → 팀 번호"""
+        team = self.draft.pick(uid)
+        self.teams[team].append(uid)
+        self.touch()
+        return team
+
+    def undo_pick(self) -> Optional[Tuple[int, int]]:
+        """마지막 픽 되돌리기 → (팀, uid). 픽은 스택이라 그 팀 명단의 마지막 사람이다."""
+        last = self.draft.undo() if self.draft else None
+        if last is not None:
+            team, uid = last
+            if self.teams[team] and self.teams[team][-1] == uid:
+                self.teams[team].pop()
+            else:
+                self.teams[team].remove(uid)
+            self.touch()
+        return last
+
+    # --------- 수명주기 ---------
+    @property
+    def started(self) -> bool:
+        return self.state is not GameState.LOBBY
+
+    @property
+    def finished(self) -> bool:
+        return self.state in TERMINAL_STATES
+
+    @property
+    def result_recorded(self) -> bool:
+        return self.state is GameState.SETTLED
+
+    def advance(self, state: GameState) -> None:
+        """상태 전이 (허용되지 않은 전이는 ValueError)"""
+        if state not in _TRANSITIONS[self.state]:
+            raise ValueError(f"내전 #{self.id}: {self.state.value} → {state.value} 전이 불가")
+        self.state = state
+        self.touch()
+
+    def touch(self) -> None:
+        self.updated_at = time.time()
+
+    def attach(self, view: View, replace: bool = False) -> None:
+        """View 등록. replace면 같은 종류의 이전 View(지난 차례 드래프트 등)를 멈추고 뺀다."""
+        if replace:
+            for old in [v for v in self.views if type(v) is type(view)]:
+                old.stop()
+                self.views.remove(old)
+        self.views.append(view)
+
+    # --------- 스냅샷 (재시작 복구용) ---------
+    def to_dict(self) -> dict:
+        data = {
+            "id": self.id,
+            "host_id": self.host_id,
+            "channel_id": self.channel_id,
+            "guild_id": self.guild_id,
+            "max_players": self.max_players,
+            "mode": self.mode,
+            "participants": list(self.participants),
+            "state": self.state.value,
+            "updated_at": self.updated_at,
+            "team_captains": list(self.team_captains),
+            "teams": {str(k): list(v) for k, v in self.teams.items()},
+            "pick_order": list(self.pick_order),
+            "draft_turn": self.draft_turn,
+            "available": list(self.available),
+            "bets": {str(uid): dict(bet) for uid, bet in self.bets.items()},
+            "pick_history": [list(p) for p in self.pick_history],
+            "draft_seed": self.draft_seed,
+            "betting_active": self.betting_active,
+            "betting_deadline": self.betting_deadline,
+            "result_deadline": self.result_deadline,
+        }
+        for field in _MESSAGE_FIELDS:
+            msg = getattr(self, field)
+            data[f"{field}_id"] = msg.id if msg is not None else 0
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict, bot: commands.Bot) -> "Game":
+        game = cls(int(data["id"]), int(data["host_id"]), int(data["channel_id"]),
+                   int(data.get("max_players", 10)), int(data.get("guild_id", 0)),
+                   data.get("mode", "내전"))
+        game.participants = [int(u) for u in data.get("participants", [])]
+        if "state" in data:
+            game.state = GameState(data["state"])
+        elif data.get("finished"):  # 상태 필드 이전 스냅샷
+            game.state = GameState.SETTLED if data.get("result_recorded") else GameState.CANCELLED
+        elif data.get("started"):
+            game.state = GameState.PLAYING if data.get("result_message_id") else GameState.DRAFTING
+        game.updated_at = float(data.get("updated_at", game.updated_at))
+        game.team_captains = [int(u) for u in data.get("team_captains", [])]
+        game.teams = {int(k): [int(u) for u in v] for k, v in data.get("teams", {}).items()} or {1: [], 2: []}
+        if data.get("pick_order"):
+            game.draft = DraftState.from_snapshot(
+                [int(t) for t in data["pick_order"]],
+                [int(u) for u in data.get("available", [])],
+                [(int(t), int(u)) for t, u in data.get("pick_history", [])],
+            )
+        game.draft_seed = int(data.get("draft_seed", 0))
+        game.pool = BettingPool({int(uid): bet for uid, bet in data.get("bets", {}).items()})
+        game.betting_active = bool(data.get("betting_active", True))
+        game.betting_deadline = float(data.get("betting_deadline", 0.0))
+        game.result_deadline = float(data.get("result_deadline", 0.0))
+
+        # 캐시 없이도 동작하는 PartialMessage로 메시지 참조 복원
+        channel = bot.get_partial_messageable(game.channel_id, guild_id=game.guild_id or None)
+        for field in _MESSAGE_FIELDS:
+            mid = int(data.get(f"{field}_id", 0))
+            setattr(game, field, channel.get_partial_message(mid) if mid else None)
+        return game
 
     def is_full(self) -> bool:
         return len(self.participants) >= self.max_players
@@ -69,12 +264,14 @@ class Game:
     def add_participant(self, user_id: int) -> bool:
         if user_id not in self.participants and not self.is_full():
             self.participants.append(user_id)
+            self.touch()
             return True
         return False
 
     def remove_participant(self, user_id: int) -> bool:
         if user_id in self.participants and user_id != self.host_id:
             self.participants.remove(user_id)
+            self.touch()
             return True
         return False
 
@@ -83,6 +280,32 @@ class Game:
         self.betting_active = False
 
 
+class CoalescedEdits:
+    """
+    View 믹스인: 메시지 수정 요청을 모아 MESSAGE_EDIT_INTERVAL에 최대 한 번 update_message()를 실행.
+    이미 예약돼 있으면 그 수정이 최신 상태를 그리므로 무시하고,
+    아니면 마지막 수정으로부터 간격이 지난 시점(지났으면 바로)에 한 번 예약한다.
+    """
+    timer_key: str
+    last_edit = 0.0   # time.monotonic() 기준 마지막 메시지 수정 시각
+
+    def request_update(self) -> None:
+        if self.timer_key in timers:
+            return
+        delay = self.last_edit + MESSAGE_EDIT_INTERVAL - time.monotonic()
+        timers.schedule(self.timer_key, delay, self._flush)
+
+    async def _flush(self) -> None:
+        if self.is_finished():
+            return
+        self.last_edit = time.monotonic()
+        await self.update_message()
+
+    def stop(self) -> None:
+        timers.cancel(self.timer_key)
+        super().stop()
+
+
 # ====== Cog ======
 class MatchCog(commands.Cog):
     """내전(로비/드래프트/결과 기록/OPGG 버튼) 전담 Cog"""
@@ -90,9 +313,222 @@ class MatchCog(commands.Cog):
     def __init__(self, bot: commands.Bot, role_ids: Dict[str, int]):
         self.bot = bot
         self.role_ids = role_ids
-        self.game_counter: int = 1
         self.games: Dict[int, Game] = {}
-        self.active_hosts: Set[int] = set()
+        # 진행 중(비종료) 내전 인덱스 (길드/채널/개최자) + 채널별 대기열
+        self.lobbies = LobbyIndex()
+        # 후속 버튼용으로 남겨 둔 종료 내전 (오래된 순, SETTLED_KEEP개 초과 시 정리)
+        self._settled: "OrderedDict[int, None]" = OrderedDict()
+        self.metrics: Counter = Counter()
+
+        # 쌍 전적 행렬이 기록보다 뒤처져 있으면(최초 도입 등) 따라잡기
+        pair_stats.sync(match_history)
+
+        # 재시작 전 진행 중이던 내전 복원 (View 등록은 cog_load에서)
+        state = load_match_state()
+        self.game_counter: int = int(state["game_counter"])
+        for snap in state["games"].values():
+            try:
+                game = Game.from_dict(snap, bot)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if game.state is GameState.SETTLED:
+                self.games[game.id] = game
+                self._settled[game.id] = None
+            elif not game.finished:
+                self.register_game(game, count=False)
+        self.lobbies.restore_queues(state["queues"])
+
+    async def cog_load(self):
+        for game in self.games.values():
+            self._arm_stale(game)
+            self._restore_views(game)
+
+    async def cog_unload(self):
+        timers.cancel_prefix("match:")
+
+    # --------- 닉네임 프로필 캐시 ---------
+    @commands.Cog.listener()
+    async def on_ready(self):
+        for guild in self.bot.guilds:
+            profiles.warm(guild.members)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.display_name != after.display_name:
+            profiles.invalidate(after.id)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if before.display_name != after.display_name:  # 서버 닉네임이 없으면 전역 이름이 표시됨
+            profiles.invalidate(after.id)
+
+    # --------- 상태 저장/복원 ---------
+    def save_games(self) -> None:
+        """진행 중인 내전 스냅샷 + game_counter 저장 (상태가 바뀔 때마다 호출)"""
+        save_match_state(self.game_counter, {str(gid): g.to_dict() for gid, g in self.games.items()},
+                         self.lobbies.queues_snapshot())
+
+    def _next_game_id(self) -> int:
+        game_id = self.game_counter
+        self.game_counter += 1
+        return game_id
+
+    # --------- 수명주기/인덱스 ---------
+    def register_game(self, game: Game, *, count: bool = True) -> None:
+        """새 내전 등록 + 길드/채널/개최자 인덱스 추가 (복원된 내전의 방치 타이머는 cog_load에서)"""
+        self.games[game.id] = game
+        self.lobbies.add(game)
+        bet_registry.attach(game.id, game.pool)
+        if count:
+            self.metrics["created"] += 1
+            self._arm_stale(game)
+
+    def _unindex(self, game: Game) -> None:
+        self.lobbies.remove(game)
+
+    def transition(self, game: Game, state: GameState) -> None:
+        """
+        상태 전이 + 정리.
+        settled는 후속 버튼 때문에 SETTLED_KEEP개까지 남기고, cancelled/expired는 바로 제거한다.
+        """
+        game.advance(state)
+        self.metrics[state.value] += 1
+        if state is GameState.PLAYING:
+            timers.cancel(f"match:{game.id}:stale")
+        if state not in TERMINAL_STATES:
+            return
+        self._cancel_timers(game)
+        self._unindex(game)
+        bet_registry.release(game.id)
+        if state is GameState.SETTLED:
+            self._settled[game.id] = None
+            while len(self._settled) > SETTLED_KEEP:
+                old_id, _ = self._settled.popitem(last=False)
+                old = self.games.get(old_id)
+                if old is not None:
+                    self.evict(old)
+        else:
+            self.evict(game)
+
+    def evict(self, game: Game) -> None:
+        """내전을 메모리/스냅샷에서 제거하고 붙어 있던 View 정리"""
+        if self.games.pop(game.id, None) is None:
+            return
+        self._cancel_timers(game)
+        self._unindex(game)
+        bet_registry.release(game.id)
+        self._settled.pop(game.id, None)
+        for view in game.views:
+            view.stop()
+        game.views.clear()
+        self.metrics["evicted"] += 1
+
+    @staticmethod
+    def _cancel_timers(game: Game) -> None:
+        timers.cancel(f"match:{game.id}:result")
+        timers.cancel(f"match:{game.id}:betting")
+        timers.cancel(f"match:{game.id}:lobby")
+        timers.cancel(f"match:{game.id}:odds")
+        timers.cancel(f"match:{game.id}:stale")
+
+    def games_in_guild(self, guild_id: int) -> List[Game]:
+        return [self.games[gid] for gid in self.lobbies.in_guild(guild_id)]
+
+    def games_in_channel(self, channel_id: int) -> List[Game]:
+        return [self.games[gid] for gid in self.lobbies.in_channel(channel_id)]
+
+    def games_hosted_by(self, host_id: int) -> List[Game]:
+        return [self.games[gid] for gid in self.lobbies.hosted_by(host_id)]
+
+    def _arm_stale(self, game: Game) -> None:
+        """로비/드래프트 방치 타이머 (마지막 변화 + STALE_GAME_SEC)"""
+        if game.state in (GameState.LOBBY, GameState.DRAFTING):
+            timers.schedule(f"match:{game.id}:stale", game.updated_at + STALE_GAME_SEC - time.time(),
+                            self.expire_if_stale, game)
+
+    async def expire_if_stale(self, game: Game) -> None:
+        """방치 타이머 만료: 그사이 변화가 있었으면 남은 시간으로 다시 예약"""
+        if game.finished or game.state not in (GameState.LOBBY, GameState.DRAFTING):
+            return
+        if time.time() - game.updated_at < STALE_GAME_SEC:
+            self._arm_stale(game)
+            return
+        self.transition(game, GameState.EXPIRED)
+        self.save_games()
+
+    def expire_game(self, game: Game) -> None:
+        """결과 입력 시간 초과: 남은 배팅은 환불 후 만료"""
+        if game.finished:
+            return
+        game.disable_betting()
+        self.refund_bets(game)
+        self.transition(game, GameState.EXPIRED)
+        self.save_games()
+
+    @staticmethod
+    def refund_bets(game: Game) -> None:
+        escrow_ids = game.pool.escrow_ids()
+        add_points_many(bet_registry.refund(game.id))
+        close_escrow(*escrow_ids)
+
+    def game_metrics(self) -> Dict[str, int]:
+        """상태별 내전 수 + 인덱스 크기 + 누적 전이 횟수"""
+        by_state = Counter(g.state.value for g in self.games.values())
+        out = {f"games_{st.value}": by_state.get(st.value, 0) for st in GameState if st not in TERMINAL_STATES}
+        out["games_retained"] = len(self._settled)
+        out["games_total"] = len(self.games)
+        out["index_guilds"] = len(self.lobbies.by_guild)
+        out["index_channels"] = len(self.lobbies.by_channel)
+        out["index_hosts"] = len(self.lobbies.by_host)
+        for key, value in sorted(self.metrics.items()):
+            out[f"lifetime_{key}"] = value
+        out["timers_pending"] = timers.pending  # 전역 타이머 (내전/도박/청소 포함)
+        out["dm_pending"] = dms.pending
+        for key, value in sorted(dms.metrics.items()):
+            out[f"dm_{key}"] = value
+        out["bets_open_matches"] = len(bet_registry)
+        out["bets_open_bettors"] = bet_registry.bettors
+        return out
+
+    def holds_bet_escrow(self, escrow_id: str) -> bool:
+        """복원된 내전이 아직 정산할 배팅이면 True (재시작 환불 대상에서 제외)"""
+        return bet_registry.holds_escrow(escrow_id)
+
+    def _restore_views(self, game: Game) -> None:
+        """스냅샷 단계에 맞는 View를 같은 custom_id로 다시 등록"""
+        if game.state is GameState.LOBBY:
+            if game.message:
+                view = self.StartEndView(self, game) if game.is_full() else self.LobbyView(self, game)
+                self.bot.add_view(view, message_id=game.message.id)
+            return
+
+        if game.state is GameState.DRAFTING:
+            if len(game.team_captains) < 2:
+                if game.captain_message:
+                    self.bot.add_view(self.CaptainSelectView(self, game, {}), message_id=game.captain_message.id)
+            elif game.draft_message and game.draft and not game.draft.done:
+                guild = self.bot.get_guild(game.guild_id)
+                if guild is not None:
+                    game.draft.resolve_labels(guild, game.team_captains)
+                self.bot.add_view(self.DraftView(self, game), message_id=game.draft_message.id)
+            return
+
+        if game.result_message is None:
+            return
+
+        result_view = self.ResultView(self, game)
+        self.bot.add_view(result_view, message_id=game.result_message.id)
+        if not game.finished and game.result_deadline:
+            self.schedule_result_timeout(game, result_view, game.result_deadline - time.time())
+
+        if game.betting_active and game.betting_message:
+            remaining = game.betting_deadline - time.time()
+            if remaining > 0 and not game.finished:
+                betting_view = self.BettingView(self, game)
+                self.bot.add_view(betting_view, message_id=game.betting_message.id)
+                timers.schedule(f"match:{game.id}:betting", remaining, self.close_betting, game, betting_view)
+            else:
+                game.disable_betting()
 
     def _get_match_log_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
         """내전 기록을 보낼 텍스트 채널을 찾는다."""
@@ -116,210 +552,190 @@ class MatchCog(commands.Cog):
 
     # --------- 내부 유틸 ---------
     async def get_sorted_participants_by_tier(self, guild: discord.Guild, user_ids: List[int]) -> List[str]:
-        tier_order = {"C": 0, "GM": 1, "M": 2, "D": 3, "E": 4, "P": 5, "G": 6, "S": 7, "B": 8, "I": 9}
-        def parse_tier(text: str):
-            match = re.search(r"(C|GM|M|D|E|P|G|S|B|I)(\d+)", text.upper())
-            if match:
-                tier, num = match.groups()
-                num = int(num)
-                tier_rank = tier_order.get(tier, 999)
-                score = -num if tier in ("C", "GM", "M") else num
-                return (tier_rank, score)
-            return (999, 999)
-
         entries = []
         for uid in user_ids:
             member = guild.get_member(uid)
             if not member:
                 continue
-            name = member.display_name
-            entries.append((name, parse_tier(name)))
+            entries.append((member.display_name, profiles.get(member).tier))
 
         sorted_entries = sorted(entries, key=lambda x: x[1])
         return [entry[0] for entry in sorted_entries]
 
-    async def start_team_leader_selection(self, interaction: discord.Interaction, game: Game):
+    def balance_lobby(self, guild: discord.Guild, game: Game) -> Tuple[BalanceResult, str]:
+        """
+        참가자를 실력 차이가 가장 작은 두 팀으로 분할.
+        전원이 레이팅 반영 판수를 채웠으면 레이팅, 아니면 닉네임 티어 점수를 쓴다.
+        """
+        rated = all(ratings.games(uid) >= RATING_MIN_GAMES for uid in game.participants)
+        players = []
+        for uid in game.participants:
+            profile = profiles.of(guild, uid)
+            if rated:
+                strength = ratings.get(uid)
+            elif profile is not None and profile.strength is not None:
+                strength = profile.strength
+            else:
+                strength = TIER_DEFAULT_STRENGTH
+            players.append(Player(uid, strength, lane_mask(profile.lanes if profile else ())))
+        return balance_teams(players), ("레이팅" if rated else "티어")
+
+    async def start_auto_balance(self, interaction: discord.Interaction, game: Game):
+        """팀장 선택/드래프트 없이 자동 밸런스로 팀 확정"""
         guild = interaction.guild
         assert guild is not None
 
-        sorted_names = await self.get_sorted_participants_by_tier(guild, game.participants)
-        name_to_user = {guild.get_member(uid).display_name: uid for uid in game.participants if guild.get_member(uid)}
-
-        options = []
-        for name in sorted_names:
-            uid = name_to_user.get(name)
-            if uid:
-                options.append(discord.SelectOption(label=name, value=str(uid)))
-
-        cog = self
+        result, mode = self.balance_lobby(guild, game)
+        # 팀 내 최고 점수를 팀장(⭐)으로
+        game.team_captains = [result.team1[0].uid, result.team2[0].uid]
+        game.teams = {1: [p.uid for p in result.team1], 2: [p.uid for p in result.team2]}
 
-        class CaptainSelectView(View):
-            def __init__(self):
-                super().__init__(timeout=None)
-
-            @discord.ui.select(placeholder="팀장을 선택하세요 (두 명)", min_values=2, max_values=2, options=options)
-            async def select_callback(self, inner_interaction: discord.Interaction, select: Select):
-                if inner_interaction.user.id != game.host_id:
-                    await inner_interaction.response.send_message("팀장 선택은 개최자만 가능합니다.", ephemeral=True)
-                    return
+        s1 = sum(p.strength for p in result.team1)
+        s2 = sum(p.strength for p in result.team2)
+        lanes = "✅ 두 팀 모두 라인 구성 가능" if result.lanes_ok else "⚠️ 선호 라인만으로는 구성 불가 (점수 우선)"
+        embed = discord.Embed(
+            title=f"⚖️ 내전 #{game.id} 자동 밸런스",
+            description=(f"기준: **{mode}**\n"
+                         f"1팀 평균 {s1 / len(result.team1):.0f} / 2팀 평균 {s2 / len(result.team2):.0f} "
+                         f"(합 차이 {result.diff:.0f})\n{lanes}"),
+            color=0x2F3136
+        )
+        await interaction.channel.send(embed=embed)
+        await self.finish_teams(interaction.channel, game)
 
-                game.team_captains = [int(uid) for uid in select.values]
+    async def start_team_leader_selection(self, interaction: discord.Interaction, game: Game):
+        guild = interaction.guild
+        assert guild is not None
 
-                embed = discord.Embed(
-                    title="팀장 선택 완료",
-                    description="팀장이 선택되었습니다! 팀 구성을 시작합니다.",
-                    color=0x2F3136
-                )
-                await inner_interaction.response.edit_message(embed=embed, view=None)
-                await cog.start_draft(inner_interaction, game)
+        sorted_names = await self.get_sorted_participants_by_tier(guild, game.participants)
+        name_to_user = {guild.get_member(uid).display_name: uid for uid in game.participants if guild.get_member(uid)}
+        # 티어 순 정렬 (Select 옵션 순서)
+        ordered = [name_to_user[name] for name in sorted_names if name in name_to_user]
+        labels = {uid: name for name, uid in name_to_user.items()}
 
         embed = discord.Embed(
             title="팀장 선택",
             description="티어 순으로 정렬된 명단에서 팀장을 선택해주세요:",
             color=0x2F3136
         )
-        await interaction.channel.send(embed=embed, view=CaptainSelectView())
+        game.captain_message = await interaction.channel.send(
+            embed=embed, view=self.CaptainSelectView(self, game, labels, ordered)
+        )
+        self.save_games()
 
     async def start_draft(self, interaction: discord.Interaction, game: Game):
-        players = [uid for uid in game.participants if uid not in game.team_captains]
-        random.shuffle(players)
-        first = random.choice([1, 2])
-
-        random.shuffle(game.team_captains)
+        # 시드 하나로 픽 대상 순서/선픽 팀/팀장 배정을 뽑음 (입력은 ID 순으로 정렬해 시드만으로 재현)
+        rng = RNG.session()
+        game.draft_seed = rng.initial_seed
+        players = sorted(uid for uid in game.participants if uid not in game.team_captains)
+        rng.shuffle(players)
+        first = rng.choice([1, 2])
+
+        game.team_captains.sort()
+        rng.shuffle(game.team_captains)
         game.teams[1].append(game.team_captains[0])
         game.teams[2].append(game.team_captains[1])
 
-        game.pick_order = [1, 2, 2, 1, 1, 2, 2, 1] if first == 1 else [2, 1, 1, 2, 2, 1, 1, 2]
+        game.draft = DraftState(players, snake_order(first, len(players)))
 
         guild = interaction.guild
         assert guild is not None
+        # 표시 이름은 여기서 한 번만 조회
+        game.draft.resolve_labels(guild, game.team_captains)
 
-        c1 = guild.get_member(game.team_captains[0]).display_name
-        c2 = guild.get_member(game.team_captains[1]).display_name
-        embed = discord.Embed(title=f"내전 #{game.id} 팀 구성 현황", color=0x2F3136)
-        embed.add_field(name="1팀", value=f"- {c1}", inline=True)
-        embed.add_field(name="2팀", value=f"- {c2}", inline=True)
-
-        game.team_status_message = await interaction.channel.send(embed=embed)
-        await self.send_draft_ui(interaction.channel, game, players)
-
-    async def send_draft_ui(self, channel: discord.TextChannel, game: Game, available: List[int]):
-        if not available or game.draft_turn >= len(game.pick_order):
-            await self.finish_teams(channel, game)
-            return
-
-        team_num = game.pick_order[game.draft_turn]
-        captain_id = game.team_captains[team_num - 1]
-        guild = channel.guild
-
-        def create_team_embed():
-            team1_members = [guild.get_member(u).display_name for u in game.teams[1]]
-            team2_members = [guild.get_member(u).display_name for u in game.teams[2]]
-            embed = discord.Embed(title=f"내전 #{game.id} 팀 구성 현황", color=0x2F3136)
-            embed.add_field(name="1팀", value="\n".join(f"- {n}" for n in team1_members) or "-", inline=True)
-            embed.add_field(name="2팀", value="\n".join(f"- {n}" for n in team2_members) or "-", inline=True)
-            return embed
-
-        cog = self
-
-        class DraftView(View):
-            def __init__(self):
-                super().__init__(timeout=None)
-
-            @discord.ui.select(
-                placeholder=f"{team_num}팀 픽 대상 선택",
-                min_values=1,
-                max_values=1,
-                options=[
-                    discord.SelectOption(
-                        label=guild.get_member(uid).display_name,
-                        value=str(uid)
-                    ) for uid in available
-                ]
-            )
-            async def select_callback(self, interaction: discord.Interaction, select: Select):
-                if interaction.user.id != captain_id:
-                    await interaction.response.send_message("지금은 다른 팀장의 차례입니다.", ephemeral=True)
-                    return
-
-                uid = int(select.values[0])
-                if uid not in available:
-                    await interaction.response.send_message("이미 선택된 유저입니다.", ephemeral=True)
-                    return
-
-                game.teams[team_num].append(uid)
-                available.remove(uid)
-                game.pick_history.append((team_num, uid))
-                game.draft_turn += 1
-
-                await game.team_status_message.edit(embed=create_team_embed())
-                await interaction.message.delete()
-                await cog.send_draft_ui(channel, game, available)
-
-            @discord.ui.button(label="↩ 되돌리기", style=discord.ButtonStyle.secondary)
-            async def undo_pick(self, interaction: discord.Interaction, button: Button):
-                if interaction.user.id != game.host_id and not interaction.user.guild_permissions.manage_guild:
-                    await interaction.response.send_message("되돌리기는 개최자 또는 관리자만 가능합니다.", ephemeral=True)
-                    return
-
-                if not game.pick_history:
-                    await interaction.response.send_message("되돌릴 선택이 없습니다.", ephemeral=True)
-                    return
-
-                last_team, last_uid = game.pick_history.pop()
-
-                if last_uid in game.teams[last_team]:
-                    game.teams[last_team].remove(last_uid)
-
-                if last_uid not in available:
-                    available.append(last_uid)
-
-                if game.draft_turn > 0:
-                    game.draft_turn -= 1
-
-                await game.team_status_message.edit(embed=create_team_embed())
-
-                try:
-                    await interaction.message.delete()
-                except:
-                    pass
-                await cog.send_draft_ui(channel, game, available)
+        game.team_status_message = await interaction.channel.send(embed=self.create_team_embed(game))
+        await self.send_draft_ui(interaction.channel, game)
 
+    def team_roster(self, guild: discord.Guild, game: Game, team: int) -> Tuple[str, str]:
+        """팀 명단 텍스트(팀장 ⭐ 맨 위) + OP.GG 멀티서치 URL"""
+        captain = game.team_captains[team - 1] if len(game.team_captains) >= team else None
+        lines, opgg_names = [], []
+        for uid in game.teams[team]:
+            member = guild.get_member(uid)
+            if member is None:
+                lines.append("- 알 수 없음")
+                continue
+            if uid == captain:
+                lines.insert(0, f"⭐ {member.display_name}")
+            else:
+                lines.append(f"- {member.display_name}")
+            opgg_names.append(profiles.get(member).opgg_name)
+        return "\n".join(lines), create_opgg_multisearch_url(opgg_names)
+
+    def lobby_embed(self, guild: Optional[discord.Guild], game: Game) -> discord.Embed:
+        """모집 메시지: 현재 인원 + 참여자 명단 (길드 캐시가 없으면 멘션으로 표시)"""
+        host = guild.get_member(game.host_id) if guild else None
+        participants_list = ""
+        for idx, user_id in enumerate(game.participants, 1):
+            member = guild.get_member(user_id) if guild else None
+            participants_list += f"{idx}. {member.display_name if member else f'<@{user_id}>'}\n"
 
         embed = discord.Embed(
+            title=f"{game.mode} #{game.id} - {host.display_name if host else '알 수 없음'}",
+            description=f"인원: {len(game.participants)}/{game.max_players}",
+            color=0x2F3136
+        )
+        embed.add_field(name="참여자", value=participants_list or "아직 참여자가 없습니다.", inline=False)
+        waiting = self.lobbies.queue_size(game.channel_id)
+        if waiting:
+            embed.set_footer(text=f"⏳ 채널 대기열 {waiting}명")
+        return embed
+
+    @staticmethod
+    def create_team_embed(game: Game) -> discord.Embed:
+        label = game.draft.label
+        embed = discord.Embed(title=f"내전 #{game.id} 팀 구성 현황", color=0x2F3136)
+        embed.add_field(name="1팀", value="\n".join(f"- {label(u)}" for u in game.teams[1]) or "-", inline=True)
+        embed.add_field(name="2팀", value="\n".join(f"- {label(u)}" for u in game.teams[2]) or "-", inline=True)
+        if game.draft_seed:
+            embed.set_footer(text=f"seed {format_seed(game.draft_seed)}")
+        return embed
+
+    @staticmethod
+    def draft_turn_embed(game: Game) -> discord.Embed:
+        team_num = game.draft.team
+        captain_id = game.team_captains[team_num - 1]
+        return discord.Embed(
             title=f"{team_num}팀 팀원 선택",
-            description=f"{guild.get_member(captain_id).display_name}님, 팀원을 선택하세요:",
+            description=f"{game.draft.label(captain_id)}님, 팀원을 선택하세요:",
             color=0x2F3136
         )
-        await channel.send(embed=embed, view=DraftView())
 
-    async def finish_teams(self, channel: discord.TextChannel, game: Game):
-        guild = channel.guild
-
-        team1_members, team2_members = [], []
-        team1_opgg_names, team2_opgg_names = [], []
+    async def send_draft_ui(self, channel: discord.abc.Messageable, game: Game):
+        if game.draft.done:
+            game.draft_message = None
+            await self.finish_teams(channel, game)
+            return
 
-        for uid in game.teams[1]:
-            member = guild.get_member(uid)
-            nickname = member.display_name if member else "알 수 없음"
-            display = f"⭐ {nickname}" if uid == game.team_captains[0] else f"- {nickname}"
-            team1_members.append(display)
-            if nickname != "알 수 없음":
-                team1_opgg_names.append(clean_opgg_name(nickname))
+        view = self.DraftView(self, game)
+        game.draft_message = await channel.send(embed=self.draft_turn_embed(game), view=view)
+        self.save_games()
 
-        for uid in game.teams[2]:
-            member = guild.get_member(uid)
-            nickname = member.display_name if member else "알 수 없음"
-            display = f"⭐ {nickname}" if uid == game.team_captains[1] else f"- {nickname}"
-            team2_members.append(display)
-            if nickname != "알 수 없음":
-                team2_opgg_names.append(clean_opgg_name(nickname))
+    async def advance_draft(self, interaction: discord.Interaction, game: Game):
+        """픽/되돌리기 후: 같은 드래프트 메시지를 다음 차례로 교체 + 팀 현황 수정 (끝났으면 팀 확정)"""
+        if game.draft.done:
+            await interaction.response.defer()
+            try:
+                await interaction.message.delete()
+            except discord.HTTPException:
+                pass
+        else:
+            await interaction.response.edit_message(embed=self.draft_turn_embed(game),
+                                                    view=self.DraftView(self, game))
+        await game.team_status_message.edit(embed=self.create_team_embed(game))
+
+        if game.draft.done:
+            game.draft_message = None
+            await self.finish_teams(interaction.channel, game)
+        else:
+            self.save_games()
 
-        t1 = "\n".join(team1_members)
-        t2 = "\n".join(team2_members)
+    async def finish_teams(self, channel: discord.TextChannel, game: Game):
+        guild = channel.guild
+        self.transition(game, GameState.PLAYING)
 
-        opgg1 = create_opgg_multisearch_url(team1_opgg_names)
-        opgg2 = create_opgg_multisearch_url(team2_opgg_names)
+        t1, opgg1 = self.team_roster(guild, game, 1)
+        t2, opgg2 = self.team_roster(guild, game, 2)
 
         embed = discord.Embed(title=f"⚔️ 내전 #{game.id} 팀 구성 완료", color=0x2F3136)
         embed.add_field(name="🟦 1팀", value=t1 or "- 없음", inline=True)
@@ -329,6 +745,7 @@ class MatchCog(commands.Cog):
         result_view = self.ResultView(self, game)
         result_message = await channel.send(embed=embed, view=result_view)
         game.result_message = result_message
+        game.result_deadline = time.time() + RESULT_TIMEOUT_SEC
 
         opgg_view = self.OpggButtonView(opgg1, opgg2)
         await channel.send(view=opgg_view)
@@ -350,95 +767,133 @@ class MatchCog(commands.Cog):
 
             await log_ch.send(embed=log_embed, view=self.OpggButtonView(opgg1, opgg2))
 
-        asyncio.create_task(self.disable_buttons_after_timeout(result_message, result_view, 10800))
-        await channel.send(view=self.BettingView(game))
+        self.schedule_result_timeout(game, result_view, RESULT_TIMEOUT_SEC)
+        await self.open_betting(channel, game)
+
+    async def open_betting(self, channel: discord.abc.Messageable, game: Game):
+        """배팅 UI 전송 + 마감 예약"""
+        view = self.BettingView(self, game)
+        game.betting_deadline = time.time() + BETTING_WINDOW_SEC
+        game.betting_message = await channel.send(embed=self.betting_embed(game), view=view)
+        self.save_games()
+        timers.schedule(f"match:{game.id}:betting", BETTING_WINDOW_SEC, self.close_betting, game, view)
+
+    async def close_betting(self, game: Game, view: View):
+        game.disable_betting()
+        view.stop()
+        if game.id in self.games:
+            self.save_games()
+        try:
+            await game.betting_message.edit(embed=self.betting_embed(game), view=None)
+        except (AttributeError, discord.HTTPException):
+            pass
 
-    async def disable_buttons_after_timeout(self, message: discord.Message, view: View, seconds: int):
-        await asyncio.sleep(seconds)
+    def schedule_result_timeout(self, game: Game, view: View, seconds: float) -> None:
+        """결과 입력 제한 예약 (결과 기록/취소 시 transition에서 취소됨)"""
+        timers.schedule(f"match:{game.id}:result", seconds, self.on_result_timeout, game, view)
 
-        if hasattr(view, "game") and getattr(view.game, "finished", False):
+    async def on_result_timeout(self, game: Game, view: View):
+        if game.finished:
             return
+        self.expire_game(game)
+        message = game.result_message
 
         for item in view.children:
             item.disabled = True
 
-        embed = message.embeds[0]
-        embed.add_field(name="상태", value="⏱️ 시간 초과로 인해 종료되었습니다.", inline=False)
-
         try:
+            if isinstance(message, discord.PartialMessage):  # 재시작 후 복원된 참조
+                message = await message.fetch()
+            embed = message.embeds[0]
+            embed.add_field(name="상태", value="⏱️ 시간 초과로 인해 종료되었습니다.", inline=False)
             await message.edit(embed=embed, view=view)
         except:
             pass
 
+    def append_history(self, game: Game, winning_team: int, rating_delta: Optional[float] = None) -> dict:
+        """결과 기록된 판을 내전 기록 저장소에 추가 + 쌍 전적 행렬 갱신"""
+        record = match_history.append({
+            "id": game.id,
+            "guild_id": game.guild_id,
+            "host_id": game.host_id,
+            "captains": list(game.team_captains),
+            "teams": {"1": list(game.teams[1]), "2": list(game.teams[2])},
+            "winner": winning_team,
+            "mode": game.mode,
+            "bets": {"1": game.pool.team_total(1), "2": game.pool.team_total(2)},
+            "bettors": len(game.bets),
+            "rating_delta": rating_delta,   # 1팀 변동량 (2팀은 -값, 스크림은 None)
+        })
+        pair_stats.record(record)
+        return record
+
     def calculate_betting_results(self, game: Game, winning_team: int) -> str:
-        """배당 결과 계산"""
-        if not game.bets:
-            return "배당 결과가 없습니다."
-        
-        team1_bets = sum(bet["amount"] for bet in game.bets.values() if bet["team"] == 1)
-        team2_bets = sum(bet["amount"] for bet in game.bets.values() if bet["team"] == 2)
-        total_bets = team1_bets + team2_bets
-        
-        if total_bets == 0:
+        """배당 정산: 지급액 계산 후 포인트를 한 번에 반영하고 판돈 기록 제거"""
+        pool = game.pool
+        if not pool.total:
             return "배당 결과가 없습니다."
-        
-        winners = [uid for uid, bet in game.bets.items() if bet["team"] == winning_team]
-        losers = [uid for uid, bet in game.bets.items() if bet["team"] != winning_team]
-        
-        winning_total = team1_bets if winning_team == 1 else team2_bets
-        losing_total = team2_bets if winning_team == 1 else team1_bets
-        
+
+        settlement = pool.settle(winning_team)
+        add_points_many(settlement.payouts)
+        # 정산 완료 → 판돈 기록 제거
+        close_escrow(*pool.escrow_ids())
+
         result_text = f"🏆 {winning_team}팀 승리!\n"
-        result_text += f"총 배팅금: {total_bets:,}P\n\n"
-        
-        if winners:
-            result_text += "🎉 **당첨자**\n"
-            for winner_id in winners:
-                bet = game.bets[winner_id]
-                bet_amount = bet["amount"]
-                
-                # 배당률 계산: (총 배팅금 / 승리팀 배팅금)
-                if winning_total > 0:
-                    multiplier = total_bets / winning_total
-                    winnings = int(bet_amount * multiplier)
-                    profit = winnings - bet_amount
-                    
-                    # 포인트 지급
-                    add_points(winner_id, winnings)
-                    
-                    result_text += f"<@{winner_id}>: {bet_amount:,}P → {winnings:,}P (+{profit:,}P)\n"
-        
-        if losers:
+        result_text += f"총 배팅금: {settlement.total:,}P\n\n"
+
+        if settlement.refunded:
+            result_text += "승리팀에 배팅한 사람이 없어 전액 환불되었습니다.\n"
+            return result_text
+
+        result_text += f"🎉 **당첨자** (x{pool.odds(winning_team):.2f})\n"
+        for winner_id in settlement.winners:
+            bet_amount = int(game.bets[winner_id]["amount"])
+            winnings = settlement.payouts[winner_id]
+            result_text += f"<@{winner_id}>: {bet_amount:,}P → {winnings:,}P (+{winnings - bet_amount:,}P)\n"
+
+        if settlement.losers:
             result_text += "\n💸 **낙첨자**\n"
-            for loser_id in losers:
-                bet_amount = game.bets[loser_id]["amount"]
+            for loser_id in settlement.losers:
+                bet_amount = int(game.bets[loser_id]["amount"])
                 result_text += f"<@{loser_id}>: -{bet_amount:,}P\n"
-        
+
         return result_text
 
+    def betting_embed(self, game: Game) -> discord.Embed:
+        """배팅 현황: 팀별 배팅금/인원/예상 배당"""
+        pool = game.pool
+        closed = not game.betting_active
+        embed = discord.Embed(
+            title=f"🪙 내전 #{game.id} 배팅" + (" (마감)" if closed else ""),
+            description=f"총 배팅금: {pool.total:,}P · {len(pool)}명"
+                        + ("" if closed else f"\n마감 <t:{int(game.betting_deadline)}:R>"),
+            color=0x2F3136
+        )
+        for team in (1, 2):
+            odds = pool.odds(team)
+            embed.add_field(
+                name=f"{team}팀",
+                value=f"{pool.team_total(team):,}P ({pool.team_count(team)}명)\n"
+                      f"배당 {'x' + format(odds, '.2f') if odds else '-'}",
+                inline=True
+            )
+        embed.set_footer(text="배당 = 총 배팅금 / 팀 배팅금 (결과 기록 시점 기준으로 확정)")
+        return embed
+
     # ========= 스크림 =========
     @commands.command(name="스크림", aliases=["스크림전적"])
     async def scrim_stats(self, ctx: commands.Context, member: discord.Member | None = None):
         """스크림 전적 조회 (자신 또는 멘션한 대상)"""
         target = member or ctx.author
 
-        try:
-            with open(MANG_PATH, "r", encoding="utf-8") as f:
-                stats = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
-            stats = {}
-
-        rec = stats.get(str(target.id))
-        if not rec or rec.get("참여", 0) == 0:
+        total, wins, losses = result_record(target.id, "스크림")
+        if total == 0:
             if target.id == ctx.author.id:
                 await ctx.send("❌ 스크림에 참여한 기록이 없습니다.")
             else:
                 await ctx.send(f"❌ {target.display_name}님의 스크림 기록이 없습니다.")
             return
 
-        total = rec.get("참여", 0)
-        wins  = rec.get("승리", 0)
-        losses = total - wins
         winrate = round(wins / total * 100, 2) if total else 0.0
 
         embed = discord.Embed(
@@ -455,23 +910,43 @@ class MatchCog(commands.Cog):
 
     # --------- 명령어: 내전 시작 ---------
     @commands.command(name="내전")
-    async def start_match(self, ctx: commands.Context):
-        game_id = self.game_counter
-        self.game_counter += 1
+    async def start_match(self, ctx: commands.Context, *options: str):
+        """
+        사용법: !내전 [스크림] [인원]
+        '스크림'을 붙이면 결과가 스크림 전적에 기록되고, 인원은 2~20 사이 짝수 (기본 10).
+        채널 대기열에 사람이 있으면 남은 자리를 먼저 채운다.
+        """
+        mode, size = "내전", 10
+        for opt in options:
+            if opt in MODES:
+                mode = opt
+            elif opt.isdigit() and int(opt) in LOBBY_SIZES:
+                size = int(opt)
+            else:
+                await ctx.reply(f"사용법: `!내전 [스크림] [인원]` (인원: {LOBBY_SIZES.start}~{LOBBY_SIZES.stop - 1} 짝수)",
+                                delete_after=5)
+                return
 
-        game = Game(game_id, ctx.author.id, ctx.channel.id)
-        self.games[game_id] = game
-        self.active_hosts.add(ctx.author.id)
+        channel_lobbies = [g for g in self.games_in_channel(ctx.channel.id) if g.state is GameState.LOBBY]
+        if len(channel_lobbies) >= MAX_LOBBIES_PER_CHANNEL:
+            await ctx.reply(f"이 채널에는 이미 모집 중인 내전이 {len(channel_lobbies)}개 있어요. "
+                            f"(#{', #'.join(str(g.id) for g in channel_lobbies)})", delete_after=8)
+            return
+        # 개최자는 끝나지 않은(모집/드래프트/진행 중) 내전이 있으면 새로 열 수 없다
+        mine = [g for g in self.games_hosted_by(ctx.author.id) if not g.finished]
+        if mine:
+            await ctx.reply(f"이미 진행 중인 내전 #{mine[0].id} ({mine[0].state.value})이 있어요.", delete_after=5)
+            return
 
-        participants_list = f"1. {ctx.author.display_name}\n"
-
-        embed = discord.Embed(
-            title=f"내전 #{game_id} - {ctx.author.display_name}",
-            description=f"인원: 1/{game.max_players}",
-            color=0x2F3136
-        )
-        embed.add_field(name="참여자", value=participants_list, inline=False)
+        game_id = self._next_game_id()
+        game = Game(game_id, ctx.author.id, ctx.channel.id, size, guild_id=ctx.guild.id, mode=mode)
+        # 대기열에서 먼저 채우기 ("2판" 넘김)
+        promoted = self.lobbies.pop_queue(ctx.channel.id, size - 1, exclude=game.participants)
+        for uid in promoted:
+            game.add_participant(uid)
+        self.register_game(game)
 
+        embed = self.lobby_embed(ctx.guild, game)
         view = self.LobbyView(self, game)
 
         role_id = self.role_ids.get("내전")
@@ -482,34 +957,72 @@ class MatchCog(commands.Cog):
         allowed = discord.AllowedMentions(roles=[role] if role else [])
         content = role.mention if role else None
 
+        if game.is_full():
+            view.clear_items()
+            view.stop()
+            view = self.StartEndView(self, game)
         message = await ctx.send(content=content, embed=embed, view=view, allowed_mentions=allowed)
         game.message = message
+        self.save_games()
+        if promoted:
+            dms.fan_out((ctx.guild.get_member(uid) for uid in promoted),
+                        f"📢 대기하던 채널에 내전 #{game.id}이 열려 자동으로 참여되었습니다! "
+                        f"채널로 돌아와주세요.")
+
+    # --------- 명령어: 내 배팅 현황 ---------
+    @commands.command(name="내배팅")
+    async def my_bets(self, ctx: commands.Context):
+        """정산 전 내전 배팅 목록 + 지금 이기면 받을 금액"""
+        open_bets = bet_registry.open_bets(ctx.author.id)
+        if not open_bets:
+            await ctx.reply("정산 전 배팅이 없습니다.")
+            return
+
+        lines = []
+        for bet in open_bets:
+            game = self.games.get(bet.game_id)
+            status = "배팅 중" if game and game.betting_active else "마감"
+            lines.append(f"내전 #{bet.game_id} · {bet.team}팀 {bet.amount:,}P → 승리 시 {bet.potential:,}P "
+                         f"(x{bet.odds:.2f}, {status})")
+        exposure = bet_registry.exposure(ctx.author.id)
+        embed = discord.Embed(title=f"🪙 {ctx.author.display_name}님의 배팅", description="\n".join(lines), color=0x2F3136)
+        embed.set_footer(text=f"걸린 금액 {exposure:,}P / 한도 {bet_registry.limit:,}P · 예상 지급액은 현재 배당 기준")
+        await ctx.reply(embed=embed)
+
+    # --------- 명령어: 내전 상태 지표 (관리자) ---------
+    @commands.has_guild_permissions(administrator=True)
+    @commands.command(name="내전상태")
+    async def match_metrics(self, ctx: commands.Context):
+        """상태별 내전 수, 인덱스 크기, 누적 생성/종료/정리 횟수, 대기 중 타이머 수"""
+        lines = [f"`{key:<20}` {value}" for key, value in self.game_metrics().items()]
+        mine = [f"#{g.id} ({g.state.value})" for g in self.games_in_channel(ctx.channel.id)]
+        embed = discord.Embed(title="📊 내전 상태", description="\n".join(lines), color=0x2F3136)
+        embed.add_field(name="이 채널 진행 중", value=", ".join(mine) or "없음", inline=False)
+        await ctx.send(embed=embed)
+
+    @match_metrics.error
+    async def _metrics_error(self, ctx: commands.Context, error: Exception):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.reply("이 명령은 **관리자만** 사용할 수 있어요.", delete_after=5)
 
     # ========= 뷰들 =========
-    class LobbyView(View):
+    class LobbyView(CoalescedEdits, View):
         def __init__(self, cog: "MatchCog", game: Game):
             super().__init__(timeout=None)
             self.cog = cog
             self.game = game
+            game.attach(self)
+            # 재시작 후에도 같은 버튼으로 받을 수 있도록 내전별 고정 custom_id
+            self.join.custom_id = f"match:{game.id}:join"
+            self.cancel.custom_id = f"match:{game.id}:leave"
+            self.end.custom_id = f"match:{game.id}:end"
+            self.timer_key = f"match:{game.id}:lobby"
 
         async def update_message(self):
-            current = len(self.game.participants)
-            guild = self.game.message.guild
-            host = guild.get_member(self.game.host_id)
-
-            participants_list = ""
-            for idx, user_id in enumerate(self.game.participants, 1):
-                member = guild.get_member(user_id)
-                if member:
-                    participants_list += f"{idx}. {member.display_name}\n"
-
-            embed = discord.Embed(
-                title=f"내전 #{self.game.id} - {host.display_name}",
-                description=f"인원: {current}/{self.game.max_players}",
-                color=0x2F3136
-            )
-            embed.add_field(name="참여자", value=participants_list or "아직 참여자가 없습니다.", inline=False)
-
+            if self.game.state is not GameState.LOBBY:
+                return
+            # 복원된 메시지는 PartialMessage(guild 없음)일 수 있으므로 길드는 봇 캐시에서 조회
+            embed = self.cog.lobby_embed(self.cog.bot.get_guild(self.game.guild_id), self.game)
             await self.game.message.edit(content=None, embed=embed, view=self)
 
         @discord.ui.button(label="참여", style=discord.ButtonStyle.success)
@@ -521,32 +1034,36 @@ class MatchCog(commands.Cog):
 
             user_id = interaction.user.id
             if self.game.add_participant(user_id):
+                self.cog.lobbies.dequeue(user_id)
+                self.cog.save_games()
+                full = self.game.is_full()
+                if full:
+                    # 예약된 수정은 버리고 최종 명단 + 시작 버튼을 한 번에 반영
+                    self.stop()
+                    self.clear_items()
+                    await self.game.message.edit(content=None,
+                                                 embed=self.cog.lobby_embed(interaction.guild, self.game),
+                                                 view=self.cog.StartEndView(self.cog, self.game))
+                else:
+                    self.request_update()
+
                 # 참여 로그 전송
                 log_ch = self.cog._get_join_leave_log_channel(interaction.guild)
                 if log_ch:
                     await log_ch.send(f"👋 `{interaction.user.display_name}`님이 내전 #{self.game.id}에 참여했습니다.")
-                
-                await self.update_message()
 
-                if self.game.is_full():
+                if full:
+                    # DM은 백그라운드로 보내고 바로 다음 단계로
+                    dms.fan_out(
+                        (interaction.guild.get_member(uid) for uid in self.game.participants),
+                        f"📢 내전 #{self.game.id} 참가자가 모두 모였습니다!\n"
+                        f"팀장 선택이 곧 시작됩니다. 채널로 돌아와주세요!"
+                    )
+
                     sorted_list = await self.cog.get_sorted_participants_by_tier(interaction.guild, self.game.participants)
                     embed = discord.Embed(title="📋 티어 기준 정렬된 참여자", color=0x2F3136)
                     embed.description = "\n".join([f"{i+1}. {entry}" for i, entry in enumerate(sorted_list)])
                     await interaction.channel.send(embed=embed)
-
-                    self.clear_items()
-                    await self.game.message.edit(view=self.cog.StartEndView(self.cog, self.game))
-
-                    for uid in self.game.participants:
-                        member = interaction.guild.get_member(uid)
-                        if member:
-                            try:
-                                await member.send(
-                                    f"📢 내전 #{self.game.id} 참가자가 모두 모였습니다!\n"
-                                    f"팀장 선택이 곧 시작됩니다. 채널로 돌아와주세요!"
-                                )
-                            except:
-                                pass
             else:
                 try:
                     await interaction.followup.send("이미 참여했거나 모집이 마감되었습니다.", ephemeral=True)
@@ -557,13 +1074,14 @@ class MatchCog(commands.Cog):
         async def cancel(self, interaction: discord.Interaction, button: Button):
             user_id = interaction.user.id
             if self.game.remove_participant(user_id):
+                await interaction.response.defer()
+                self.request_update()
+                self.cog.save_games()
+
                 # 참여 취소 로그 전송
                 log_ch = self.cog._get_join_leave_log_channel(interaction.guild)
                 if log_ch:
                     await log_ch.send(f"🚪 `{interaction.user.display_name}`님이 내전 #{self.game.id}에서 참여를 취소했습니다.")
-                
-                await self.update_message()
-                await interaction.response.defer()
             else:
                 if user_id == self.game.host_id:
                     await interaction.response.send_message("개최자는 참여를 취소할 수 없습니다.", ephemeral=True)
@@ -582,32 +1100,69 @@ class MatchCog(commands.Cog):
                 color=0x2F3136
             )
             await interaction.response.edit_message(embed=embed, view=None)
-            self.cog.games.pop(self.game.id, None)
-            self.cog.active_hosts.discard(self.game.host_id)
+            self.cog.transition(self.game, GameState.CANCELLED)
+            self.cog.save_games()
 
     class StartEndView(View):
         def __init__(self, cog: "MatchCog", game: Game):
             super().__init__(timeout=None)
             self.cog = cog
             self.game = game
+            game.attach(self)
             # 10명이 모인 후에도 참여 취소 가능하도록 버튼 추가
-            self.add_item(Button(label="시작", style=discord.ButtonStyle.primary, custom_id="start"))
-            self.add_item(Button(label="취소", style=discord.ButtonStyle.secondary, custom_id="cancel"))  # 추가
-            self.add_item(Button(label="종료", style=discord.ButtonStyle.danger, custom_id="end"))
+            self.add_item(Button(label="시작", style=discord.ButtonStyle.primary, custom_id=f"match:{game.id}:start"))
+            self.add_item(Button(label="취소", style=discord.ButtonStyle.secondary, custom_id=f"match:{game.id}:cancel"))  # 추가
+            self.add_item(Button(label="종료", style=discord.ButtonStyle.danger, custom_id=f"match:{game.id}:end"))
+            self.add_item(Button(label="자동 밸런스", style=discord.ButtonStyle.success, emoji="⚖️",
+                                 custom_id=f"match:{game.id}:auto"))
+            # 다 찬 로비: 대기열 등록/해제 (빈자리나 다음 로비에 자동 참여)
+            self.add_item(Button(label="대기", style=discord.ButtonStyle.secondary, emoji="⏳",
+                                 custom_id=f"match:{game.id}:queue"))
 
         async def interaction_check(self, interaction: discord.Interaction) -> bool:
-            if interaction.data["custom_id"] == "start":
+            action = interaction.data["custom_id"].rsplit(":", 1)[-1]
+            if action == "queue":
+                user_id = interaction.user.id
+                lobbies = self.cog.lobbies
+                if user_id in self.game.participants:
+                    await interaction.response.send_message("이미 이 내전에 참여 중입니다.", ephemeral=True)
+                elif lobbies.queued_in(user_id) == self.game.channel_id:
+                    lobbies.dequeue(user_id)
+                    await interaction.response.send_message("대기열에서 빠졌습니다.", ephemeral=True)
+                else:
+                    position = lobbies.enqueue(self.game.channel_id, user_id)
+                    await interaction.response.send_message(
+                        f"대기열 {position}번째로 등록되었습니다. 자리가 나면 자동으로 참여돼요. "
+                        f"(다시 누르면 취소)", ephemeral=True)
+                self.cog.save_games()
+                return True
+
+            elif action == "auto":
+                if interaction.user.id != self.game.host_id:
+                    await interaction.response.send_message("게임 시작은 개최자만 가능합니다.", ephemeral=True)
+                    return False
+                self.cog.transition(self.game, GameState.DRAFTING)
+
+                embed = discord.Embed(title="자동 밸런스", description="실력 차이가 가장 작은 팀 구성을 찾습니다!",
+                                      color=0x2F3136)
+                await interaction.response.edit_message(embed=embed, view=None)
+                self.stop()
+                await self.cog.start_auto_balance(interaction, self.game)
+                return True
+
+            elif action == "start":
                 if interaction.user.id != self.game.host_id:
                     await interaction.response.send_message("게임 시작은 개최자만 가능합니다.", ephemeral=True)
                     return False
-                self.game.started = True
+                self.cog.transition(self.game, GameState.DRAFTING)
 
                 embed = discord.Embed(title="팀장 선택", description="팀장 선택을 시작합니다!", color=0x2F3136)
                 await interaction.response.edit_message(embed=embed, view=None)
+                self.stop()
                 await self.cog.start_team_leader_selection(interaction, self.game)
                 return True
 
-            elif interaction.data["custom_id"] == "cancel":
+            elif action == "cancel":
                 # 10명이 모인 후에도 참여 취소 가능
                 user_id = interaction.user.id
                 if self.game.remove_participant(user_id):
@@ -616,14 +1171,29 @@ class MatchCog(commands.Cog):
                     if log_ch:
                         await log_ch.send(f"🚪 `{interaction.user.display_name}`님이 내전 #{self.game.id}에서 참여를 취소했습니다.")
                     
+                    # 대기열 맨 앞 사람이 빈자리를 채움
+                    promoted = self.cog.lobbies.pop_queue(self.game.channel_id, 1,
+                                                          exclude=self.game.participants)
+                    for uid in promoted:
+                        self.game.add_participant(uid)
+                    if promoted:
+                        member = interaction.guild.get_member(promoted[0])
+                        await interaction.response.edit_message(
+                            content=f"<@{promoted[0]}> 대기열에서 자동 참여했습니다!",
+                            embed=self.cog.lobby_embed(interaction.guild, self.game), view=self,
+                            allowed_mentions=discord.AllowedMentions(users=True))
+                        dms.fan_out([member], f"📢 대기하던 내전 #{self.game.id}에 자리가 나서 자동으로 참여되었습니다!")
                     # 10명 미만이 되면 다시 LobbyView로 돌아감
-                    if not self.game.is_full():
+                    elif not self.game.is_full():
                         self.clear_items()
                         lobby_view = self.cog.LobbyView(self.cog, self.game)
-                        await lobby_view.update_message()
-                        await interaction.response.edit_message(view=lobby_view)
+                        lobby_view.last_edit = time.monotonic()
+                        await interaction.response.edit_message(
+                            content=None, embed=self.cog.lobby_embed(interaction.guild, self.game), view=lobby_view)
+                        self.stop()
                     else:
                         await interaction.response.defer()
+                    self.cog.save_games()
                 else:
                     if user_id == self.game.host_id:
                         await interaction.response.send_message("개최자는 참여를 취소할 수 없습니다.", ephemeral=True)
@@ -631,29 +1201,140 @@ class MatchCog(commands.Cog):
                         await interaction.response.send_message("참여 중이 아닙니다.", ephemeral=True)
                 return True
 
-            elif interaction.data["custom_id"] == "end":
+            elif action == "end":
                 if interaction.user.id != self.game.host_id:
                     await interaction.response.send_message("이 명령은 개최자만 실행할 수 있습니다.", ephemeral=True)
                     return False
 
                 embed = discord.Embed(title="내전 모집 취소", description="내전 모집이 취소되었습니다.", color=0x2F3136)
                 await interaction.response.edit_message(embed=embed, view=None)
-                self.cog.games.pop(self.game.id, None)
-                self.cog.active_hosts.discard(self.game.host_id)
+                self.cog.transition(self.game, GameState.CANCELLED)
+                self.cog.save_games()
                 return True
 
             return True
 
+    class CaptainSelectView(View):
+        def __init__(self, cog: "MatchCog", game: Game, labels: Dict[int, str], ordered: Optional[List[int]] = None):
+            super().__init__(timeout=None)
+            self.cog = cog
+            self.game = game
+            game.attach(self)
+            ordered = ordered if ordered is not None else list(game.participants)
+            self.select = Select(
+                placeholder="팀장을 선택하세요 (두 명)",
+                min_values=2,
+                max_values=2,
+                options=[discord.SelectOption(label=labels.get(uid, str(uid)), value=str(uid)) for uid in ordered],
+                custom_id=f"match:{game.id}:captains",
+            )
+            self.select.callback = self.select_callback
+            self.add_item(self.select)
+
+        async def select_callback(self, inner_interaction: discord.Interaction):
+            game = self.game
+            if inner_interaction.user.id != game.host_id:
+                await inner_interaction.response.send_message("팀장 선택은 개최자만 가능합니다.", ephemeral=True)
+                return
+            if len(game.team_captains) >= 2:
+                await inner_interaction.response.send_message("이미 팀장이 선택되었습니다.", ephemeral=True)
+                return
+
+            game.team_captains = [int(uid) for uid in self.select.values]
+
+            embed = discord.Embed(
+                title="팀장 선택 완료",
+                description="팀장이 선택되었습니다! 팀 구성을 시작합니다.",
+                color=0x2F3136
+            )
+            await inner_interaction.response.edit_message(embed=embed, view=None)
+            self.stop()
+            await self.cog.start_draft(inner_interaction, game)
+
+    class DraftView(View):
+        def __init__(self, cog: "MatchCog", game: Game):
+            super().__init__(timeout=None)
+            self.cog = cog
+            self.game = game
+            game.attach(self, replace=True)   # 픽마다 새로 만들므로 지난 차례 View는 정리
+            draft = game.draft
+            self.turn = draft.turn
+
+            self.select = Select(
+                placeholder=f"{draft.team}팀 픽 대상 선택",
+                min_values=1,
+                max_values=1,
+                options=list(draft.options()),
+                custom_id=f"match:{game.id}:pick:{self.turn}",
+            )
+            self.select.callback = self.select_callback
+            self.add_item(self.select)
+
+            undo = Button(label="↩ 되돌리기", style=discord.ButtonStyle.secondary,
+                          custom_id=f"match:{game.id}:undo:{self.turn}")
+            undo.callback = self.undo_pick
+            self.add_item(undo)
+
+        async def _is_stale(self, interaction: discord.Interaction) -> bool:
+            if self.turn != self.game.draft_turn or self.game.result_message is not None:
+                await interaction.response.send_message("이미 지난 차례입니다.", ephemeral=True)
+                return True
+            return False
+
+        async def select_callback(self, interaction: discord.Interaction):
+            game = self.game
+            if await self._is_stale(interaction):
+                return
+            team_num = game.draft.team
+            captain_id = game.team_captains[team_num - 1]
+            if interaction.user.id != captain_id:
+                await interaction.response.send_message("지금은 다른 팀장의 차례입니다.", ephemeral=True)
+                return
+
+            uid = int(self.select.values[0])
+            if not game.draft.is_available(uid):
+                await interaction.response.send_message("이미 선택된 유저입니다.", ephemeral=True)
+                return
+
+            game.pick(uid)
+            self.stop()
+            await self.cog.advance_draft(interaction, game)
+
+        async def undo_pick(self, interaction: discord.Interaction):
+            game = self.game
+            if interaction.user.id != game.host_id and not interaction.user.guild_permissions.manage_guild:
+                await interaction.response.send_message("되돌리기는 개최자 또는 관리자만 가능합니다.", ephemeral=True)
+                return
+            if await self._is_stale(interaction):
+                return
+
+            if game.undo_pick() is None:
+                await interaction.response.send_message("되돌릴 선택이 없습니다.", ephemeral=True)
+                return
+            self.stop()
+            await self.cog.advance_draft(interaction, game)
+
     class OpggButtonView(View):
         def __init__(self, url1: str, url2: str, timeout: int = 10800):
             super().__init__(timeout=timeout)
             self.add_item(discord.ui.Button(label="🔎 1팀 전적 보기", url=url1, style=discord.ButtonStyle.link))
             self.add_item(discord.ui.Button(label="🔎 2팀 전적 보기", url=url2, style=discord.ButtonStyle.link))
 
-    class BettingView(View):
-        def __init__(self, game: Game):
-            super().__init__(timeout=210)
+    class BettingView(CoalescedEdits, View):
+        def __init__(self, cog: "MatchCog", game: Game):
+            # 마감은 close_betting이 처리 (재시작 후 다시 등록할 수 있도록 timeout 없음)
+            super().__init__(timeout=None)
+            self.cog = cog
             self.game = game
+            game.attach(self)
+            self.bet_team1.custom_id = f"match:{game.id}:bet1"
+            self.bet_team2.custom_id = f"match:{game.id}:bet2"
+            self.timer_key = f"match:{game.id}:odds"
+
+        async def update_message(self):
+            """실시간 배당 갱신"""
+            if self.game.betting_active and self.game.betting_message:
+                await self.game.betting_message.edit(embed=self.cog.betting_embed(self.game), view=self)
 
         @discord.ui.button(label="1팀에 배팅", style=discord.ButtonStyle.success)
         async def bet_team1(self, interaction: discord.Interaction, button: Button):
@@ -671,6 +1352,8 @@ class MatchCog(commands.Cog):
 
         async def handle_bet(self, interaction: discord.Interaction, team: int):
             game = self.game
+            cog = self.cog
+            view = self
 
             class BetModal(Modal, title="배팅 금액 입력"):
                 amount = TextInput(label="배팅할 금액", placeholder="숫자만 입력 (최소 1000P)", required=True)
@@ -682,6 +1365,11 @@ class MatchCog(commands.Cog):
 
                 async def on_submit(self, modal_interaction: discord.Interaction):
                     user_id = modal_interaction.user.id
+                    # 모달을 띄운 사이 배팅이 마감됐거나 내전이 정산/취소됐으면 포인트를 건드리지 않는다
+                    if not self.game.betting_active or self.game.id not in bet_registry:
+                        await modal_interaction.response.send_message("❌ 현재 배팅이 비활성화되었습니다.", ephemeral=True)
+                        return
+
                     try:
                         amount_int = int(self.amount.value)
                         if amount_int < 1000:
@@ -691,16 +1379,39 @@ class MatchCog(commands.Cog):
                         await modal_interaction.response.send_message("❌ 숫자만 입력해 주세요.", ephemeral=True)
                         return
 
-                    if user_id in self.game.bets:
+                    if user_id in self.game.pool:
                         await modal_interaction.response.send_message("❌ 이미 배팅하셨습니다.", ephemeral=True)
                         return
 
+                    if not bet_registry.can_place(user_id, amount_int):
+                        await modal_interaction.response.send_message(
+                            f"❌ 정산 전 배팅 합계는 {bet_registry.limit:,}P까지만 가능합니다. "
+                            f"(현재 {bet_registry.exposure(user_id):,}P, `!내배팅`으로 확인)",
+                            ephemeral=True
+                        )
+                        return
+
                     # 포인트 확인 및 차감
                     if not spend_points(user_id, amount_int):
                         await modal_interaction.response.send_message("❌ 포인트가 부족합니다.", ephemeral=True)
                         return
 
-                    self.game.bets[user_id] = {"amount": amount_int, "team": self.team}
+                    # 재시작 시 환불할 수 있도록 판돈 기록
+                    escrow_id = f"match:{self.game.id}:{user_id}:{uuid.uuid4().hex[:6]}"
+                    open_escrow(
+                        escrow_id, kind="match_bet", user_id=user_id, amount=amount_int,
+                        guild_id=modal_interaction.guild_id or 0,
+                        state={"game_id": self.game.id, "team": self.team},
+                    )
+                    try:
+                        bet_registry.place(self.game.id, user_id, self.team, amount_int, escrow_id)
+                    except ValueError as e:
+                        add_points_many({user_id: amount_int})
+                        close_escrow(escrow_id)
+                        await modal_interaction.response.send_message(f"❌ {e} 배팅 금액은 환불했습니다.", ephemeral=True)
+                        return
+                    cog.save_games()
+                    view.request_update()
                     await modal_interaction.response.send_message(
                         f"✅ {modal_interaction.user.mention}님이 {self.team}팀에 {amount_int}P 배팅했습니다.",
                         ephemeral=False
@@ -713,46 +1424,23 @@ class MatchCog(commands.Cog):
             super().__init__(timeout=None)
             self.cog = cog
             self.game = game
-
-        @discord.ui.button(label="1팀 승리", style=discord.ButtonStyle.primary)
-        async def team1_win(self, interaction: discord.Interaction, button: Button):
-            if interaction.user.id != self.game.host_id and not interaction.user.guild_permissions.manage_guild:
-                await interaction.response.send_message("개최자 또는 관리자만 결과를 기록할 수 있습니다.", ephemeral=True)
-                return
-            if self.game.finished:
-                await interaction.response.send_message("이미 결과가 기록되었습니다.", ephemeral=True)
-                return
-
-            # 배팅 비활성화
-            self.game.disable_betting()
-
-            uids_team1 = list(set([self.game.team_captains[0]] + self.game.teams[1]))
-            uids_team2 = list(set([self.game.team_captains[1]] + self.game.teams[2]))
-
-            for uid in uids_team1:
-                update_result_dual(str(uid), True)
-            for uid in uids_team2:
-                update_result_dual(str(uid), False)
-
-            # 배당 결과 계산
-            betting_result = self.cog.calculate_betting_results(self.game, 1)
-
-            self.game.finished = True
-            self.game.result_recorded = True
-            self.team1_win.disabled = True
-            self.team2_win.disabled = True
-            self.cancel_game.disabled = True
+            game.attach(self)
+            self.team1_win.custom_id = f"match:{game.id}:win1"
+            self.team2_win.custom_id = f"match:{game.id}:win2"
+            self.cancel_game.custom_id = f"match:{game.id}:cancel_result"
+            if game.finished:  # 재시작 후 복원: 기록이 끝난 상태 그대로
+                self.team1_win.disabled = True
+                self.team2_win.disabled = True
+                self.cancel_game.disabled = True
+            if game.result_recorded:
+                self.add_followup_buttons()
+
+        def add_followup_buttons(self):
             self.add_item(MatchCog.PlayAgainButton(self.cog, self.game))
             self.add_item(MatchCog.RevengeButton(self.cog, self.game))
             self.add_item(MatchCog.EndGameButton(self.cog, self.game))
 
-            embed = interaction.message.embeds[0]
-            embed.add_field(name="결과", value="✅ 1팀 승리!", inline=False)
-            embed.add_field(name="🪙 배당 결과", value=betting_result, inline=False)
-            await interaction.response.edit_message(embed=embed, view=self)
-
-        @discord.ui.button(label="2팀 승리", style=discord.ButtonStyle.danger)
-        async def team2_win(self, interaction: discord.Interaction, button: Button):
+        async def record_win(self, interaction: discord.Interaction, winner: int):
             if interaction.user.id != self.game.host_id and not interaction.user.guild_permissions.manage_guild:
                 await interaction.response.send_message("개최자 또는 관리자만 결과를 기록할 수 있습니다.", ephemeral=True)
                 return
@@ -765,29 +1453,40 @@ class MatchCog(commands.Cog):
 
             uids_team1 = list(set([self.game.team_captains[0]] + self.game.teams[1]))
             uids_team2 = list(set([self.game.team_captains[1]] + self.game.teams[2]))
+            winners, losers = (uids_team1, uids_team2) if winner == 1 else (uids_team2, uids_team1)
 
-            for uid in uids_team1:
-                update_result_dual(str(uid), False)
-            for uid in uids_team2:
-                update_result_dual(str(uid), True)
+            # 전적은 모드(내전/스크림) 카운터에 한 번만 기록, 레이팅은 내전만
+            record_results(winners, losers, self.game.mode)
+            rollups.record_results(winners, losers, self.game.mode)
+            rankings.invalidate()
+            rating_delta = ratings.apply_result(uids_team1, uids_team2, winner) if self.game.mode == "내전" else None
 
             # 배당 결과 계산
-            betting_result = self.cog.calculate_betting_results(self.game, 2)
+            betting_result = self.cog.calculate_betting_results(self.game, winner)
+            self.cog.append_history(self.game, winner, rating_delta)
 
-            self.game.finished = True
-            self.game.result_recorded = True
+            self.cog.transition(self.game, GameState.SETTLED)
             self.team1_win.disabled = True
             self.team2_win.disabled = True
             self.cancel_game.disabled = True
-            self.add_item(MatchCog.PlayAgainButton(self.cog, self.game))
-            self.add_item(MatchCog.RevengeButton(self.cog, self.game))
-            self.add_item(MatchCog.EndGameButton(self.cog, self.game))
+            self.add_followup_buttons()
+            self.cog.save_games()
 
             embed = interaction.message.embeds[0]
-            embed.add_field(name="결과", value="✅ 2팀 승리!", inline=False)
-            embed.add_field(name="💸 배당 결과", value=betting_result, inline=False)
+            embed.add_field(name="결과", value=f"✅ {winner}팀 승리!", inline=False)
+            if rating_delta is not None:
+                embed.add_field(name="📈 레이팅", value=f"1팀 {rating_delta:+.1f} / 2팀 {-rating_delta:+.1f}", inline=False)
+            embed.add_field(name="🪙 배당 결과" if winner == 1 else "💸 배당 결과", value=betting_result, inline=False)
             await interaction.response.edit_message(embed=embed, view=self)
 
+        @discord.ui.button(label="1팀 승리", style=discord.ButtonStyle.primary)
+        async def team1_win(self, interaction: discord.Interaction, button: Button):
+            await self.record_win(interaction, 1)
+
+        @discord.ui.button(label="2팀 승리", style=discord.ButtonStyle.danger)
+        async def team2_win(self, interaction: discord.Interaction, button: Button):
+            await self.record_win(interaction, 2)
+
         @discord.ui.button(label="취소", style=discord.ButtonStyle.secondary)
         async def cancel_game(self, interaction: discord.Interaction, button: Button):
             if interaction.user.id != self.game.host_id and not interaction.user.guild_permissions.manage_guild:
@@ -798,16 +1497,16 @@ class MatchCog(commands.Cog):
                 return
 
             # 배팅 환불
-            for user_id, bet in self.game.bets.items():
-                add_points(user_id, bet["amount"])
+            self.cog.refund_bets(self.game)
 
             # 배팅 비활성화
             self.game.disable_betting()
 
-            self.game.finished = True
+            self.cog.transition(self.game, GameState.CANCELLED)
             self.team1_win.disabled = True
             self.team2_win.disabled = True
             self.cancel_game.disabled = True
+            self.cog.save_games()
 
             embed = interaction.message.embeds[0]
             embed.add_field(name="결과", value="❌ 게임이 취소되었습니다. 배팅 금액이 환불되었습니다.", inline=False)
@@ -815,7 +1514,7 @@ class MatchCog(commands.Cog):
 
     class PlayAgainButton(Button):
         def __init__(self, cog: "MatchCog", game: Game):
-            super().__init__(label="팀다시뽑기!", style=discord.ButtonStyle.secondary)
+            super().__init__(label="팀다시뽑기!", style=discord.ButtonStyle.secondary, custom_id=f"match:{game.id}:again")
             self.cog = cog
             self.game = game
 
@@ -826,26 +1525,15 @@ class MatchCog(commands.Cog):
 
             old_game = self.game
 
-            new_game_id = self.cog.game_counter
-            self.cog.game_counter += 1
+            new_game_id = self.cog._next_game_id()
 
-            new_game = Game(new_game_id, old_game.host_id, old_game.channel_id, old_game.max_players)
+            new_game = Game(new_game_id, old_game.host_id, old_game.channel_id, old_game.max_players,
+                            old_game.guild_id, old_game.mode)
             new_game.participants = list(old_game.participants)
-            self.cog.games[new_game_id] = new_game
-
-            participants_list = ""
-            for idx, user_id in enumerate(new_game.participants, 1):
-                member = interaction.guild.get_member(user_id)
-                if member:
-                    participants_list += f"{idx}. {member.display_name}\n"
-
-            embed = discord.Embed(
-                title=f"내전 #{new_game_id} - {interaction.guild.get_member(new_game.host_id).display_name}",
-                description=f"인원: {len(new_game.participants)}/{new_game.max_players}",
-                color=0x2F3136
-            )
-            embed.add_field(name="참여자", value=participants_list or "아직 참여자가 없습니다.", inline=False)
+            self.cog.register_game(new_game)
+            self.cog.evict(old_game)
 
+            embed = self.cog.lobby_embed(interaction.guild, new_game)
             view = self.cog.LobbyView(self.cog, new_game)
             if new_game.is_full():
                 view.clear_items()
@@ -853,6 +1541,7 @@ class MatchCog(commands.Cog):
 
             message = await interaction.channel.send(embed=embed, view=view)
             new_game.message = message
+            self.cog.save_games()
 
             end_embed = discord.Embed(title="내전 종료", description="✅ 새로운 내전이 생성되었습니다!", color=0x2F3136)
             await interaction.response.edit_message(embed=end_embed, view=None)
@@ -862,7 +1551,7 @@ class MatchCog(commands.Cog):
 
     class RevengeButton(Button):
         def __init__(self, cog: "MatchCog", game: Game):
-            super().__init__(label="한판 더!", style=discord.ButtonStyle.success)
+            super().__init__(label="한판 더!", style=discord.ButtonStyle.success, custom_id=f"match:{game.id}:revenge")
             self.cog = cog
             self.game = game
 
@@ -873,38 +1562,21 @@ class MatchCog(commands.Cog):
 
             old_game = self.game
 
-            new_game_id = self.cog.game_counter
-            self.cog.game_counter += 1
+            new_game_id = self.cog._next_game_id()
 
-            new_game = Game(new_game_id, old_game.host_id, old_game.channel_id, old_game.max_players)
+            new_game = Game(new_game_id, old_game.host_id, old_game.channel_id, old_game.max_players,
+                            old_game.guild_id, old_game.mode)
             new_game.participants = list(old_game.participants)
             new_game.team_captains = list(old_game.team_captains)
             new_game.teams = {1: list(old_game.teams[1]), 2: list(old_game.teams[2])}
-            new_game.started = True
+            new_game.state = GameState.PLAYING
 
-            self.cog.games[new_game_id] = new_game
+            self.cog.register_game(new_game)
+            self.cog.evict(old_game)
 
             guild = interaction.guild
-            team1_members, team2_members = [], []
-
-            for uid in new_game.teams[1]:
-                member = guild.get_member(uid)
-                name = member.display_name if member else "알 수 없음"
-                if uid == new_game.team_captains[0]:
-                    team1_members.insert(0, f"⭐ {name}")
-                else:
-                    team1_members.append(f"- {name}")
-
-            for uid in new_game.teams[2]:
-                member = guild.get_member(uid)
-                name = member.display_name if member else "알 수 없음"
-                if uid == new_game.team_captains[1]:
-                    team2_members.insert(0, f"⭐ {name}")
-                else:
-                    team2_members.append(f"- {name}")
-
-            t1 = "\n".join(team1_members)
-            t2 = "\n".join(team2_members)
+            t1, _ = self.cog.team_roster(guild, new_game, 1)
+            t2, _ = self.cog.team_roster(guild, new_game, 2)
 
             embed = discord.Embed(title=f"내전 #{new_game_id} 한판 더 매치!", color=0x2F3136)
             embed.add_field(name="1팀", value=t1 or "- 없음", inline=True)
@@ -913,16 +1585,17 @@ class MatchCog(commands.Cog):
             view = self.cog.ResultView(self.cog, new_game)
             result_message = await interaction.channel.send(embed=embed, view=view)
             new_game.result_message = result_message
+            new_game.result_deadline = time.time() + RESULT_TIMEOUT_SEC
 
-            asyncio.create_task(self.cog.disable_buttons_after_timeout(result_message, view, 10800))
+            self.cog.schedule_result_timeout(new_game, view, RESULT_TIMEOUT_SEC)
 
             end_embed = discord.Embed(title="내전 종료", description="✅ 한판 더 매치가 생성되었습니다!", color=0x2F3136)
             await interaction.response.edit_message(embed=end_embed, view=None)
-            await interaction.channel.send(view=self.cog.BettingView(new_game))
+            await self.cog.open_betting(interaction.channel, new_game)
 
     class EndGameButton(Button):
         def __init__(self, cog: "MatchCog", game: Game):
-            super().__init__(label="종료", style=discord.ButtonStyle.danger)
+            super().__init__(label="종료", style=discord.ButtonStyle.danger, custom_id=f"match:{game.id}:endgame")
             self.cog = cog
             self.game = game
 
@@ -931,12 +1604,12 @@ class MatchCog(commands.Cog):
                 await interaction.response.send_message("개최자 또는 관리자만 한판 더 진행할 수 있습니다.", ephemeral=True)
                 return
 
-            self.cog.active_hosts.discard(self.game.host_id)
-            self.cog.games.pop(self.game.id, None)
+            self.cog.evict(self.game)
+            self.cog.save_games()
 
             for child in self.view.children:
                 child.disabled = True
 
             embed = interaction.message.embeds[0]
             embed.add_field(name="상태", value="🛑 게임이 종료되었습니다.", inline=False)
-            await interaction.response.edit_message(embed=embed, view=self.view)
\ No newline at end of file
+            await interaction.response.edit_message(embed=embed, view=self.view)
@@ -4,6 +4,10 @@ import discord
 from discord.ext import commands
 from typing import Dict, Optional, Set
 
+from utils.timers import timers
+
+CLEAN_CONFIRM_TIMEOUT = 30  # 청소 확인창 유지 시간(초)
+
 class ModerationCog(commands.Cog):
     """욕설 필터, 스팸 단어 관리, 청소 등"""
     def __init__(self, bot: commands.Bot, role_ids: Optional[Dict[str, int]] = None):
@@ -91,11 +95,17 @@ class ModerationCog(commands.Cog):
 
     # ---- 청소 ----
     class ConfirmCleanView(discord.ui.View):
-        def __init__(self, parent: "ModerationCog", ctx: commands.Context, amount: int, *, timeout: float = 30):
-            super().__init__(timeout=timeout)
+        def __init__(self, parent: "ModerationCog", ctx: commands.Context, amount: int):
+            # 만료는 전역 타이머가 처리 (ModerationCog.expire_clean_prompt)
+            super().__init__(timeout=None)
             self.parent = parent
             self.ctx = ctx
             self.amount = amount
+            self.timer_key = f"clean:{ctx.message.id}"
+
+        def stop(self) -> None:
+            timers.cancel(self.timer_key)
+            super().stop()
 
         async def _deny_others(self, interaction: discord.Interaction) -> bool:
             if interaction.user.id != self.ctx.author.id:
@@ -167,15 +177,18 @@ class ModerationCog(commands.Cog):
         )
         view = ModerationCog.ConfirmCleanView(self, ctx, amount)
         prompt = await ctx.send(embed=embed, view=view)
+        timers.schedule(view.timer_key, CLEAN_CONFIRM_TIMEOUT, self.expire_clean_prompt, view, prompt)
+
+    async def expire_clean_prompt(self, view: "ModerationCog.ConfirmCleanView", prompt: discord.Message):
+        """응답 없이 시간이 지난 확인창 정리"""
+        view.stop()
+        try:
+            await prompt.delete()
+        except discord.HTTPException:
+            pass
 
-        async def _cleanup_when_timeout():
-            await view.wait()
-            if prompt and prompt.channel and any(i for i in view.children):
-                try:
-                    await prompt.delete()
-                except discord.HTTPException:
-                    pass
-        self.bot.loop.create_task(_cleanup_when_timeout())
+    async def cog_unload(self):
+        timers.cancel_prefix("clean:")
 
     @clean.error
     async def clean_error(self, ctx: commands.Context, error: commands.CommandError):
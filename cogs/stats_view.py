@@ -1,29 +1,82 @@
 # cogs/stats_view.py
 import discord
-import re
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from discord.ext import commands
 from typing import Optional
+import io
 import urllib.parse
 
-from utils.stats import load_stats, ensure_user
+from utils.stats import cached_stats, result_record, RESULT_KEYS
+from utils.rollups import rollups, WINDOWS, today_kst
+from utils.rankings import rankings, Ranking, RankRow
+from utils.cards import cards, CardInput
+from utils.match_history import match_history, player_team
+from utils.pair_stats import pair_stats, PairRecord
+from utils.rating import ratings, RATING_MIN_GAMES
+from utils.profile import profiles
 
+KST = ZoneInfo("Asia/Seoul")
+RECENT_MATCHES_MAX = 10
+DUO_MIN_GAMES = 3   # 시너지 순위에 넣을 최소 같은 팀/상대 판수
+DUO_TOP_K = 5
+WINDOW_RANK_MIN_GAMES = 5   # 기간 랭킹(!내전랭킹 이번주 등)에 올릴 최소 참여
+RANK_PAGE_SIZE = 10
+RANK_VIEW_TIMEOUT = 180     # 페이지 버튼 유지 시간(초)
+CARD_TREND_GAMES = 20       # 카드 레이팅 추이에 쓸 최근 내전 수
 
-RIOT_ID_RE = re.compile(r'^\s*(?P<riot>[^/\n]+?)(?:/|$)')
 
-def extract_riot_id(display_name: str) -> Optional[str]:
-    """디스플레이 네임에서 '소환사명#태그'만 추출하고 태그 오탈자 보정."""
-    m = RIOT_ID_RE.search(display_name or "")
-    if not m:
-        return None
-    riot = m.group("riot").strip()
-    if "#" not in riot:
-        return None
+def _kst_day_start(text: str) -> float:
+    """'YYYY-MM-DD' (KST) → 그날 0시 epoch 초"""
+    return datetime.strptime(text, "%Y-%m-%d").replace(tzinfo=KST).timestamp()
+
+
+def _format_match_line(guild: discord.Guild, record: dict, viewer_id: int | None = None) -> str:
+    """내전 기록 한 줄: 날짜 · 번호 · 승리팀 · (본인 결과) · 팀장"""
+    when = datetime.fromtimestamp(record["ts"], KST).strftime("%m/%d %H:%M")
+    names = []
+    for cid in record.get("captains", []):
+        m = guild.get_member(int(cid)) if guild else None
+        names.append(m.display_name if m else str(cid))
+    line = f"`{when}` #{record['id']} · {record['winner']}팀 승"
+    if viewer_id is not None:
+        team = player_team(record, viewer_id)
+        if team is not None:
+            line += " · ✅ 승" if team == record["winner"] else " · ❌ 패"
+    if len(names) == 2:
+        line += f" · {names[0]} vs {names[1]}"
+    pool = sum(record.get("bets", {}).values())
+    if pool:
+        line += f" · 배팅 {pool:,}P"
+    return line
+
+
+def _rating_trend(user_id: int, current: float, k: int = CARD_TREND_GAMES) -> tuple[float, ...]:
+    """최근 레이팅 반영 판들의 변동량을 현재 값에서 거꾸로 빼서 추이 복원 (오래된 → 최신)"""
+    trend = [current]
+    for record in match_history.recent_for(user_id, k):
+        delta = record.get("rating_delta")
+        if delta is None:
+            continue
+        trend.append(trend[-1] - (delta if player_team(record, user_id) == 1 else -delta))
+    return tuple(round(r, 1) for r in reversed(trend))
+
+
+def _rate_text(wins: int, games: int) -> str:
+    if not games:
+        return "기록 없음"
+    return f"{games}전 {wins}승 {games - wins}패 ({wins / games * 100:.1f}%)"
+
+
+def _duo_lines(guild: discord.Guild, rows: list[tuple[int, PairRecord]], *, versus: bool = False) -> str:
+    lines = []
+    for uid, rec in rows:
+        m = guild.get_member(uid) if guild else None
+        name = m.display_name if m else str(uid)
+        text = _rate_text(rec.versus_wins, rec.versus) if versus else _rate_text(rec.together_wins, rec.together)
+        lines.append(f"{name} — {text}")
+    return "\n".join(lines) or "-"
 
-    name, tag = riot.split("#", 1)
-    tag = tag.strip().upper()
-    if tag in {"K1R", "KRI", "KRL", "KRl"}:
-        tag = "KR1"
-    return f"{name.strip()}#{tag}"
 
 class StatsCog(commands.Cog):
     """유저 전적 / 내전 랭킹"""
@@ -31,18 +84,84 @@ class StatsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+    # 멤버가 들어오고 나가면 그 길드 랭킹 목록을 다시 만든다 (현재 멤버만 순위에 올림)
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        rankings.invalidate(member.guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        rankings.invalidate(member.guild.id)
+
+    async def cog_unload(self):
+        cards.close()
+        rollups.flush()   # 모아 둔 기간 집계 저장
+
+    async def send_card(self, ctx: commands.Context, target: discord.Member) -> bool:
+        """전적/레이팅 추이/포인트 카드 이미지 전송 (!전적 … 카드, !지갑 … 카드). 못 그리면 알리고 False."""
+        reason = cards.unavailable_reason
+        if reason is not None:
+            await ctx.reply(f"카드 이미지를 만들 수 없어 기본 화면으로 보여 드려요. ({reason})", delete_after=10)
+            return False
+
+        rec = cached_stats().get(str(target.id), {})
+        total, win, lose = result_record(target.id)
+        rating = float(rec["레이팅"]) if rec.get("레이팅판수") else None
+        avatar = target.display_avatar.replace(size=128, format="png")
+        data = CardInput(
+            name=target.display_name,
+            avatar_key=avatar.key,
+            games=total, wins=win, losses=lose,
+            rating=rating,
+            trend=_rating_trend(target.id, rating) if rating is not None else (),
+            points=int(rec.get("포인트", 0)),
+        )
+
+        async def fetch_avatar():
+            try:
+                return await avatar.read()
+            except discord.HTTPException:
+                return None
+
+        png = await cards.render(data, fetch_avatar)
+        await ctx.send(file=discord.File(io.BytesIO(png), filename="card.png"))
+        return True
+
+    async def _window_stats(self, ctx: commands.Context, target: discord.Member, window: str):
+        """!전적 [@유저] <기간> — 기간 버킷 합계만 조회"""
+        rec = rollups.user(target.id, window)
+        embed = discord.Embed(title=f"{target.display_name} 전적 ({window})", color=0x2F3136)
+        embed.set_thumbnail(url=target.display_avatar.url)
+        for mode, (played, won, lost) in RESULT_KEYS.items():
+            total, win = rec.get(played, 0), rec.get(won, 0)
+            if total or mode == "내전":
+                embed.add_field(name=mode, value=_rate_text(win, total), inline=False)
+        embed.add_field(name="포인트 증감", value=f"{rec.get('포인트', 0):+,} P", inline=False)
+        if window in ("시즌", "지난시즌"):
+            embed.set_footer(text=f"현재 시즌 {rollups.season['id']} · {rollups.season['started']} 시작")
+        await ctx.send(embed=embed)
+
     @commands.command(name="전적", aliases=["정보"])
-    async def stats_command(self, ctx: commands.Context, member: discord.Member | None = None):
+    async def stats_command(self, ctx: commands.Context, member: discord.Member | None = None,
+                            window: str | None = None):
+        """사용법: !전적 [@유저] [오늘/이번주/이번달/지난주/지난달/시즌/지난시즌/카드]"""
         target = member or ctx.author
+        if window == "카드":
+            if await self.send_card(ctx, target):
+                return
+            window = None
+        if window is not None:
+            if window not in WINDOWS:
+                await ctx.reply(f"기간은 {' / '.join(WINDOWS)} 중 하나예요. (카드 이미지는 `카드`)", delete_after=5)
+                return
+            await self._window_stats(ctx, target, window)
+            return
 
-        stats = load_stats()
-        uid = str(target.id)
-        rec = ensure_user(stats, uid)
-
-        total, win, lose = rec["참여"], rec["승리"], rec["패배"]
+        rec = cached_stats().get(str(target.id), {})
+        total, win, lose = result_record(target.id)
         rate = round(win / total * 100, 2) if total else 0.0
 
-        riot_id = extract_riot_id(target.display_name)
+        riot_id = profiles.get(target).riot_id
         fow_url = None
         if riot_id:
             encoded = urllib.parse.quote(riot_id, safe="")
@@ -54,6 +173,11 @@ class StatsCog(commands.Cog):
         embed.add_field(name="승", value=f"{win}", inline=True)
         embed.add_field(name="패", value=f"{lose}", inline=True)
         embed.add_field(name="승률", value=f"{rate}%", inline=True)
+        if rec.get("레이팅판수"):
+            embed.add_field(name="레이팅", value=f"{rec['레이팅']:.0f} ({rec['레이팅판수']}판)", inline=True)
+        scrim_total, scrim_win, scrim_lose = result_record(target.id, "스크림")
+        if scrim_total:
+            embed.add_field(name="스크림", value=f"{scrim_total}전 {scrim_win}승 {scrim_lose}패", inline=True)
 
         if fow_url:
             view = discord.ui.View()
@@ -64,65 +188,264 @@ class StatsCog(commands.Cog):
             embed.set_footer(text="닉네임에서 '소환사명#태그'를 찾지 못했습니다.")
             await ctx.send(embed=embed)
 
+    # ───────── 페이지 랭킹 ─────────
+    class RankingView(discord.ui.View):
+        """◀/▶ 페이지 넘김 (명령 쓴 사람만, 목록은 RankingCache 것을 그대로 씀)"""
+
+        def __init__(self, ctx: commands.Context, title: str, ranking: Ranking, color=0x2F3136):
+            super().__init__(timeout=RANK_VIEW_TIMEOUT)
+            self.ctx = ctx
+            self.title = title
+            self.ranking = ranking
+            self.color = color
+            self.index = 0
+            self.message: discord.Message | None = None
+            self._sync_buttons()
+
+        @property
+        def page_count(self) -> int:
+            return self.ranking.pages(RANK_PAGE_SIZE)
+
+        def _sync_buttons(self):
+            self.prev_page.disabled = self.index == 0
+            self.next_page.disabled = self.index >= self.page_count - 1
+
+        def embed(self) -> discord.Embed:
+            embed = discord.Embed(title=self.title, color=self.color)
+            guild = self.ctx.guild
+            for rank, row in self.ranking.page(self.index, RANK_PAGE_SIZE):
+                member = guild.get_member(row.user_id)
+                embed.add_field(name=f"{rank}. {member.display_name if member else row.user_id}",
+                                value=row.value, inline=False)
+            footer = f"페이지 {self.index + 1}/{self.page_count} · 총 {len(self.ranking.rows)}명"
+            my_rank = self.ranking.positions.get(self.ctx.author.id)
+            if my_rank is not None:
+                footer += f" · 내 순위 {my_rank}위"
+            embed.set_footer(text=footer)
+            return embed
+
+        async def interaction_check(self, interaction: discord.Interaction) -> bool:
+            if interaction.user.id != self.ctx.author.id:
+                await interaction.response.send_message("명령을 입력한 사람만 넘길 수 있어요.", ephemeral=True)
+                return False
+            return True
+
+        async def _show(self, interaction: discord.Interaction, index: int):
+            self.index = max(0, min(index, self.page_count - 1))
+            self._sync_buttons()
+            await interaction.response.edit_message(embed=self.embed(), view=self)
+
+        @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+        async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await self._show(interaction, self.index - 1)
+
+        @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+        async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+            await self._show(interaction, self.index + 1)
+
+        async def on_timeout(self):
+            if self.message:
+                try:
+                    await self.message.edit(view=None)
+                except discord.HTTPException:
+                    pass
+
+    async def _send_ranking(self, ctx: commands.Context, title: str, ranking: Ranking, empty: str, color=0x2F3136):
+        if not ranking.rows:
+            await ctx.send(embed=discord.Embed(title=title, description=empty, color=color))
+            return
+        view = self.RankingView(ctx, title, ranking, color)
+        if view.page_count == 1:
+            await ctx.send(embed=view.embed())
+            return
+        view.message = await ctx.send(embed=view.embed(), view=view)
+
+    def _member_rows(self, guild: discord.Guild, items, value) -> list[RankRow]:
+        """정렬된 (uid, 데이터) 중 현재 길드 멤버만 RankRow 로"""
+        return [RankRow(uid, value(data)) for uid, data in items if guild.get_member(uid)]
+
+    async def _window_rank(self, ctx: commands.Context, window: str):
+        """기간 버킷 합계 기준 승률 랭킹"""
+        season_id = rollups.season["id"]
+        if window in ("시즌", "지난시즌"):
+            title = f"시즌 {season_id - (window == '지난시즌')} 승률 랭킹 (참여 {WINDOW_RANK_MIN_GAMES}회 이상)"
+        else:
+            title = f"{window} 승률 랭킹 (참여 {WINDOW_RANK_MIN_GAMES}회 이상)"
+
+        def build() -> list[RankRow]:
+            members = [(int(uid), rec) for uid, rec in rollups.totals(window).items()
+                       if rec.get("참여", 0) >= WINDOW_RANK_MIN_GAMES]
+            members.sort(key=lambda x: (x[1].get("승리", 0) / x[1]["참여"], x[1]["참여"]), reverse=True)
+            return self._member_rows(ctx.guild, members, lambda rec: _rate_text(rec.get("승리", 0), rec["참여"]))
+
+        ranking = rankings.get(ctx.guild.id, ("winrate", window, today_kst(), season_id), build)
+        await self._send_ranking(ctx, title, ranking, "조건을 만족하는 유저가 없습니다.")
+
     @commands.command(name="내전랭킹")
-    async def rank_command(self, ctx: commands.Context):
-        stats = load_stats()
-        members = [(int(uid), data) for uid, data in stats.items() if data.get("참여", 0) >= 20]
+    async def rank_command(self, ctx: commands.Context, window: str | None = None):
+        """사용법: !내전랭킹 [이번주/이번달/지난주/지난달/시즌/지난시즌] — 생략 시 누적"""
+        if window is not None:
+            if window not in WINDOWS:
+                await ctx.reply(f"기간은 {' / '.join(WINDOWS)} 중 하나예요. (카드 이미지는 `카드`)", delete_after=5)
+                return
+            await self._window_rank(ctx, window)
+            return
+
+        def build() -> list[RankRow]:
+            members = [(int(uid), data) for uid, data in cached_stats().items() if data.get("참여", 0) >= 20]
+            members.sort(key=lambda x: x[1]["승리"] / x[1]["참여"], reverse=True)
+            return self._member_rows(
+                ctx.guild, members,
+                lambda d: f"승률: {round(d['승리'] / d['참여'] * 100, 2)}%\n참여: {d['참여']}전 {d['승리']}승 {d['패배']}패")
 
-        if not members:
+        ranking = rankings.get(ctx.guild.id, "winrate", build)
+        await self._send_ranking(ctx, "내전 승률 랭킹 (참여 20회 이상)", ranking, "참여 20회 이상 유저가 없습니다.")
+
+    @commands.command(name="레이팅랭킹")
+    async def rating_rank_command(self, ctx: commands.Context):
+        top = ratings.leaderboard(20)
+        if not top:
             await ctx.send(embed=discord.Embed(
-                title="내전랭킹",
-                description="참여 20회 이상 유저가 없습니다.",
+                title="레이팅 랭킹",
+                description=f"레이팅 반영 {RATING_MIN_GAMES}판 이상 유저가 없습니다.",
                 color=0x2F3136
             ))
             return
 
-        sorted_list = sorted(
-            members,
-            key=lambda x: (x[1]["승리"] / x[1]["참여"]) if x[1]["참여"] else 0,
-            reverse=True
-        )
-        top10 = sorted_list[:20]
-
-        embed = discord.Embed(title="승률 TOP 20 (참여 20회 이상)", color=0x2F3136)
-        for idx, (uid, data) in enumerate(top10, 1):
+        lines = []
+        for idx, (uid, rating, games) in enumerate(top, 1):
             member = ctx.guild.get_member(uid)
-            if not member:
-                continue
-            winrate = round(data["승리"] / data["참여"] * 100, 2)
-            embed.add_field(
-                name=f"{idx}. {member.display_name}",
-                value=f"승률: {winrate}%\n참여: {data['참여']}전 {data['승리']}승 {data['패배']}패",
-                inline=False
-            )
+            name = member.display_name if member else str(uid)
+            lines.append(f"{idx}. **{name}** — {rating:.0f} ({games}판)")
+
+        embed = discord.Embed(title=f"📈 레이팅 TOP 20 ({RATING_MIN_GAMES}판 이상)", description="\n".join(lines),
+                              color=0x2F3136)
+        my_rank = ratings.rank_of(ctx.author.id)
+        if my_rank is not None:
+            embed.set_footer(text=f"내 순위: {my_rank}위 · {ratings.get(ctx.author.id):.0f}")
         await ctx.send(embed=embed)
 
     @commands.command(name="판수랭킹")
     async def count_command(self, ctx: commands.Context):
-        stats = load_stats()
-        members = [(int(uid), data) for uid, data in stats.items() if data.get("참여", 0) > 0]
+        def build() -> list[RankRow]:
+            members = [(int(uid), data) for uid, data in cached_stats().items() if data.get("참여", 0) > 0]
+            members.sort(key=lambda x: x[1]["참여"], reverse=True)
+            return self._member_rows(ctx.guild, members,
+                                     lambda d: f"{d['참여']}전 ({d['승리']}승 / {d['패배']}패)")
 
-        if not members:
-            await ctx.send(embed=discord.Embed(
-                title="판수 랭킹",
-                description="참여한 유저가 없습니다.",
-                color=0x2F3136
-            ))
+        ranking = rankings.get(ctx.guild.id, "played", build)
+        await self._send_ranking(ctx, "📊 내전 판수 랭킹", ranking, "참여한 유저가 없습니다.", discord.Color.red())
+
+    @commands.command(name="최근내전")
+    async def recent_matches(self, ctx: commands.Context, member: discord.Member | None = None,
+                             count: int = 5):
+        """사용법: !최근내전 [@유저] [개수] — 최근 내전 기록 (멘션 없으면 본인)"""
+        target = member or ctx.author
+        count = max(1, min(count, RECENT_MATCHES_MAX))
+        records = match_history.recent_for(target.id, count)
+        if not records:
+            await ctx.send(f"❌ {target.display_name}님의 내전 기록이 없습니다.")
             return
 
-        sorted_list = sorted(members, key=lambda x: x[1]["참여"], reverse=True)[:20]
+        wins = sum(1 for r in records if player_team(r, target.id) == r["winner"])
+        embed = discord.Embed(
+            title=f"🗂️ {target.display_name}님의 최근 내전",
+            description="\n".join(_format_match_line(ctx.guild, r, target.id) for r in records),
+            color=0x2F3136
+        )
+        embed.set_footer(text=f"최근 {len(records)}판 {wins}승 {len(records) - wins}패 · "
+                              f"전체 기록 {match_history.count_for(target.id)}판")
+        await ctx.send(embed=embed)
 
-        embed = discord.Embed(title="📊 내전 판수 랭킹 (Top 20)", color=discord.Color.red())
-        for idx, (uid, data) in enumerate(sorted_list, 1):
-            member = ctx.guild.get_member(uid)
-            if not member:
-                continue
-            embed.add_field(
-                name=f"{idx}. {member.display_name}",
-                value=f"{data['참여']}전 ({data['승리']}승 / {data['패배']}패)",
-                inline=False
-            )
+    @commands.command(name="내전기록")
+    async def matches_between(self, ctx: commands.Context, start: str, end: str | None = None):
+        """사용법: !내전기록 <YYYY-MM-DD> [YYYY-MM-DD] — 기간(KST, 끝 날짜 포함) 내전 기록"""
+        try:
+            start_ts = _kst_day_start(start)
+            end_ts = _kst_day_start(end or start) + timedelta(days=1).total_seconds()
+        except ValueError:
+            await ctx.reply("날짜는 `YYYY-MM-DD` 형식으로 입력해주세요.", delete_after=5)
+            return
+
+        records = [r for r in match_history.between(start_ts, end_ts)
+                   if r.get("guild_id") in (0, ctx.guild.id)]
+        period = start if not end or end == start else f"{start} ~ {end}"
+        if not records:
+            await ctx.send(f"❌ {period} 기간의 내전 기록이 없습니다.")
+            return
+
+        shown = records[-RECENT_MATCHES_MAX:][::-1]
+        embed = discord.Embed(
+            title=f"🗂️ 내전 기록 ({period})",
+            description="\n".join(_format_match_line(ctx.guild, r) for r in shown),
+            color=0x2F3136
+        )
+        team1 = sum(1 for r in records if r["winner"] == 1)
+        embed.set_footer(text=f"총 {len(records)}판 (1팀 {team1}승 / 2팀 {len(records) - team1}승)"
+                              + (f" · 최근 {len(shown)}판 표시" if len(records) > len(shown) else ""))
         await ctx.send(embed=embed)
 
+    @matches_between.error
+    async def _matches_between_error(self, ctx: commands.Context, error: Exception):
+        if isinstance(error, commands.MissingRequiredArgument):
+            await ctx.reply("사용법: `!내전기록 <YYYY-MM-DD> [YYYY-MM-DD]`", delete_after=7)
+
+    @commands.command(name="시너지")
+    async def synergy(self, ctx: commands.Context, member: discord.Member | None = None):
+        """사용법: !시너지 [@유저] — 같은 팀일 때 승률 최고/최저 듀오, 상대로 만나면 약한 상대"""
+        target = member or ctx.author
+        best = pair_stats.top_duos(target.id, DUO_TOP_K, min_games=DUO_MIN_GAMES)
+        worst = pair_stats.top_duos(target.id, DUO_TOP_K, min_games=DUO_MIN_GAMES, worst=True)
+        rivals = pair_stats.top_rivals(target.id, 3, min_games=DUO_MIN_GAMES)
+        if not (best or rivals):
+            await ctx.send(f"❌ {target.display_name}님은 아직 {DUO_MIN_GAMES}판 이상 함께/상대로 뛴 유저가 없습니다.")
+            return
+
+        embed = discord.Embed(title=f"🤝 {target.display_name}님의 시너지", color=0x2F3136)
+        embed.add_field(name="👍 최고의 듀오", value=_duo_lines(ctx.guild, best), inline=False)
+        embed.add_field(name="👎 최악의 듀오", value=_duo_lines(ctx.guild, worst), inline=False)
+        embed.add_field(name="😈 천적 (상대 전적)", value=_duo_lines(ctx.guild, rivals, versus=True), inline=False)
+        embed.set_footer(text=f"같은 팀/상대 {DUO_MIN_GAMES}판 이상인 유저만 표시")
+        await ctx.send(embed=embed)
+
+    @commands.command(name="상대전적")
+    async def head_to_head(self, ctx: commands.Context, a: discord.Member, b: discord.Member | None = None):
+        """사용법: !상대전적 @A [@B] — A와 B(생략 시 본인)의 같은 팀/상대 팀 전적"""
+        if b is None:
+            a, b = ctx.author, a
+        if a.id == b.id:
+            await ctx.reply("서로 다른 두 유저를 지정해주세요.", delete_after=5)
+            return
+
+        rec = pair_stats.get(a.id, b.id)
+        embed = discord.Embed(title=f"⚔️ {a.display_name} vs {b.display_name}", color=0x2F3136)
+        embed.add_field(name="같은 팀", value=_rate_text(rec.together_wins, rec.together), inline=False)
+        embed.add_field(name=f"상대 팀 ({a.display_name} 기준)", value=_rate_text(rec.versus_wins, rec.versus),
+                        inline=False)
+        await ctx.send(embed=embed)
+
+    @head_to_head.error
+    async def _head_to_head_error(self, ctx: commands.Context, error: Exception):
+        if isinstance(error, (commands.MissingRequiredArgument, commands.MemberNotFound)):
+            await ctx.reply("사용법: `!상대전적 @A [@B]`", delete_after=7)
+
+    @commands.has_guild_permissions(administrator=True)
+    @commands.command(name="시즌초기화")
+    async def reset_season(self, ctx: commands.Context):
+        """현재 시즌 집계를 보관하고 새 시즌 시작 (누적 전적/포인트는 그대로)"""
+        ended = rollups.reset_season()
+        rankings.invalidate()
+        await ctx.send(embed=discord.Embed(
+            title=f"🏁 시즌 {ended['id']} 종료",
+            description=(f"기간: {ended['started']} ~ {ended['ended']}\n"
+                         f"시즌 {rollups.season['id']}을 시작합니다. 지난 시즌 순위는 `!내전랭킹 지난시즌`"),
+            color=0x2F3136
+        ))
+
+    @reset_season.error
+    async def _reset_season_error(self, ctx: commands.Context, error: Exception):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.reply("이 명령은 **관리자만** 사용할 수 있어요.", delete_after=5)
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(StatsCog(bot))
@@ -2,7 +2,7 @@ import discord
 from discord.ext import commands
 import os, configparser
 
-from utils.stats import MANG_PATH
+from utils.assets import assets
 
 from cogs.match import MatchCog
 from cogs.economy import EconomyCog
@@ -38,6 +38,8 @@ bot = commands.Bot(command_prefix="!", intents=intents)
 
 @bot.event
 async def setup_hook():
+    # assets/ 이미지를 메모리에 올림 (없는 파일은 여기서 한 번만 출력)
+    assets.load()
     # 내전/모더/이코노미 등 모두 동일 ROLE_IDS 전달
     await bot.add_cog(MatchCog(bot, role_ids=ROLE_IDS))
     await bot.add_cog(
@@ -0,0 +1,20 @@
+# tests/test_bet_registry.py
+"""정산/취소된 내전에는 배팅이 들어가지 않는다"""
+import pytest
+
+from utils.bet_registry import BetRegistry
+from utils.betting_pool import BettingPool
+
+
+def test_place_after_release_raises():
+    registry = BetRegistry()
+    registry.attach(1, BettingPool())
+    registry.place(1, 10, 1, 1000, "match:1:10:abc")
+    assert 1 in registry
+
+    registry.release(1)
+    assert 1 not in registry
+    with pytest.raises(ValueError):
+        registry.place(1, 20, 2, 1000, "match:1:20:def")
+    assert registry.exposure(20) == 0
+    assert not registry.holds_escrow("match:1:20:def")
@@ -0,0 +1,46 @@
+# tests/test_betting_pool.py
+"""내전 배팅 정산 규칙: 지급 합계 = 총 배팅금, 나머지 배분 순서 고정, 승리팀 배팅 없으면 전원 환불"""
+import random
+
+from utils.betting_pool import BettingPool
+
+
+def _pool(*bets: tuple[int, int, int]) -> BettingPool:
+    pool = BettingPool()
+    for uid, team, amount in bets:
+        pool.place(uid, team, amount)
+    return pool
+
+
+def test_payouts_sum_to_pool():
+    rng = random.Random(0)
+    for _ in range(200):
+        bets = [(uid, rng.choice((1, 2)), rng.randint(1000, 50_000)) for uid in range(rng.randint(2, 12))]
+        pool = _pool(*bets)
+        for team in (1, 2):
+            result = pool.settle(team)
+            assert sum(result.payouts.values()) == pool.total
+
+
+def test_leftover_goes_to_largest_remainder_then_amount_then_uid():
+    # 4001 / 3000: 세 명 모두 1333.67 → 남는 2P 는 (나머지·배팅금 같으니) uid 작은 순
+    result = _pool((3, 1, 1000), (1, 1, 1000), (2, 1, 1000), (4, 2, 1001)).settle(1)
+    assert result.payouts == {1: 1334, 2: 1334, 3: 1333}
+    assert result.winners == [1, 2, 3] and result.losers == [4]
+
+    # 3501 / 2500: 10번 2100.6, 11번 1400.4 → 남는 1P 는 소수부가 큰 10번
+    result = _pool((11, 1, 1000), (10, 1, 1500), (12, 2, 1001)).settle(1)
+    assert result.payouts == {10: 2101, 11: 1400}
+
+
+def test_settle_ignores_insertion_order():
+    bets = [(uid, 1 if uid % 3 else 2, 1000 + uid * 7) for uid in range(1, 10)]
+    assert _pool(*bets).settle(1) == _pool(*reversed(bets)).settle(1)
+
+
+def test_refund_all_when_nobody_backed_winner():
+    pool = _pool((1, 2, 3000), (2, 2, 1000))
+    result = pool.settle(1)
+    assert result.refunded
+    assert result.payouts == {1: 3000, 2: 1000}
+    assert result.winners == [] and result.losers == [1, 2]
@@ -0,0 +1,34 @@
+# tests/test_cards.py
+"""전적 카드: 한글 글꼴이 없으면 끄고, close 후에도 다시 그릴 수 있다"""
+import asyncio
+
+import pytest
+
+import utils.cards as card_mod
+from utils.cards import CardInput, CardRenderer
+
+pytest.importorskip("PIL")
+
+DATA = CardInput("유저", "a_1", 10, 6, 4, 1520.0, (1500.0, 1520.0), 1000)
+
+
+def test_missing_font_disables_cards(monkeypatch, tmp_path):
+    monkeypatch.setattr(card_mod, "CARD_FONT_PATH", tmp_path / "card_font.ttf")
+    renderer = CardRenderer()
+    assert not renderer.available
+    assert "card_font.ttf" in renderer.unavailable_reason
+
+
+def test_render_after_close():
+    async def no_avatar():
+        return None
+
+    async def run():
+        renderer = CardRenderer()
+        first = await renderer.render(DATA, no_avatar)
+        renderer.close()
+        renderer.cache = card_mod.CardCache()
+        assert await renderer.render(DATA, no_avatar) == first
+        renderer.close()
+
+    asyncio.run(run())
@@ -0,0 +1,23 @@
+# tests/test_draft_views.py
+"""드래프트는 픽마다 DraftView를 새로 만든다 — 지난 차례 View는 멈추고 내전에서 뺀다"""
+import asyncio
+
+from cogs.match import Game, MatchCog
+from utils.draft import DraftState, snake_order
+
+
+def test_draft_keeps_only_current_view():
+    async def run():
+        game = Game(7, host_id=1, channel_id=100, max_players=4, guild_id=10)
+        game.draft = DraftState([3, 4], snake_order(1, 2))
+        cog = MatchCog.__new__(MatchCog)
+
+        first = MatchCog.DraftView(cog, game)
+        game.pick(3)
+        second = MatchCog.DraftView(cog, game)
+
+        assert game.views == [second]
+        assert first.is_finished()
+        assert not second.is_finished()
+
+    asyncio.run(run())
@@ -0,0 +1,48 @@
+# tests/test_match_restore.py
+"""재시작 복원된 내전의 로비 메시지 갱신 (PartialMessage 는 guild 가 없음)"""
+import asyncio
+from types import SimpleNamespace
+
+import discord
+from discord.ext import commands
+
+from cogs.match import Game, MatchCog
+from utils.lobbies import LobbyIndex
+
+
+class _FakeMessage:
+    def __init__(self):
+        self.guild = None
+        self.edits = []
+
+    async def edit(self, **kwargs):
+        self.edits.append(kwargs)
+
+
+def _restored_game(bot: commands.Bot) -> Game:
+    game = Game(7, host_id=1, channel_id=100, max_players=4, guild_id=10)
+    game.add_participant(2)
+    game.message = SimpleNamespace(id=555)
+    return Game.from_dict(game.to_dict(), bot)
+
+
+def test_restored_lobby_renders_embed():
+    async def run():
+        bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+        restored = _restored_game(bot)
+        assert restored.message is not None and restored.message.id == 555
+        assert restored.message.guild is None   # setup_hook 시점: 길드 캐시 없음
+
+        cog = MatchCog.__new__(MatchCog)
+        cog.bot = bot
+        cog.lobbies = LobbyIndex()
+        restored.message = _FakeMessage()
+        view = MatchCog.LobbyView(cog, restored)
+        await view.update_message()
+        view.stop()
+
+        embed = restored.message.edits[-1]["embed"]
+        assert embed.description == "인원: 2/4"
+        assert embed.fields[0].value.splitlines() == ["1. <@1>", "2. <@2>"]
+
+    asyncio.run(run())
@@ -0,0 +1,78 @@
+# tests/test_rollups.py
+"""기간 집계: 일 버킷 → 주/월 버킷 접기, 기간별 버킷 키, 파일 쓰기 모으기"""
+import asyncio
+from datetime import date
+
+import utils.rollups as rollups_mod
+from utils.rollups import StatRollups
+from utils.timers import timers
+
+DAYS = {date(2026, 10, 16): 100, date(2026, 10, 18): 200, date(2026, 10, 19): 400, date(2026, 10, 20): 800}
+TODAY = date(2026, 10, 20)   # 화요일, 2026-W43
+
+
+def _filled(tmp_path) -> StatRollups:
+    rollups = StatRollups(tmp_path / "stat_rollups.json")
+    for day, amount in DAYS.items():
+        rollups.record_points({1: amount}, today=day)
+    return rollups
+
+
+def test_days_fold_into_week_and_month(tmp_path):
+    rollups = _filled(tmp_path)
+    buckets = rollups._load()["buckets"]
+    assert rollups._load()["folded"] == "2026-10-19"
+    assert buckets["w:2026-W42"] == {"1": {"포인트": 300}}
+    assert buckets["w:2026-W43"] == {"1": {"포인트": 400}}
+    assert buckets["m:2026-10"] == {"1": {"포인트": 700}}
+    assert buckets["s:1"] == {"1": {"포인트": 1500}}
+    assert "w:2026-W44" not in buckets   # 오늘 버킷은 아직 안 접음
+
+
+def test_window_keys(tmp_path):
+    rollups = _filled(tmp_path)
+    assert rollups.window_keys("오늘", TODAY) == ["d:2026-10-20"]
+    assert rollups.window_keys("이번주", TODAY) == ["w:2026-W43", "d:2026-10-20"]
+    assert rollups.window_keys("지난주", TODAY) == ["w:2026-W42"]
+    assert rollups.window_keys("이번달", TODAY) == ["m:2026-10", "d:2026-10-20"]
+    assert rollups.window_keys("지난달", TODAY) == ["m:2026-09"]
+    assert rollups.window_keys("시즌", TODAY) == ["s:1"]
+    assert rollups.window_keys("지난시즌", TODAY) == []
+
+    assert rollups.user(1, "이번주", TODAY) == {"포인트": 1200}
+    assert rollups.user(1, "지난주", TODAY) == {"포인트": 300}
+    assert rollups.user(1, "이번달", TODAY) == {"포인트": 1500}
+    assert rollups.totals("오늘", TODAY) == {"1": {"포인트": 800}}
+
+
+def test_month_boundary_and_retention(tmp_path):
+    rollups = _filled(tmp_path)
+    nov = date(2026, 11, 1)
+    rollups.record_points({1: 50}, today=nov)
+    assert rollups.window_keys("지난달", nov) == ["m:2026-10"]
+    assert rollups.user(1, "지난달", nov) == {"포인트": 1500}
+    assert rollups.user(1, "이번달", nov) == {"포인트": 50}
+
+    rollups.compact(date(2026, 12, 10))   # 35일 지난 일 버킷 정리, 주/월 버킷은 보관
+    buckets = rollups._load()["buckets"]
+    assert not [k for k in buckets if k.startswith("d:2026-10")]
+    assert "w:2026-W42" in buckets and "m:2026-10" in buckets
+
+
+def test_writes_are_batched(tmp_path, monkeypatch):
+    writes = []
+    monkeypatch.setattr(rollups_mod, "_write_json", lambda path, data: writes.append(path))
+
+    async def run():
+        rollups = StatRollups(tmp_path / "stat_rollups.json")
+        for uid in range(20):   # !출석 몰림
+            rollups.record_points({uid: 1500}, today=TODAY)
+        assert writes == []
+        assert rollups.timer_key in timers
+        rollups.flush()
+        assert len(writes) == 1 and rollups.timer_key not in timers
+        rollups.flush()
+        assert len(writes) == 1
+        await timers.close()
+
+    asyncio.run(run())
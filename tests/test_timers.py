@@ -0,0 +1,105 @@
+# tests/test_timers.py
+"""타이머 스케줄러: 시계를 주입하고 run_due() 로 직접 돌린다 (잠들지 않음)"""
+import asyncio
+
+from utils.timers import TimerScheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _setup():
+    clock = _Clock()
+    fired: list[str] = []
+
+    async def record(name: str):
+        fired.append(name)
+
+    return clock, TimerScheduler(clock=clock), fired, record
+
+
+def test_fires_in_deadline_then_schedule_order():
+    async def run():
+        clock, timers, fired, record = _setup()
+        timers.schedule("t:c", 30, record, "c")
+        timers.schedule("t:a", 10, record, "a")
+        timers.schedule("t:b1", 20, record, "b1")
+        timers.schedule("t:b2", 20, record, "b2")
+
+        assert await timers.run_due() == 0
+        clock.now = 20
+        assert await timers.run_due() == 3
+        assert fired == ["a", "b1", "b2"]
+        assert timers.pending == 1 and "t:c" in timers
+        assert timers.remaining("t:c") == 10
+
+    asyncio.run(run())
+
+
+def test_cancelled_timer_is_skipped():
+    async def run():
+        clock, timers, fired, record = _setup()
+        timers.schedule("t:a", 5, record, "a")
+        timers.schedule("t:b", 5, record, "b")
+        assert timers.cancel("t:a")
+        assert not timers.cancel("t:a")
+        assert timers.pending == 1
+
+        clock.now = 5
+        assert await timers.run_due() == 1
+        assert fired == ["b"]
+        assert timers.pending == 0
+
+    asyncio.run(run())
+
+
+def test_rearming_key_replaces_deadline():
+    async def run():
+        clock, timers, fired, record = _setup()
+        timers.schedule("match:1:stale", 10, record, "old")
+        clock.now = 8
+        timers.schedule("match:1:stale", 10, record, "new")   # 연장
+
+        clock.now = 10
+        assert await timers.run_due() == 0
+        clock.now = 18
+        assert await timers.run_due() == 1
+        assert fired == ["new"]
+
+    asyncio.run(run())
+
+
+def test_cancel_prefix():
+    async def run():
+        clock, timers, fired, record = _setup()
+        timers.schedule("match:1:result", 5, record, "m1")
+        timers.schedule("match:2:betting", 5, record, "m2")
+        timers.schedule("gamble:x:timeout", 5, record, "g")
+
+        assert timers.cancel_prefix("match:") == 2
+        clock.now = 5
+        assert await timers.run_due() == 1
+        assert fired == ["g"]
+
+    asyncio.run(run())
+
+
+def test_failing_callback_does_not_block_others():
+    async def run():
+        clock, timers, fired, record = _setup()
+
+        async def boom():
+            raise RuntimeError("x")
+
+        timers.schedule("t:boom", 1, boom)
+        timers.schedule("t:ok", 2, record, "ok")
+        clock.now = 2
+        assert await timers.run_due() == 2
+        assert fired == ["ok"]
+
+    asyncio.run(run())
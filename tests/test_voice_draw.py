@@ -0,0 +1,38 @@
+# tests/test_voice_draw.py
+"""보이스 랜덤: 지급-로그의 시드 + 후보 ID 목록만으로 당첨자를 재현할 수 있다"""
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+from cogs.economy import EconomyCog
+from utils.rng import RNG, parse_seed
+
+
+class _LogChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, **kwargs):
+        self.sent.append(kwargs)
+
+
+def test_logged_seed_replays_winner(monkeypatch):
+    async def run():
+        guild = SimpleNamespace(id=1)
+        candidates = [(SimpleNamespace(id=uid, mention=f"<@{uid}>"), None) for uid in (30, 10, 20)]
+        candidates.sort(key=lambda c: c[0].id)
+        winner, _, rng = EconomyCog._draw_voice_winner(guild, candidates)
+
+        log_ch = _LogChannel()
+        cog = EconomyCog.__new__(EconomyCog)
+        monkeypatch.setattr(cog, "_get_pay_log_channel", lambda g: log_ch)
+        await cog._log_voice_draw(guild, candidates, winner, rng, 1000)
+
+        embed: discord.Embed = log_ch.sent[0]["embed"]
+        seed_text = embed.description.split("**seed:** `")[1].split("`")[0]
+        ids = [int(x) for x in embed.fields[0].value.split(", ")]
+        assert ids == [10, 20, 30]
+        assert RNG.session(parse_seed(seed_text)).choice(ids) == winner.id
+
+    asyncio.run(run())
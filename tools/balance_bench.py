@@ -0,0 +1,73 @@
+# tools/balance_bench.py
+"""
+자동 팀 밸런스 응답 시간 벤치마크
+
+무작위 티어 점수/선호 라인을 가진 로비를 만들어 balance_teams()를 반복 호출하고
+인원별 p50/p99/최대 시간을 출력한다. 10명(전수 탐색) 기준 50ms를 넘으면 종료 코드 1.
+
+사용법 (저장소 루트에서):
+    python -m tools.balance_bench
+    python -m tools.balance_bench --runs 500 --sizes 10 12 14 20
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from utils.team_balance import ALL_LANES, LANES, Player, balance_teams
+
+BUDGET_MS = 50.0
+
+
+def random_lobby(rng: random.Random, n: int, lane_ratio: float) -> list[Player]:
+    players = []
+    for uid in range(n):
+        strength = rng.uniform(0, 3300)
+        if rng.random() < lane_ratio:  # 1~2개 선호 라인
+            lanes = 0
+            for lane in rng.sample(range(len(LANES)), rng.choice((1, 2))):
+                lanes |= 1 << lane
+        else:
+            lanes = ALL_LANES
+        players.append(Player(uid, strength, lanes))
+    return players
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="자동 팀 밸런스 벤치마크")
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 12, 14, 16, 20])
+    parser.add_argument("--lane-ratio", type=float, default=0.7, help="선호 라인을 적은 참가자 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    failed = False
+    print(f"{'인원':>4} {'방식':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'평균 차이':>9} {'라인 OK':>7}")
+    for n in args.sizes:
+        times, diffs, lane_ok, exhaustive = [], [], 0, False
+        for _ in range(args.runs):
+            lobby = random_lobby(rng, n, args.lane_ratio)
+            t0 = time.perf_counter()
+            result = balance_teams(lobby)
+            times.append((time.perf_counter() - t0) * 1000)
+            diffs.append(result.diff)
+            lane_ok += result.lanes_ok
+            exhaustive = result.exhaustive
+        times.sort()
+        p50 = times[len(times) // 2]
+        p99 = times[min(len(times) - 1, int(len(times) * 0.99))]
+        print(f"{n:>4} {'전수' if exhaustive else '휴리':>6} {p50:8.2f} {p99:8.2f} {times[-1]:8.2f} "
+              f"{sum(diffs) / len(diffs):9.1f} {lane_ok / args.runs * 100:6.1f}%")
+        if n == 10 and p99 > BUDGET_MS:
+            failed = True
+
+    if failed:
+        print(f"\n10인 p99가 {BUDGET_MS:.0f}ms를 넘었습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
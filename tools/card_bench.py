@@ -0,0 +1,100 @@
+# tools/card_bench.py
+"""
+전적 카드 렌더 시간 / 캐시 적중률 벤치마크 (Pillow 필요: pip install Pillow)
+
+1) render_card 단독 호출 시간 p50/p99/최대
+2) 유저 N명이 !카드 를 반복 호출하는 흐름 흉내: 요청마다 일정 확률로 그 유저 전적이 바뀌고
+   (= 캐시 키가 바뀜) 인기 유저일수록 자주 호출한다. CardRenderer 를 그대로 써서
+   캐시 적중률, 요청당 응답 시간, 렌더 중 이벤트 루프 최대 지연을 출력한다.
+
+사용법 (저장소 루트에서):
+    python -m tools.card_bench
+    python -m tools.card_bench --renders 300 --requests 5000 --users 200 --change 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from utils.cards import CardInput, CardRenderer, render_card
+
+
+def random_card(rng: random.Random, uid: int) -> CardInput:
+    games = rng.randint(0, 400)
+    wins = rng.randint(0, games)
+    rating = 1500 + rng.uniform(-300, 300) if games >= 5 else None
+    trend = tuple(round(1500 + rng.uniform(-300, 300), 1) for _ in range(rng.randint(2, 20))) if rating else ()
+    return CardInput(f"유저{uid}", f"a_{uid}", games, wins, games - wins, rating, trend, rng.randint(0, 10**6))
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def loop_lag(stop: asyncio.Event, out: list[float], interval: float = 0.005) -> None:
+    """interval 마다 깨어나면서 늦게 깨어난 정도(ms) 기록"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        t0 = loop.time()
+        await asyncio.sleep(interval)
+        out.append((loop.time() - t0 - interval) * 1000)
+
+
+async def simulate(args, rng: random.Random) -> None:
+    renderer = CardRenderer()
+    state = {uid: random_card(rng, uid) for uid in range(args.users)}
+    weights = [1 / (rank + 1) for rank in range(args.users)]   # 인기 유저일수록 자주 조회
+
+    async def no_avatar():
+        return None
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(loop_lag(stop, lags))
+    times = []
+    for uid in rng.choices(range(args.users), weights=weights, k=args.requests):
+        if rng.random() < args.change:
+            state[uid] = random_card(rng, uid)
+        t0 = time.perf_counter()
+        await renderer.render(state[uid], no_avatar)
+        times.append((time.perf_counter() - t0) * 1000)
+    stop.set()
+    await lag_task
+    renderer.close()
+
+    cache = renderer.cache
+    print(f"요청 {args.requests}회 / 유저 {args.users}명 / 전적 변경 확률 {args.change:.0%}")
+    print(f"  캐시 적중률 {cache.hit_rate:.1%} ({cache.hits}/{cache.hits + cache.misses}), "
+          f"캐시 {len(cache)}장 {cache.bytes / 1024:.0f} KiB")
+    print(f"  응답 p50 {percentile(times, 0.5):.2f}ms  p99 {percentile(times, 0.99):.2f}ms  max {max(times):.2f}ms")
+    print(f"  이벤트 루프 지연 p99 {percentile(lags, 0.99):.2f}ms  max {max(lags, default=0):.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="전적 카드 렌더/캐시 벤치마크")
+    parser.add_argument("--renders", type=int, default=200, help="render_card 단독 호출 횟수")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--users", type=int, default=150)
+    parser.add_argument("--change", type=float, default=0.1, help="요청마다 전적이 바뀔 확률")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    times, size = [], 0
+    for i in range(args.renders):
+        card = random_card(rng, i)
+        t0 = time.perf_counter()
+        png = render_card(card, None)
+        times.append((time.perf_counter() - t0) * 1000)
+        size += len(png)
+    print(f"render_card {args.renders}회: p50 {percentile(times, 0.5):.2f}ms  "
+          f"p99 {percentile(times, 0.99):.2f}ms  max {max(times):.2f}ms  평균 {size / args.renders / 1024:.1f} KiB")
+
+    asyncio.run(simulate(args, rng))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# tools/export_matches.py
+"""
+내전 기록 내보내기 (오프라인 분석용)
+
+data/match_history.jsonl 을 한 줄씩 읽어 그대로 흘려보내므로 기록이 많아도 메모리를 거의 쓰지 않는다.
+CSV는 한 판 = 참가자 수만큼의 행(유저 단위)으로 펼쳐 스프레드시트/pandas에서 바로 집계할 수 있게 한다.
+
+사용법 (저장소 루트에서):
+    python -m tools.export_matches                              # 전체 JSONL → stdout
+    python -m tools.export_matches --since 2026-10-01 --format csv -o october.csv
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from utils.match_history import match_history, player_team, match_players
+
+KST = ZoneInfo("Asia/Seoul")
+CSV_FIELDS = ("match_id", "ts", "date_kst", "guild_id", "host_id", "user_id", "team", "captain",
+              "won", "winner", "pool_team1", "pool_team2", "bettors")
+
+
+def _day(text: str | None) -> float | None:
+    if text is None:
+        return None
+    return datetime.strptime(text, "%Y-%m-%d").replace(tzinfo=KST).timestamp()
+
+
+def csv_rows(record: dict):
+    """한 판 → 참가자별 행"""
+    date = datetime.fromtimestamp(record["ts"], KST).strftime("%Y-%m-%d %H:%M")
+    captains = set(record.get("captains", []))
+    bets = record.get("bets", {})
+    for uid in match_players(record):
+        team = player_team(record, uid)
+        yield {
+            "match_id": record["id"],
+            "ts": record["ts"],
+            "date_kst": date,
+            "guild_id": record.get("guild_id", 0),
+            "host_id": record.get("host_id", 0),
+            "user_id": uid,
+            "team": team,
+            "captain": int(uid in captains),
+            "won": int(team == record["winner"]),
+            "winner": record["winner"],
+            "pool_team1": bets.get("1", 0),
+            "pool_team2": bets.get("2", 0),
+            "bettors": record.get("bettors", 0),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="내전 기록 내보내기")
+    parser.add_argument("--since", help="시작 날짜 YYYY-MM-DD (KST, 포함)")
+    parser.add_argument("--until", help="끝 날짜 YYYY-MM-DD (KST, 미포함)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("-o", "--output", help="출력 파일 (생략 시 stdout)")
+    args = parser.parse_args()
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        records = match_history.iter_export(_day(args.since), _day(args.until))
+        if args.format == "csv":
+            writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for record in records:
+                writer.writerows(csv_rows(record))
+        else:
+            for record in records:
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# tools/gamble_sim.py
+"""
+도박 분포 몬테카를로 시뮬레이터 (오프라인 점검용, NumPy 필요: pip install -r requirements-dev.txt)
+
+cogs/gamble_cog.py 의 실제 설정(CRASH_BUCKETS / MULTIPLIER_POOL / MINES_NCELLS / MINES_NUM_BOMBS /
+RPS_WIN_MULTI_RANGE)을
+그대로 읽어 수백만 판을 벡터 연산으로 돌리고 전략별 RTP(환급률)와 하우스 엣지를 출력한다.
+분포를 바꾸기 전에 돌려서 수치를 확인할 것.
+
+사용법 (저장소 루트에서):
+    python -m tools.gamble_sim
+    python -m tools.gamble_sim --n 5000000 --seed 42
+"""
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+
+from cogs.gamble_cog import (
+    CRASH_BUCKETS, CRASH_ALIAS_PROB, CRASH_ALIAS_IDX,
+    MULTIPLIER_POOL, MINES_NCELLS, MINES_NUM_BOMBS, RPS_WIN_MULTI_RANGE, MAX_MULTIPLIER,
+)
+
+CRASH_TARGETS = (1.1, 1.2, 1.3, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0)
+
+
+def sample_crash_points(rng: np.random.Generator, n: int) -> np.ndarray:
+    """roll_crash_point()와 같은 별칭 테이블로 n개 크래시 지점을 한 번에 추첨."""
+    lo = np.array([b[0] for b in CRASH_BUCKETS])
+    hi = np.array([b[1] for b in CRASH_BUCKETS])
+    prob = np.array(CRASH_ALIAS_PROB)
+    alias = np.array(CRASH_ALIAS_IDX)
+
+    idx = rng.integers(len(CRASH_BUCKETS), size=n)
+    idx = np.where(rng.random(n) < prob[idx], idx, alias[idx])
+    return np.round(lo[idx] + (hi[idx] - lo[idx]) * rng.random(n), 2)
+
+
+def crash_rtp(points: np.ndarray, target: float) -> float:
+    """target 배율에서 자동 수령하는 전략의 RTP (크래시 지점이 target 초과일 때만 성공)."""
+    target = min(target, MAX_MULTIPLIER)
+    return float(np.mean(np.where(points > target, target, 0.0)))
+
+
+def mines_rtp(rng: np.random.Generator, n: int, opens: int) -> float:
+    """무작위로 opens칸을 연 뒤 수령하는 전략의 RTP (폭탄을 하나라도 열면 0)."""
+    cells = np.concatenate([np.full(MINES_NUM_BOMBS, np.nan), np.array(MULTIPLIER_POOL)])
+    # 행마다 독립 순열: 난수 행렬 argsort
+    order = np.argsort(rng.random((n, MINES_NCELLS)), axis=1)[:, :opens]
+    picked = cells[order]
+    payout = np.where(np.isnan(picked).any(axis=1), 0.0, np.nansum(picked, axis=1))
+    return float(payout.mean())
+
+
+def rps_rtp(rng: np.random.Generator, n: int) -> float:
+    """가위바위보: 1/3 승리(랜덤 배당), 1/3 비김(환불), 1/3 패배."""
+    outcome = rng.integers(3, size=n)  # 0=승, 1=비김, 2=패
+    lo, hi = RPS_WIN_MULTI_RANGE
+    win_multi = np.round(rng.uniform(lo, hi, size=n), 2)
+    payout = np.select([outcome == 0, outcome == 1], [win_multi, 1.0], default=0.0)
+    return float(payout.mean())
+
+
+def _row(name: str, rtp: float) -> str:
+    return f"  {name:<22} RTP {rtp * 100:7.3f}%   하우스 엣지 {(1 - rtp) * 100:+7.3f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="도박 RTP 몬테카를로 시뮬레이터")
+    parser.add_argument("--n", type=int, default=2_000_000, help="게임별 시뮬레이션 횟수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    n = args.n
+
+    print(f"[!도박2 크래시] n={n:,}")
+    points = sample_crash_points(rng, n)
+    print(f"  평균 크래시 지점 {points.mean():.3f}x / 중앙값 {np.median(points):.2f}x")
+    for t in CRASH_TARGETS:
+        print(_row(f"{t:.2f}x 자동 수령", crash_rtp(points, t)))
+
+    print(f"\n[!도박1 버튼] n={n:,}")
+    for k in range(1, len(MULTIPLIER_POOL) + 1):
+        print(_row(f"{k}칸 열고 수령", mines_rtp(rng, n, k)))
+
+    print(f"\n[!도박3 가위바위보] n={n:,}")
+    print(_row("무작위 선택", rps_rtp(rng, n)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# tools/rating_replay.py
+"""
+내전 레이팅 재계산기 (오프라인, NumPy 필요: pip install numpy)
+
+data/match_history.jsonl 을 처음부터 한 번 훑으면서 여러 (K, 스케일) 조합의 레이팅을 동시에 계산한다.
+레이팅 행렬 R[파라미터, 유저]를 두고 판마다 두 팀 평균 → 기대 승률 → 변동량을
+모든 파라미터 조합에 대해 한 번의 벡터 연산으로 반영하므로 조합을 늘려도 기록은 한 번만 읽는다.
+각 조합의 예측 성능(결과 기록 전 기대 승률 기준 log-loss / 적중률)을 출력해 파라미터 선택에 쓴다.
+
+사용법 (저장소 루트에서):
+    python -m tools.rating_replay                           # 기본 K 후보 비교
+    python -m tools.rating_replay --k 16 24 32 48 --scale 400
+    python -m tools.rating_replay --k 24 --apply            # 첫 번째 조합으로 user_stats.json 덮어쓰기
+"""
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+
+from utils.match_history import match_history
+from utils.rating import RATING_START, RATING_K, RATING_SCALE, RATING_MIN_GAMES, ratings
+
+
+def replay(records: list[dict], ks: np.ndarray, scales: np.ndarray, start: float = RATING_START):
+    """
+    ks, scales: 같은 길이 P의 파라미터 조합.
+    반환: (uids, R[P, N], games[N], logloss[P], accuracy[P])
+    """
+    uids = sorted({int(u) for r in records for t in ("1", "2") for u in r["teams"].get(t, [])})
+    col = {uid: i for i, uid in enumerate(uids)}
+    R = np.full((len(ks), len(uids)), start, dtype=np.float64)
+    games = np.zeros(len(uids), dtype=np.int64)
+    loss = np.zeros(len(ks))
+    hits = np.zeros(len(ks))
+    n = 0
+
+    for r in records:
+        t1 = np.fromiter((col[int(u)] for u in r["teams"].get("1", [])), dtype=np.int64)
+        t2 = np.fromiter((col[int(u)] for u in r["teams"].get("2", [])), dtype=np.int64)
+        if not len(t1) or not len(t2):
+            continue
+        s1 = 1.0 if int(r["winner"]) == 1 else 0.0
+
+        e1 = 1.0 / (1.0 + 10 ** ((R[:, t2].mean(axis=1) - R[:, t1].mean(axis=1)) / scales))
+        p = np.clip(e1 if s1 else 1.0 - e1, 1e-12, 1.0)
+        loss -= np.log(p)
+        hits += (e1 > 0.5) == bool(s1)
+        n += 1
+
+        delta = ks * (s1 - e1)
+        R[:, t1] += delta[:, None]
+        R[:, t2] -= delta[:, None]
+        games[t1] += 1
+        games[t2] += 1
+
+    n = max(n, 1)
+    return uids, R, games, loss / n, hits / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="내전 레이팅 재계산")
+    parser.add_argument("--k", type=float, nargs="+", default=[16, 24, RATING_K, 40, 48], help="K 후보")
+    parser.add_argument("--scale", type=float, nargs="+", default=[RATING_SCALE], help="스케일 후보")
+    parser.add_argument("--top", type=int, default=10, help="조합별 상위 몇 명 출력")
+    parser.add_argument("--apply", action="store_true", help="첫 번째 조합 결과를 user_stats.json에 저장")
+    args = parser.parse_args()
+
+    grid = [(k, s) for s in args.scale for k in args.k]
+    ks = np.array([g[0] for g in grid])
+    scales = np.array([g[1] for g in grid])
+
+    records = [r for r in match_history.iter_export() if r.get("mode", "내전") == "내전"]  # 스크림은 레이팅 제외
+    if not records:
+        print("내전 기록이 없습니다 (data/match_history.jsonl).")
+        return
+
+    uids, R, games, logloss, acc = replay(records, ks, scales)
+    print(f"기록 {len(records):,}판 / 유저 {len(uids):,}명\n")
+    print(f"  {'K':>6} {'scale':>6}  {'log-loss':>9}  {'적중률':>7}")
+    for i, (k, s) in enumerate(grid):
+        print(f"  {k:6.1f} {s:6.0f}  {logloss[i]:9.4f}  {acc[i] * 100:6.2f}%")
+
+    eligible = games >= RATING_MIN_GAMES
+    for i, (k, s) in enumerate(grid):
+        order = np.argsort(-np.where(eligible, R[i], -np.inf))[:args.top]
+        top = ", ".join(f"{uids[j]}:{R[i, j]:.0f}" for j in order if eligible[j])
+        print(f"\n[K={k:g}, scale={s:g}] 상위 {args.top}: {top or '-'}")
+
+    if args.apply:
+        k, s = grid[0]
+        ratings.replace_all({str(uid): (R[0, j], int(games[j])) for j, uid in enumerate(uids)})
+        print(f"\nK={k:g}, scale={s:g} 결과를 user_stats.json에 저장했습니다. "
+              f"(utils/rating.py 상수도 같은 값으로 맞출 것)")
+
+
+if __name__ == "__main__":
+    main()
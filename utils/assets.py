@@ -0,0 +1,128 @@
+# utils/assets.py
+"""
+assets/ 이미지 메모리 레지스트리.
+
+주사위/그래프 도박이 메시지마다 디스크에서 파일 존재 확인 + 읽기를 하던 것을
+시작할 때 assets/ 아래 이미지를 한 번에 읽어 이름(파일명)별 바이트로 들고 있게 한다.
+- discord.File 은 매번 메모리 버퍼로 새로 만든다 (File 객체는 한 번 보내면 재사용 불가).
+- 코드가 쓰는 파일(require 로 등록) 중 없는 것은 로드할 때 한 번만 알린다.
+- 변형(variant): 원본 바이트로 미리 합성해 둔 이미지 (예: 주사위 면 + 결과 문구).
+  로드/리로드 때 한 번만 만들고, 합성에 Pillow 가 필요하면 없을 때 건너뛴다.
+- !에셋리로드 (관리자) 로 재시작 없이 다시 읽는다. 새 목록을 다 만든 뒤 한 번에 바꿔 끼운다.
+"""
+from __future__ import annotations
+import io
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+import discord
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # 변형 합성만 못 함 (원본 이미지는 그대로 사용)
+    Image = ImageDraw = ImageFont = None
+
+ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+
+
+def overlay_text(text: str, fill: tuple[int, int, int], tint: Optional[tuple[int, int, int]] = None
+                 ) -> Callable[[bytes], bytes]:
+    """원본 이미지 위에 (반투명 색을 덮고) 가운데 아래쪽에 문구를 얹는 변형 합성기"""
+    def build(raw: bytes) -> bytes:
+        if Image is None:
+            raise RuntimeError("Pillow 가 설치되어 있지 않음 (pip install Pillow)")
+        img = Image.open(io.BytesIO(raw)).convert("RGBA")
+        if tint:
+            img = Image.alpha_composite(img, Image.new("RGBA", img.size, (*tint, 90)))
+        draw = ImageDraw.Draw(img)
+        font = ImageFont.load_default(max(16, img.height // 4))
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        x, y = (img.width - (right - left)) // 2, img.height - (bottom - top) - img.height // 10
+        draw.text((x, y), text, font=font, fill=fill, stroke_width=max(2, img.height // 60), stroke_fill=(0, 0, 0))
+        out = io.BytesIO()
+        img.save(out, format="PNG")
+        return out.getvalue()
+    return build
+
+
+class LoadReport(NamedTuple):
+    loaded: int
+    variants: int
+    bytes: int
+    missing: list[str]        # require 로 등록했는데 없는 파일
+    failed: list[str]         # 변형 합성 실패 ("이름: 사유")
+
+
+class _Variant(NamedTuple):
+    base: str
+    build: Callable[[bytes], bytes]
+
+
+class AssetRegistry:
+    def __init__(self, root: Path = ASSETS_DIR):
+        self.root = root
+        self.required: set[str] = set()
+        self._variants: dict[str, _Variant] = {}
+        self._data: dict[str, bytes] = {}
+        self.report: Optional[LoadReport] = None
+
+    # ───────── 등록 (모듈 로드 때) ─────────
+    def require(self, *names: str) -> None:
+        """코드가 쓰는 파일 이름 등록 (없으면 로드 때 알림)"""
+        self.required.update(names)
+
+    def variant(self, name: str, base: str, build: Callable[[bytes], bytes]) -> None:
+        """
+        base 이미지로 미리 합성할 변형 등록 — build(원본 바이트) → 새 이미지 바이트.
+        같은 이름의 실제 파일이 assets/에 있으면 그 파일을 쓴다.
+        """
+        self._variants[name] = _Variant(base, build)
+
+    # ───────── 로드 ─────────
+    def load(self) -> LoadReport:
+        data: dict[str, bytes] = {}
+        if self.root.is_dir():
+            for path in sorted(self.root.iterdir()):
+                if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES:
+                    data[path.name] = path.read_bytes()
+
+        built, failed = 0, []
+        for name, (base, build) in self._variants.items():
+            if base not in data or name in data:
+                continue
+            try:
+                data[name] = build(data[base])
+                built += 1
+            except Exception as e:
+                failed.append(f"{name}: {e!r}")
+
+        missing = sorted(n for n in self.required if n not in data)
+        self._data = data
+        self.report = LoadReport(len(data) - built, built, sum(map(len, data.values())), missing, failed)
+        if missing:
+            print(f"[assets] 없는 이미지: {', '.join(missing)} ({self.root})")
+        for line in failed:
+            print(f"[assets] 변형 합성 실패 {line}")
+        return self.report
+
+    def reload(self) -> LoadReport:
+        return self.load()
+
+    # ───────── 조회 ─────────
+    def __contains__(self, name: str) -> bool:
+        return name in self._data
+
+    def get(self, name: str) -> Optional[bytes]:
+        return self._data.get(name)
+
+    def file(self, name: str, filename: Optional[str] = None) -> Optional[discord.File]:
+        """메모리 버퍼로 discord.File 생성 (없으면 None). 임베드는 attachment://{filename} 로 참조."""
+        data = self._data.get(name)
+        if data is None:
+            return None
+        return discord.File(io.BytesIO(data), filename=filename or name)
+
+
+# 봇 전역 에셋 레지스트리 (main.setup_hook 에서 load)
+assets = AssetRegistry()
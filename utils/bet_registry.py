@@ -0,0 +1,124 @@
+# utils/bet_registry.py
+"""
+진행 중인 내전 배팅 전체 레지스트리.
+
+내전마다 BettingPool이 따로 있지만, 유저 기준 조회(!내배팅)와 노출 한도 검사는
+여러 내전을 가로질러야 하므로 여기서 인덱스를 함께 관리한다.
+- 내전 인덱스: game_id → BettingPool (결과 기록/취소 시 한 번에 환불/해제)
+- 유저 인덱스: uid → {game_id: 배팅}, uid → 미정산 배팅 합계(노출)
+- 판돈 인덱스: escrow_id → game_id (재시작 환불 대상 판별)
+
+배팅은 반드시 place()로 넣어 풀과 인덱스가 어긋나지 않게 한다.
+"""
+from __future__ import annotations
+from typing import NamedTuple
+
+from utils.betting_pool import BettingPool
+
+BET_EXPOSURE_LIMIT = 200_000   # 유저 1명이 동시에 걸어 둘 수 있는 미정산 배팅 합계(P)
+
+
+class OpenBet(NamedTuple):
+    game_id: int
+    team: int
+    amount: int
+    potential: int    # 지금 배팅한 팀이 이기면 돌려받을 포인트
+    odds: float
+
+
+class BetRegistry:
+    def __init__(self, limit: int = BET_EXPOSURE_LIMIT):
+        self.limit = limit
+        self._pools: dict[int, BettingPool] = {}
+        self._by_user: dict[int, dict[int, dict]] = {}
+        self._exposure: dict[int, int] = {}
+        self._escrows: dict[str, int] = {}
+
+    # ───────── 내전 등록/해제 ─────────
+    def attach(self, game_id: int, pool: BettingPool) -> None:
+        """내전 풀 등록 (새 내전/재시작 복원). 이미 들어 있는 배팅도 인덱스에 반영."""
+        self.release(game_id)
+        self._pools[game_id] = pool
+        for uid, bet in pool.bets.items():
+            self._index(game_id, uid, bet)
+
+    def release(self, game_id: int) -> BettingPool | None:
+        """내전 인덱스 해제 (정산/환불 후). 풀의 배팅 기록 자체는 건드리지 않는다."""
+        pool = self._pools.pop(game_id, None)
+        if pool is None:
+            return None
+        for uid, bet in pool.bets.items():
+            self._unindex(game_id, uid, bet)
+        return pool
+
+    def _index(self, game_id: int, uid: int, bet: dict) -> None:
+        self._by_user.setdefault(uid, {})[game_id] = bet
+        self._exposure[uid] = self._exposure.get(uid, 0) + int(bet["amount"])
+        if "escrow" in bet:
+            self._escrows[bet["escrow"]] = game_id
+
+    def _unindex(self, game_id: int, uid: int, bet: dict) -> None:
+        bets = self._by_user.get(uid)
+        if bets is not None and bets.pop(game_id, None) is not None:
+            if not bets:
+                del self._by_user[uid]
+            left = self._exposure.get(uid, 0) - int(bet["amount"])
+            if left > 0:
+                self._exposure[uid] = left
+            else:
+                self._exposure.pop(uid, None)
+        self._escrows.pop(bet.get("escrow", ""), None)
+
+    # ───────── 배팅 ─────────
+    def exposure(self, user_id: int) -> int:
+        return self._exposure.get(user_id, 0)
+
+    def can_place(self, user_id: int, amount: int) -> bool:
+        """노출 한도 검사 (spend_points 전에 호출)"""
+        return self._exposure.get(user_id, 0) + int(amount) <= self.limit
+
+    def place(self, game_id: int, user_id: int, team: int, amount: int, escrow_id: str | None = None) -> None:
+        """배팅 기록. 이미 정산/취소된 내전이거나 풀이 거부하면 ValueError (판돈 환불은 호출 측)"""
+        pool = self._pools.get(game_id)
+        if pool is None:
+            raise ValueError("종료된 내전입니다.")
+        pool.place(user_id, team, amount, escrow_id)
+        self._index(game_id, user_id, pool.bets[user_id])
+
+    def refund(self, game_id: int) -> dict[int, int]:
+        """내전 배팅 전액 환불 목록 {uid: 금액} 반환 + 풀 비우기 (포인트 반영은 호출 측)"""
+        pool = self.release(game_id)
+        if pool is None:
+            return {}
+        refunds = pool.refunds()
+        pool.clear()
+        return refunds
+
+    # ───────── 조회 ─────────
+    def open_bets(self, user_id: int) -> list[OpenBet]:
+        out = []
+        for game_id, bet in self._by_user.get(user_id, {}).items():
+            pool = self._pools[game_id]
+            team = int(bet["team"])
+            out.append(OpenBet(game_id, team, int(bet["amount"]),
+                               pool.potential_payout(user_id), pool.odds(team) or 0.0))
+        return sorted(out)
+
+    def __contains__(self, game_id: int) -> bool:
+        """배팅을 받는 중(정산/취소 전)인 내전인지"""
+        return game_id in self._pools
+
+    def holds_escrow(self, escrow_id: str) -> bool:
+        return escrow_id in self._escrows
+
+    def __len__(self) -> int:
+        """등록된 내전 수"""
+        return len(self._pools)
+
+    @property
+    def bettors(self) -> int:
+        return len(self._by_user)
+
+
+# 봇 전역 배팅 레지스트리
+bet_registry = BetRegistry()
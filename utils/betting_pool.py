@@ -0,0 +1,112 @@
+# utils/betting_pool.py
+"""
+내전 배팅 풀 (패리뮤추얼).
+
+한 판의 배팅을 {uid: {"amount", "team", "escrow"}} 그대로 들고 있으면서 팀별 합계를 누적해
+배당(총 배팅금 / 팀 배팅금) 조회를 O(1)로 만든다.
+
+정산은 정수 계산만 쓴다:
+- 당첨자 몫 = floor(배팅금 × 총 배팅금 / 승리팀 배팅금)
+- 나머지(총 배팅금 - 몫 합)는 버림된 소수부가 큰 순(같으면 배팅금 큰 순 → uid 작은 순)으로 1P씩
+  → 지급 합계가 항상 총 배팅금과 같다 (포인트 누수/생성 없음)
+- 승리팀에 건 사람이 없으면 전원 환불
+"""
+from __future__ import annotations
+from typing import NamedTuple, Optional
+
+TEAMS = (1, 2)
+
+
+class Settlement(NamedTuple):
+    winning_team: int
+    total: int
+    payouts: dict[int, int]     # uid → 돌려받는 포인트 (원금 포함, 당첨자/환불 대상만)
+    winners: list[int]          # 배팅금 큰 순
+    losers: list[int]
+    refunded: bool              # 승리팀 배팅이 없어 전원 환불했는지
+
+
+class BettingPool:
+    def __init__(self, bets: Optional[dict[int, dict]] = None):
+        self.bets: dict[int, dict] = bets if bets is not None else {}
+        self._totals = {team: 0 for team in TEAMS}
+        self._counts = {team: 0 for team in TEAMS}
+        for bet in self.bets.values():
+            self._add(int(bet["team"]), int(bet["amount"]))
+
+    def _add(self, team: int, amount: int) -> None:
+        self._totals[team] += amount
+        self._counts[team] += 1
+
+    # ───────── 조회 ─────────
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self.bets
+
+    def __len__(self) -> int:
+        return len(self.bets)
+
+    @property
+    def total(self) -> int:
+        return self._totals[1] + self._totals[2]
+
+    def team_total(self, team: int) -> int:
+        return self._totals[team]
+
+    def team_count(self, team: int) -> int:
+        return self._counts[team]
+
+    def odds(self, team: int) -> Optional[float]:
+        """team이 이기면 1P당 돌려받는 배율 (표시용, 그 팀 배팅이 없으면 None)"""
+        if not self._totals[team]:
+            return None
+        return self.total / self._totals[team]
+
+    def potential_payout(self, user_id: int) -> int:
+        """지금 결과가 나면 user_id가 돌려받을 포인트 (버림 기준, 원금 포함)"""
+        bet = self.bets[user_id]
+        return int(bet["amount"]) * self.total // self._totals[int(bet["team"])]
+
+    def escrow_ids(self) -> list[str]:
+        return [bet["escrow"] for bet in self.bets.values() if "escrow" in bet]
+
+    # ───────── 변경 ─────────
+    def place(self, user_id: int, team: int, amount: int, escrow_id: Optional[str] = None) -> None:
+        if user_id in self.bets:
+            raise ValueError("이미 배팅한 유저입니다.")
+        if team not in TEAMS or amount <= 0:
+            raise ValueError("잘못된 배팅입니다.")
+        bet = {"amount": int(amount), "team": team}
+        if escrow_id:
+            bet["escrow"] = escrow_id
+        self.bets[user_id] = bet
+        self._add(team, int(amount))
+
+    def clear(self) -> None:
+        self.bets.clear()
+        for team in TEAMS:
+            self._totals[team] = self._counts[team] = 0
+
+    def refunds(self) -> dict[int, int]:
+        return {uid: int(bet["amount"]) for uid, bet in self.bets.items()}
+
+    def settle(self, winning_team: int) -> Settlement:
+        """지급액 계산 (포인트 반영은 호출 측에서 한 번에)"""
+        total = self.total
+        pool = self._totals[winning_team]
+        by_amount = sorted(self.bets.items(), key=lambda kv: (-int(kv[1]["amount"]), kv[0]))
+        winners = [uid for uid, bet in by_amount if bet["team"] == winning_team]
+        losers = [uid for uid, bet in by_amount if bet["team"] != winning_team]
+        if not winners:
+            return Settlement(winning_team, total, self.refunds(), [], losers, True)
+
+        payouts: dict[int, int] = {}
+        fractions = []
+        for uid in winners:
+            amount = int(self.bets[uid]["amount"])
+            share, rem = divmod(amount * total, pool)
+            payouts[uid] = share
+            fractions.append((-rem, -amount, uid))
+        leftover = total - sum(payouts.values())   # 0 <= leftover < len(winners)
+        for _, _, uid in sorted(fractions)[:leftover]:
+            payouts[uid] += 1
+        return Settlement(winning_team, total, payouts, winners, losers, False)
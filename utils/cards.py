@@ -0,0 +1,212 @@
+# utils/cards.py
+"""
+전적 카드 이미지 (!전적 [@유저] 카드, !지갑 [@유저] 카드) — 선택 기능
+Pillow(>=10.1)와 한글 글꼴 assets/card_font.ttf 가 있어야 켜진다. 기본 글꼴에는 한글 글리프가 없어
+카드 글자가 전부 네모로 나오므로, 글꼴이 없으면 카드 대신 기존 임베드를 보낸다.
+
+- 렌더링은 작업 스레드 풀에서 돌려 이벤트 루프를 막지 않는다.
+- 결과 PNG는 입력값(이름/아바타 키/전적/레이팅 추이/포인트) 해시로 캐시한다(LRU, 바이트 예산).
+  전적이 그대로면 아바타를 다시 받지도, 다시 그리지도 않고 캐시된 바이트를 그대로 보낸다.
+- 같은 카드가 동시에 여러 번 요청되면 렌더링은 한 번만 하고 결과를 나눠 쓴다.
+
+렌더 시간/캐시 적중률 벤치마크: python -m tools.card_bench
+"""
+from __future__ import annotations
+import asyncio
+import hashlib
+import io
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # Pillow 없으면 카드 대신 기존 임베드만 사용
+    Image = ImageDraw = ImageFont = None
+
+CARD_SIZE = (640, 240)
+CARD_CACHE_BYTES = 16 * 1024 * 1024   # 캐시 PNG 총량 상한
+CARD_WORKERS = 2
+CARD_FONT_PATH = Path(__file__).resolve().parents[1] / "assets" / "card_font.ttf"  # 한글 글꼴 (예: NanumGothic.ttf 를 이 이름으로)
+
+BG = (47, 49, 54)
+PANEL = (32, 34, 37)
+TEXT = (235, 235, 235)
+MUTED = (150, 155, 165)
+WIN = (87, 242, 135)
+LOSS = (237, 66, 69)
+ACCENT = (88, 101, 242)
+
+
+class CardInput(NamedTuple):
+    name: str
+    avatar_key: str              # discord Asset.key — 아바타가 바뀌면 해시도 바뀜
+    games: int
+    wins: int
+    losses: int
+    rating: Optional[float]
+    trend: tuple[float, ...]     # 레이팅 추이 (오래된 → 최신)
+    points: int
+
+    def digest(self) -> str:
+        raw = json.dumps(self, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _font(size: int):
+    if CARD_FONT_PATH.exists():
+        return ImageFont.truetype(str(CARD_FONT_PATH), size)
+    return ImageFont.load_default(size)   # tools.card_bench 측정용 (한글은 표시 안 됨, 봇은 이 경로로 그리지 않음)
+
+
+def render_card(data: CardInput, avatar: Optional[bytes]) -> bytes:
+    """카드 PNG 바이트 (작업 스레드에서 호출)"""
+    w, h = CARD_SIZE
+    img = Image.new("RGB", CARD_SIZE, BG)
+    draw = ImageDraw.Draw(img)
+    big, mid, small = _font(30), _font(22), _font(16)
+
+    # 아바타 (원형)
+    size = 128
+    if avatar:
+        face = Image.open(io.BytesIO(avatar)).convert("RGB").resize((size, size))
+    else:
+        face = Image.new("RGB", (size, size), ACCENT)
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, size, size), fill=255)
+    img.paste(face, (24, (h - size) // 2), mask)
+
+    x = 176
+    draw.text((x, 24), data.name, font=big, fill=TEXT)
+    rate = data.wins / data.games * 100 if data.games else 0.0
+    draw.text((x, 72), f"{data.games}전 {data.wins}승 {data.losses}패", font=mid, fill=TEXT)
+    draw.text((x, 104), f"승률 {rate:.1f}%", font=mid, fill=WIN if rate >= 50 else LOSS)
+    draw.text((x, 136), f"{data.points:,} P", font=mid, fill=TEXT)
+    if data.rating is not None:
+        draw.text((x, 168), f"레이팅 {data.rating:.0f}", font=small, fill=MUTED)
+
+    # 승률 막대
+    bar = (x, 204, w - 24, 216)
+    draw.rectangle(bar, fill=LOSS)
+    if data.games:
+        draw.rectangle((bar[0], bar[1], bar[0] + int((bar[2] - bar[0]) * data.wins / data.games), bar[3]), fill=WIN)
+
+    # 레이팅 추이 (오른쪽 패널)
+    panel = (w - 220, 24, w - 24, 180)
+    draw.rectangle(panel, fill=PANEL)
+    if len(data.trend) >= 2:
+        lo, hi = min(data.trend), max(data.trend)
+        span = (hi - lo) or 1.0
+        px0, py0, px1, py1 = panel[0] + 8, panel[1] + 8, panel[2] - 8, panel[3] - 8
+        step = (px1 - px0) / (len(data.trend) - 1)
+        points = [(px0 + i * step, py1 - (v - lo) / span * (py1 - py0)) for i, v in enumerate(data.trend)]
+        draw.line(points, fill=WIN if data.trend[-1] >= data.trend[0] else LOSS, width=3)
+    else:
+        draw.text((panel[0] + 12, panel[1] + 12), "레이팅 기록 없음", font=small, fill=MUTED)
+
+    out = io.BytesIO()
+    img.save(out, format="PNG", optimize=False)
+    return out.getvalue()
+
+
+class CardCache:
+    """해시 → PNG 바이트 LRU (총 바이트 예산 초과 시 오래된 것부터 버림)"""
+
+    def __init__(self, budget: int = CARD_CACHE_BYTES):
+        self.budget = budget
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        png = self._items.get(key)
+        if png is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return png
+
+    def put(self, key: str, png: bytes) -> None:
+        if len(png) > self.budget:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old)
+        self._items[key] = png
+        self.bytes += len(png)
+        while self.bytes > self.budget:
+            _, dropped = self._items.popitem(last=False)
+            self.bytes -= len(dropped)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class CardRenderer:
+    def __init__(self, workers: int = CARD_WORKERS, budget: int = CARD_CACHE_BYTES):
+        self.cache = CardCache(budget)
+        self.workers = workers
+        self._pool: Optional[ThreadPoolExecutor] = None   # 첫 렌더 때 생성, close 후 다시 쓰면 새로 만듦
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    @property
+    def unavailable_reason(self) -> Optional[str]:
+        """카드를 못 그리는 이유 (그릴 수 있으면 None)"""
+        if Image is None:
+            return "Pillow 가 설치되어 있지 않음"
+        if not CARD_FONT_PATH.exists():
+            return f"한글 글꼴 {CARD_FONT_PATH.name} 이 assets/에 없음"
+        return None
+
+    @property
+    def available(self) -> bool:
+        return self.unavailable_reason is None
+
+    async def render(self, data: CardInput, fetch_avatar: Callable[[], Awaitable[Optional[bytes]]]) -> bytes:
+        """캐시에 있으면 그대로, 없으면 아바타를 받아 작업 스레드에서 그림"""
+        key = data.digest()
+        png = self.cache.get(key)
+        if png is not None:
+            return png
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            avatar = await fetch_avatar()
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="card")
+            png = await asyncio.get_running_loop().run_in_executor(self._pool, render_card, data, avatar)
+            self.cache.put(key, png)
+            future.set_result(png)
+            return png
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 쪽이 없어도 경고가 나지 않게
+            raise
+        finally:
+            del self._inflight[key]
+
+    def close(self) -> None:
+        """작업 스레드 정리 (StatsCog.cog_unload)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# 봇 전역 카드 렌더러
+cards = CardRenderer()
@@ -0,0 +1,105 @@
+# utils/draft.py
+"""
+팀장 드래프트(스네이크) 상태.
+
+- pool: 드래프트 시작 때 섞어 둔 픽 대상 (순서 고정 배열)
+- taken: pool 인덱스 비트마스크 (뽑힌 사람) → 픽 가능 여부 O(1)
+- history: (팀, uid) 스택 → 되돌리기는 pop 한 번
+- order: 미리 계산한 스네이크 픽 순서 (1-2-2-1-1-2-2-1 ...), 현재 차례 = order[len(history)]
+
+표시 이름은 드래프트 시작(또는 재시작 복원) 때 한 번만 가져오고,
+Select 옵션 목록은 taken 마스크별로 캐시해 되돌리기 후 같은 상태로 돌아오면 그대로 다시 쓴다.
+"""
+from __future__ import annotations
+from typing import Iterable, Optional, Tuple
+
+import discord
+
+
+def snake_order(first: int, picks: int) -> list[int]:
+    """first 팀부터 1-2-2-1 스네이크 순서 (picks개)"""
+    other = 3 - first
+    return [first if (i + 1) // 2 % 2 == 0 else other for i in range(picks)]
+
+
+class DraftState:
+    __slots__ = ("pool", "order", "history", "labels", "_index", "_taken", "_options")
+
+    def __init__(self, pool: Iterable[int], order: Iterable[int],
+                 history: Iterable[Tuple[int, int]] = ()):
+        self.pool: list[int] = list(pool)
+        self.order: list[int] = list(order)
+        self.history: list[Tuple[int, int]] = []
+        self.labels: dict[int, str] = {}
+        self._index = {uid: i for i, uid in enumerate(self.pool)}
+        self._taken = 0
+        self._options: dict[int, list[discord.SelectOption]] = {}
+        for team, uid in history:
+            self._taken |= 1 << self._index[uid]
+            self.history.append((team, uid))
+
+    @classmethod
+    def from_snapshot(cls, order: Iterable[int], available: Iterable[int],
+                      history: Iterable[Tuple[int, int]]) -> "DraftState":
+        """예전 스냅샷(available/pick_history) 복원: 뽑힌 사람을 앞에 두고 pool 재구성"""
+        history = list(history)
+        return cls([uid for _, uid in history] + list(available), order, history)
+
+    # ───────── 조회 ─────────
+    @property
+    def turn(self) -> int:
+        return len(self.history)
+
+    @property
+    def team(self) -> Optional[int]:
+        """지금 뽑을 팀 (끝났으면 None)"""
+        return self.order[self.turn] if not self.done else None
+
+    @property
+    def done(self) -> bool:
+        return self.turn >= len(self.order) or self._taken == (1 << len(self.pool)) - 1
+
+    def is_available(self, uid: int) -> bool:
+        i = self._index.get(uid)
+        return i is not None and not self._taken >> i & 1
+
+    def available(self) -> list[int]:
+        return [uid for i, uid in enumerate(self.pool) if not self._taken >> i & 1]
+
+    # ───────── 변경 ─────────
+    def pick(self, uid: int) -> int:
+        """uid를 현재 차례 팀에 배정하고 그 팀 번호 반환"""
+        team = self.team
+        if team is None or not self.is_available(uid):
+            raise ValueError("픽할 수 없는 유저입니다.")
+        self._taken |= 1 << self._index[uid]
+        self.history.append((team, uid))
+        return team
+
+    def undo(self) -> Optional[Tuple[int, int]]:
+        """마지막 픽 취소 → (팀, uid), 없으면 None"""
+        if not self.history:
+            return None
+        team, uid = self.history.pop()
+        self._taken &= ~(1 << self._index[uid])
+        return team, uid
+
+    # ───────── 표시 ─────────
+    def resolve_labels(self, guild: discord.Guild, extra: Iterable[int] = ()) -> None:
+        """표시 이름을 한 번에 채움 (드래프트 시작/복원 때)"""
+        for uid in (*self.pool, *extra):
+            member = guild.get_member(uid)
+            self.labels[uid] = member.display_name if member else str(uid)
+        self._options.clear()
+
+    def label(self, uid: int) -> str:
+        return self.labels.get(uid, str(uid))
+
+    def options(self) -> list[discord.SelectOption]:
+        """현재 픽 가능한 인원 Select 옵션 (뽑힌 상태별 캐시)"""
+        opts = self._options.get(self._taken)
+        if opts is None:
+            opts = self._options[self._taken] = [
+                discord.SelectOption(label=self.label(uid), value=str(uid)) for uid in self.available()
+            ]
+        return opts
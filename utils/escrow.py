@@ -0,0 +1,54 @@
+# utils/escrow.py
+"""
+진행 중 판돈(에스크로) 저널.
+
+spend_points로 판돈을 차감한 직후 기록하고, 정산/환불이 끝나면 지운다.
+봇이 도중에 재시작되면 남아 있는 항목이 곧 '주인 없는 판돈'이므로
+시작 시 재개하거나 환불한다.
+"""
+from __future__ import annotations
+from datetime import datetime
+
+from utils.stats import DATA_DIR, _read_json, _write_json
+
+ESCROW_PATH = DATA_DIR / "escrow.json"
+
+
+def load_escrows() -> dict:
+    return _read_json(ESCROW_PATH)
+
+
+def open_escrow(escrow_id: str, *, kind: str, user_id: int, amount: int,
+                guild_id: int = 0, state: dict | None = None) -> None:
+    """판돈 1건 기록 (kind: mines/crash/rps/match_bet ...)"""
+    data = load_escrows()
+    data[escrow_id] = {
+        "kind": kind,
+        "user_id": int(user_id),
+        "amount": int(amount),
+        "guild_id": int(guild_id or 0),
+        "opened_at": datetime.now().isoformat(timespec="seconds"),
+        "state": state or {},
+    }
+    _write_json(ESCROW_PATH, data)
+
+
+def update_escrow(escrow_id: str, state: dict) -> None:
+    """게임 진행 상태 갱신 (없는 항목이면 무시)"""
+    data = load_escrows()
+    rec = data.get(escrow_id)
+    if rec is None:
+        return
+    rec["state"] = state
+    _write_json(ESCROW_PATH, data)
+
+
+def close_escrow(*escrow_ids: str) -> None:
+    """정산/환불 완료된 판돈 제거"""
+    data = load_escrows()
+    removed = False
+    for eid in escrow_ids:
+        if data.pop(eid, None) is not None:
+            removed = True
+    if removed:
+        _write_json(ESCROW_PATH, data)
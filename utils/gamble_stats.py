@@ -0,0 +1,95 @@
+# utils/gamble_stats.py
+"""
+도박 통계 누적 카운터.
+
+정산(_settle) 때마다 유저×게임 카운터를 증분 갱신하고,
+순손익 순위 인덱스를 함께 유지해서 랭킹 조회 시 기록을 다시 훑지 않는다.
+"""
+from __future__ import annotations
+from bisect import bisect_left, insort
+
+from utils.stats import DATA_DIR, _read_json, _write_json
+
+GAMBLE_STATS_PATH = DATA_DIR / "gamble_stats.json"
+
+TOTAL_KEY = "전체"
+GAME_LABELS = {
+    "mines": "버튼 도박",
+    "crash": "그래프 도박",
+    "rps": "가위바위보",
+}
+
+# 유저×게임 고정 스키마
+DEFAULT_COUNTERS = {
+    "판수": 0,
+    "승": 0,         # 지급액 > 베팅액
+    "베팅": 0,       # 총 베팅액
+    "지급": 0,       # 총 지급액(환불 포함)
+    "순손익": 0,     # 지급 - 베팅
+    "최고수익": 0,   # 한 판 최대 순이익
+}
+
+
+class GambleStatsStore:
+    """{uid: {game|전체: counters}} 저장소 + 순손익 정렬 인덱스"""
+
+    def __init__(self, path=GAMBLE_STATS_PATH):
+        self.path = path
+        self._data: dict[str, dict[str, dict[str, int]]] | None = None
+        self._rank: list[tuple[int, str]] = []      # (-순손익, uid) 오름차순
+        self._net: dict[str, int] = {}
+
+    def _users(self) -> dict[str, dict[str, dict[str, int]]]:
+        if self._data is None:
+            self._data = _read_json(self.path)
+            # 순위 인덱스는 로드 시 1회 구성 (유저 수만큼, 게임 기록과 무관)
+            self._net = {uid: int(rec.get(TOTAL_KEY, {}).get("순손익", 0)) for uid, rec in self._data.items()}
+            self._rank = sorted((-net, uid) for uid, net in self._net.items())
+        return self._data
+
+    def _reindex(self, uid: str, net: int) -> None:
+        old = self._net.get(uid)
+        if old is not None:
+            i = bisect_left(self._rank, (-old, uid))
+            if i < len(self._rank) and self._rank[i] == (-old, uid):
+                del self._rank[i]
+        self._net[uid] = net
+        insort(self._rank, (-net, uid))
+
+    def record(self, user_id: int | str, game: str, wager: int, payout: int) -> None:
+        """정산 1건 반영 (game: mines/crash/rps)"""
+        uid = str(user_id)
+        rec = self._users().setdefault(uid, {})
+        net = int(payout) - int(wager)
+        for key in (game, TOTAL_KEY):
+            c = rec.setdefault(key, DEFAULT_COUNTERS.copy())
+            for k, v in DEFAULT_COUNTERS.items():
+                c.setdefault(k, v)
+            c["판수"] += 1
+            c["승"] += 1 if net > 0 else 0
+            c["베팅"] += int(wager)
+            c["지급"] += int(payout)
+            c["순손익"] += net
+            c["최고수익"] = max(c["최고수익"], net)
+        self._reindex(uid, rec[TOTAL_KEY]["순손익"])
+        _write_json(self.path, self._users())
+
+    def get(self, user_id: int | str) -> dict[str, dict[str, int]]:
+        return self._users().get(str(user_id), {})
+
+    def leaderboard(self, k: int = 10) -> list[tuple[int, int]]:
+        """순손익 상위 k명 [(uid, 순손익)]"""
+        self._users()
+        return [(int(uid), -neg) for neg, uid in self._rank[:k]]
+
+    def rank_of(self, user_id: int | str) -> int | None:
+        """순손익 순위(1부터). 기록 없으면 None."""
+        self._users()
+        uid = str(user_id)
+        net = self._net.get(uid)
+        if net is None:
+            return None
+        return bisect_left(self._rank, (-net, uid)) + 1
+
+
+gamble_stats = GambleStatsStore()
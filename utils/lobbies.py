@@ -0,0 +1,115 @@
+# utils/lobbies.py
+"""
+진행 중 내전 인덱스 + 채널별 대기열.
+
+여러 길드/채널에서 로비가 동시에 돌아가도 조회가 전체 내전을 훑지 않도록
+game_id를 길드/채널/개최자별 집합으로 색인한다.
+
+대기열: 로비가 다 찬 뒤 [대기] 를 누른 사람은 채널 대기열(FIFO)에 들어가고,
+- 다 찬 로비에서 누가 빠지면 맨 앞 사람이 그 자리를 채우고
+- 그 채널에 다음 로비가 열리면 남은 자리만큼 대기열에서 먼저 채운다 ("2판" 넘김).
+한 사람은 한 채널 대기열에만 들어갈 수 있다.
+"""
+from __future__ import annotations
+from collections import deque
+from typing import Iterable, Protocol
+
+
+class _Indexed(Protocol):
+    id: int
+    guild_id: int
+    channel_id: int
+    host_id: int
+
+
+class LobbyIndex:
+    def __init__(self):
+        self.by_guild: dict[int, set[int]] = {}
+        self.by_channel: dict[int, set[int]] = {}
+        self.by_host: dict[int, set[int]] = {}
+        self._queues: dict[int, deque[int]] = {}   # channel → uid (FIFO)
+        self._queued: dict[int, int] = {}          # uid → channel
+
+    # ───────── 내전 색인 ─────────
+    def _indexes(self, game: _Indexed):
+        return ((self.by_guild, game.guild_id), (self.by_channel, game.channel_id), (self.by_host, game.host_id))
+
+    def add(self, game: _Indexed) -> None:
+        for index, key in self._indexes(game):
+            index.setdefault(key, set()).add(game.id)
+
+    def remove(self, game: _Indexed) -> None:
+        for index, key in self._indexes(game):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(game.id)
+                if not ids:
+                    del index[key]
+
+    def in_guild(self, guild_id: int) -> set[int]:
+        return self.by_guild.get(guild_id, set())
+
+    def in_channel(self, channel_id: int) -> set[int]:
+        return self.by_channel.get(channel_id, set())
+
+    def hosted_by(self, host_id: int) -> set[int]:
+        return self.by_host.get(host_id, set())
+
+    # ───────── 대기열 ─────────
+    def enqueue(self, channel_id: int, user_id: int) -> int:
+        """대기열 추가 → 순번(1부터). 다른 채널 대기열에 있던 사람은 옮긴다."""
+        if self._queued.get(user_id) != channel_id:
+            self.dequeue(user_id)
+            self._queued[user_id] = channel_id
+            self._queues.setdefault(channel_id, deque()).append(user_id)
+        return self.position(user_id)
+
+    def dequeue(self, user_id: int) -> bool:
+        """대기열에서 빠짐"""
+        channel_id = self._queued.pop(user_id, None)
+        if channel_id is None:
+            return False
+        queue = self._queues[channel_id]
+        queue.remove(user_id)
+        if not queue:
+            del self._queues[channel_id]
+        return True
+
+    def pop_queue(self, channel_id: int, count: int, exclude: Iterable[int] = ()) -> list[int]:
+        """앞에서부터 최대 count명 꺼냄 (exclude에 있는 사람은 대기열에서 빼기만 함)"""
+        queue = self._queues.get(channel_id)
+        exclude = set(exclude)
+        out: list[int] = []
+        while queue and len(out) < count:
+            uid = queue.popleft()
+            del self._queued[uid]
+            if uid not in exclude:
+                out.append(uid)
+        if queue is not None and not queue:
+            del self._queues[channel_id]
+        return out
+
+    def queue(self, channel_id: int) -> list[int]:
+        return list(self._queues.get(channel_id, ()))
+
+    def queue_size(self, channel_id: int) -> int:
+        queue = self._queues.get(channel_id)
+        return len(queue) if queue else 0
+
+    def position(self, user_id: int) -> int | None:
+        channel_id = self._queued.get(user_id)
+        if channel_id is None:
+            return None
+        return self._queues[channel_id].index(user_id) + 1
+
+    def queued_in(self, user_id: int) -> int | None:
+        return self._queued.get(user_id)
+
+    # ───────── 스냅샷 ─────────
+    def queues_snapshot(self) -> dict[str, list[int]]:
+        return {str(cid): list(queue) for cid, queue in self._queues.items()}
+
+    def restore_queues(self, data: dict) -> None:
+        for cid, uids in data.items():
+            for uid in uids:
+                self.enqueue(int(cid), int(uid))
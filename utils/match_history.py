@@ -0,0 +1,125 @@
+# utils/match_history.py
+"""
+내전 기록 저장소 (한 판 = 한 줄, data/match_history.jsonl 에 추가만 한다).
+
+참여/승/패 카운터(user_stats.json)와 달리 팀 구성/팀장/승리팀/배팅 총액/시각을 그대로 남긴다.
+로드 시 1회 유저별·시각 인덱스를 만들고 이후 append 때 증분 갱신하므로
+!최근내전, 기간 조회는 전체 기록을 훑지 않는다.
+
+레코드:
+    {"id": 12, "ts": 1760000000.0, "guild_id": ..., "host_id": ...,
+     "captains": [c1, c2], "teams": {"1": [...], "2": [...]}, "winner": 1,
+     "bets": {"1": 5000, "2": 3000}, "bettors": 4}
+"""
+from __future__ import annotations
+import json
+import time
+from bisect import bisect_left
+from typing import Iterator
+
+from utils.stats import DATA_DIR
+
+MATCH_HISTORY_PATH = DATA_DIR / "match_history.jsonl"
+
+
+def match_players(record: dict) -> list[int]:
+    """레코드의 참가자 전원 (1팀 + 2팀)"""
+    return [int(u) for team in ("1", "2") for u in record["teams"].get(team, [])]
+
+
+def player_team(record: dict, user_id: int) -> int | None:
+    for team in ("1", "2"):
+        if int(user_id) in record["teams"].get(team, []):
+            return int(team)
+    return None
+
+
+class MatchHistoryStore:
+    """추가 전용 기록 + 유저별/시각 인덱스"""
+
+    def __init__(self, path=MATCH_HISTORY_PATH):
+        self.path = path
+        self._records: list[dict] | None = None
+        self._times: list[float] = []              # 레코드 순서와 같은 순서의 ts (추가 순 = 시간 순)
+        self._by_user: dict[int, list[int]] = {}   # uid → 레코드 위치 (오래된 순)
+
+    def _load(self) -> list[dict]:
+        if self._records is None:
+            self._records = []
+            for record in self._iter_file():
+                self._index(record)
+        return self._records
+
+    def _iter_file(self) -> Iterator[dict]:
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 쓰다 끊긴 마지막 줄 등은 건너뜀
+
+    def _index(self, record: dict) -> None:
+        pos = len(self._records)
+        self._records.append(record)
+        self._times.append(float(record["ts"]))
+        for uid in match_players(record):
+            self._by_user.setdefault(uid, []).append(pos)
+
+    # ───────── 기록 ─────────
+    def append(self, record: dict) -> dict:
+        """한 판 추가 (ts 없으면 현재 시각). 저장된 레코드 반환."""
+        self._load()
+        record = dict(record)
+        record.setdefault("ts", time.time())
+        if self._times and record["ts"] < self._times[-1]:
+            record["ts"] = self._times[-1]  # 시각 인덱스 정렬 유지
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._index(record)
+        return record
+
+    # ───────── 조회 ─────────
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def recent(self, k: int = 10) -> list[dict]:
+        """최근 k판 (최신 순)"""
+        return self._load()[-k:][::-1] if k > 0 else []
+
+    def recent_for(self, user_id: int, k: int = 10) -> list[dict]:
+        """유저가 뛴 최근 k판 (최신 순)"""
+        records = self._load()
+        positions = self._by_user.get(int(user_id), [])
+        return [records[i] for i in reversed(positions[-k:])] if k > 0 else []
+
+    def count_for(self, user_id: int) -> int:
+        self._load()
+        return len(self._by_user.get(int(user_id), []))
+
+    def between(self, start: float | None = None, end: float | None = None) -> list[dict]:
+        """start <= ts < end 구간 기록 (오래된 순). 이진 탐색으로 구간만 잘라낸다."""
+        records = self._load()
+        lo = bisect_left(self._times, start) if start is not None else 0
+        hi = bisect_left(self._times, end) if end is not None else len(records)
+        return records[lo:hi]
+
+    def iter_export(self, start: float | None = None, end: float | None = None) -> Iterator[dict]:
+        """
+        오프라인 분석용 스트리밍 내보내기.
+        메모리 인덱스를 쓰지 않고 파일을 한 줄씩 읽으므로 봇 밖(tools/)에서도 그대로 쓸 수 있다.
+        """
+        for record in self._iter_file():
+            ts = float(record.get("ts", 0))
+            if start is not None and ts < start:
+                continue
+            if end is not None and ts >= end:
+                break  # 추가 순 = 시간 순
+            yield record
+
+
+match_history = MatchHistoryStore()
@@ -0,0 +1,25 @@
+# utils/match_store.py
+"""
+내전 진행 상태 스냅샷 저장소.
+
+MatchCog가 상태가 바뀔 때마다 진행 중인 Game 전체와 game_counter를 저장하고,
+재시작 시 이 파일로 로비/드래프트/결과 View를 다시 등록한다.
+"""
+from __future__ import annotations
+
+from utils.stats import DATA_DIR, _read_json, _write_json
+
+MATCHES_PATH = DATA_DIR / "matches.json"
+
+
+def load_match_state() -> dict:
+    """{"game_counter": int, "games": {game_id: snapshot}, "queues": {channel_id: [uid]}}"""
+    data = _read_json(MATCHES_PATH)
+    data.setdefault("game_counter", 1)
+    data.setdefault("games", {})
+    data.setdefault("queues", {})
+    return data
+
+
+def save_match_state(game_counter: int, games: dict, queues: dict | None = None) -> None:
+    _write_json(MATCHES_PATH, {"game_counter": int(game_counter), "games": games, "queues": queues or {}})
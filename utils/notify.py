@@ -0,0 +1,125 @@
+# utils/notify.py
+"""
+DM 일괄 발송기.
+
+내전 인원이 다 찼을 때처럼 여러 명에게 같은 DM을 보낼 때 쓴다.
+fan_out()은 발송 작업만 만들고 바로 반환하므로 버튼 처리(상호작용 흐름)는 DM을 기다리지 않는다.
+- 동시 발송 수는 DM_CONCURRENCY개로 제한하고, 한 자리에서 연달아 보낼 때 DM_SEND_INTERVAL초씩 띄운다.
+- 429(레이트 리밋)는 retry_after 만큼 쉬고 DM_MAX_RETRIES번까지 다시 보낸다.
+- DM을 막아 둔 유저(Forbidden)는 data/dm_blocked.json에 기록하고 DM_BLOCK_TTL 동안 건너뛴다.
+"""
+from __future__ import annotations
+import asyncio
+import time
+from collections import Counter
+from typing import Iterable
+
+import discord
+
+from utils.stats import DATA_DIR, _read_json, _write_json
+
+DM_BLOCKED_PATH = DATA_DIR / "dm_blocked.json"
+
+DM_CONCURRENCY = 3
+DM_SEND_INTERVAL = 0.25       # 같은 자리에서 다음 DM까지 간격(초)
+DM_MAX_RETRIES = 2
+DM_BLOCK_TTL = 7 * 24 * 3600  # DM 차단 유저를 건너뛰는 기간 (그 뒤 한 번 더 시도)
+
+
+class DMDispatcher:
+    """백그라운드 DM 발송 + 차단 유저 기록 {uid: 실패 시각(epoch)}"""
+
+    def __init__(self, path=DM_BLOCKED_PATH, concurrency: int = DM_CONCURRENCY):
+        self.path = path
+        self.concurrency = concurrency
+        self._blocked: dict[str, float] | None = None
+        self._sem: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.metrics: Counter = Counter()
+
+    # ───────── 차단 기록 ─────────
+    def _load(self) -> dict[str, float]:
+        if self._blocked is None:
+            self._blocked = {uid: float(ts) for uid, ts in _read_json(self.path).items()}
+        return self._blocked
+
+    def _save(self) -> None:
+        _write_json(self.path, self._load())
+
+    def is_blocked(self, user_id: int) -> bool:
+        blocked = self._load()
+        since = blocked.get(str(user_id))
+        if since is None:
+            return False
+        if time.time() - since >= DM_BLOCK_TTL:  # 기간이 지났으면 다시 시도
+            del blocked[str(user_id)]
+            self._save()
+            return False
+        return True
+
+    def _mark(self, user_id: int, blocked: bool) -> None:
+        data = self._load()
+        uid = str(user_id)
+        if blocked:
+            data[uid] = time.time()
+        elif data.pop(uid, None) is None:
+            return
+        self._save()
+
+    # ───────── 발송 ─────────
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def fan_out(self, members: Iterable[discord.abc.User], content: str) -> int:
+        """members에게 content DM 예약 (차단 유저 제외). 예약한 수 반환."""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.concurrency)
+        loop = asyncio.get_running_loop()
+        queued = 0
+        for member in members:
+            if member is None or member.bot:
+                continue
+            if self.is_blocked(member.id):
+                self.metrics["skipped"] += 1
+                continue
+            task = loop.create_task(self._deliver(member, content))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            queued += 1
+        return queued
+
+    async def _deliver(self, member: discord.abc.User, content: str) -> None:
+        async with self._sem:
+            for attempt in range(DM_MAX_RETRIES + 1):
+                try:
+                    await member.send(content)
+                except discord.Forbidden:
+                    self.metrics["blocked"] += 1
+                    self._mark(member.id, True)
+                    return
+                except discord.HTTPException as e:
+                    if e.status == 429 and attempt < DM_MAX_RETRIES:
+                        self.metrics["rate_limited"] += 1
+                        await asyncio.sleep(float(getattr(e, "retry_after", 1.0) or 1.0))
+                        continue
+                    self.metrics["failed"] += 1
+                    print(f"[notify] DM 실패 {member.id}: {e!r}")
+                    return
+                else:
+                    self.metrics["sent"] += 1
+                    self._mark(member.id, False)
+                    break
+            await asyncio.sleep(DM_SEND_INTERVAL)
+
+    async def close(self) -> None:
+        """대기 중인 발송 취소 (봇 종료용)"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+
+# 봇 전역 DM 발송기
+dms = DMDispatcher()
@@ -0,0 +1,145 @@
+# utils/pair_stats.py
+"""
+유저 쌍(pair) 전적 행렬.
+
+내전 기록(match_history)에 한 판이 추가될 때마다 그 판의 모든 유저 쌍을 증분 갱신한다.
+(10인 내전이면 같은 팀 쌍 20개 + 상대 팀 쌍 25개)
+실제로 같이/상대로 뛴 적 있는 쌍만 저장하는 희소 행렬이라 !상대전적 은 키 조회 한 번,
+!시너지 는 그 유저와 뛰어 본 상대 목록만 훑는다 (기록 재생 없음).
+
+저장 형식 (data/pair_stats.json):
+    {"applied": 기록 반영 판수,
+     "pairs": {"<작은uid>:<큰uid>": [같은팀, 같은팀승, 상대, 작은uid의 상대승]}}
+"""
+from __future__ import annotations
+import heapq
+from itertools import combinations, product
+from typing import Iterable, NamedTuple
+
+from utils.stats import DATA_DIR, _read_json, _write_json
+from utils.match_history import MatchHistoryStore
+
+PAIR_STATS_PATH = DATA_DIR / "pair_stats.json"
+
+SAME, SAME_WIN, VS, LOW_WIN = range(4)
+
+
+class PairRecord(NamedTuple):
+    """a 기준으로 본 a-b 전적"""
+    together: int    # 같은 팀 판수
+    together_wins: int
+    versus: int      # 상대 팀 판수
+    versus_wins: int  # 그중 a가 이긴 판수
+
+    @property
+    def together_rate(self) -> float:
+        return self.together_wins / self.together if self.together else 0.0
+
+    @property
+    def versus_rate(self) -> float:
+        return self.versus_wins / self.versus if self.versus else 0.0
+
+
+def _key(a: int, b: int) -> str:
+    return f"{a}:{b}" if a < b else f"{b}:{a}"
+
+
+class PairStatsStore:
+    """희소 쌍 행렬 + 유저별 상대 목록 인덱스"""
+
+    def __init__(self, path=PAIR_STATS_PATH):
+        self.path = path
+        self._pairs: dict[str, list[int]] | None = None
+        self._partners: dict[int, set[int]] = {}
+        self.applied = 0
+
+    def _load(self) -> dict[str, list[int]]:
+        if self._pairs is None:
+            data = _read_json(self.path)
+            self._pairs = data.get("pairs", {})
+            self.applied = int(data.get("applied", 0))
+            for key in self._pairs:
+                a, b = (int(x) for x in key.split(":"))
+                self._partners.setdefault(a, set()).add(b)
+                self._partners.setdefault(b, set()).add(a)
+        return self._pairs
+
+    def _cell(self, a: int, b: int) -> list[int]:
+        pairs = self._load()
+        key = _key(a, b)
+        cell = pairs.get(key)
+        if cell is None:
+            cell = pairs[key] = [0, 0, 0, 0]
+            self._partners.setdefault(a, set()).add(b)
+            self._partners.setdefault(b, set()).add(a)
+        return cell
+
+    # ───────── 갱신 ─────────
+    def _apply(self, record: dict) -> None:
+        teams = {t: [int(u) for u in record["teams"].get(str(t), [])] for t in (1, 2)}
+        winner = int(record["winner"])
+        for t, members in teams.items():
+            won = int(t == winner)
+            for a, b in combinations(members, 2):
+                cell = self._cell(a, b)
+                cell[SAME] += 1
+                cell[SAME_WIN] += won
+        for a, b in product(teams[1], teams[2]):
+            cell = self._cell(a, b)
+            cell[VS] += 1
+            low_won = (winner == 1) if a < b else (winner == 2)
+            cell[LOW_WIN] += int(low_won)
+        self.applied += 1
+
+    def _save(self) -> None:
+        _write_json(self.path, {"applied": self.applied, "pairs": self._load()})
+
+    def record(self, record: dict) -> None:
+        """내전 기록 1판 반영"""
+        self._load()
+        self._apply(record)
+        self._save()
+
+    def sync(self, history: MatchHistoryStore) -> int:
+        """행렬에 아직 반영되지 않은 기록(최초 도입/파일 유실 시)만 따라잡기. 반영한 판수 반환."""
+        self._load()
+        records = history.between()
+        missing = records[self.applied:]
+        for record in missing:
+            self._apply(record)
+        if missing:
+            self._save()
+        return len(missing)
+
+    # ───────── 조회 ─────────
+    def get(self, a: int, b: int) -> PairRecord:
+        """a 기준 a-b 전적 (O(1))"""
+        cell = self._load().get(_key(a, b))
+        if cell is None:
+            return PairRecord(0, 0, 0, 0)
+        vs_wins = cell[LOW_WIN] if a < b else cell[VS] - cell[LOW_WIN]
+        return PairRecord(cell[SAME], cell[SAME_WIN], cell[VS], vs_wins)
+
+    def partners(self, user_id: int) -> Iterable[int]:
+        self._load()
+        return self._partners.get(int(user_id), ())
+
+    def top_duos(self, user_id: int, k: int = 5, *, min_games: int = 3,
+                 worst: bool = False) -> list[tuple[int, PairRecord]]:
+        """같은 팀 승률 상위(worst=True면 하위) k명. 같은 팀 min_games판 이상만."""
+        uid = int(user_id)
+        rows = [(p, self.get(uid, p)) for p in self.partners(uid)]
+        rows = [(p, r) for p, r in rows if r.together >= min_games]
+        if worst:
+            return heapq.nsmallest(k, rows, key=lambda x: (x[1].together_rate, -x[1].together))
+        return heapq.nlargest(k, rows, key=lambda x: (x[1].together_rate, x[1].together))
+
+    def top_rivals(self, user_id: int, k: int = 5, *, min_games: int = 3) -> list[tuple[int, PairRecord]]:
+        """상대로 만났을 때 승률이 가장 낮은(=천적) k명"""
+        uid = int(user_id)
+        rows = [(p, self.get(uid, p)) for p in self.partners(uid)]
+        rows = [(p, r) for p, r in rows if r.versus >= min_games]
+        return heapq.nsmallest(k, rows, key=lambda x: (x[1].versus_rate, -x[1].versus))
+
+
+pair_stats = PairStatsStore()
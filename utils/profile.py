@@ -0,0 +1,135 @@
+# utils/profile.py
+"""
+닉네임 프로필 파서 + 멤버별 캐시.
+
+닉네임 포맷: 소환사명#태그/티어/라인 (예: 김밀레#KR1/M575/TOP, JG)
+Riot ID / OP.GG 검색명 / 티어 정렬 키 / 밸런스 점수 / 선호 라인을 한 번에 파싱해 멤버 ID로 캐시한다.
+내전(로비 정렬, 자동 밸런스, 팀 확정 OP.GG 링크)과 !전적 이 같은 결과를 공유한다.
+
+캐시는 on_member_update(닉네임 변경) 때 비우고, 조회 시에도 닉네임이 바뀌었으면 다시 파싱한다.
+"""
+from __future__ import annotations
+import re
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+import discord
+
+TIER_ORDER = {"C": 0, "GM": 1, "M": 2, "D": 3, "E": 4, "P": 5, "G": 6, "S": 7, "B": 8, "I": 9}
+_TIER_RE = re.compile(r"(C|GM|M|D|E|P|G|S|B|I)(\d+)")
+_RIOT_ID_RE = re.compile(r'^\s*(?P<riot>[^/\n]+?)(?:/|$)')
+_OPGG_STRIP_RE = re.compile(r"[^\w\s가-힣/#]")
+_LANE_SPLIT_RE = re.compile(r"[,\s·|]+")
+
+# 자동 밸런스용 티어 점수: 아이언4=0 ~ 다이아1=2700, 마스터 이상은 2800+LP
+_TIER_BASE = {"I": 0, "B": 400, "S": 800, "G": 1200, "P": 1600, "E": 2000, "D": 2400}
+_APEX_BASE = 2800
+UNRANKED_TIER = (999, 999)
+
+# 닉네임 라인 표기 → team_balance.LANES
+LANE_ALIASES = {
+    "TOP": "TOP", "탑": "TOP",
+    "JG": "JG", "JUG": "JG", "JUNGLE": "JG", "정글": "JG",
+    "MID": "MID", "미드": "MID",
+    "AD": "AD", "ADC": "AD", "BOT": "AD", "원딜": "AD",
+    "SUP": "SUP", "SPT": "SUP", "SUPPORT": "SUP", "서폿": "SUP",
+}
+
+# 흔한 태그 오탈자 보정
+_TAG_FIXES = {"K1R": "KR1", "KRI": "KR1", "KRL": "KR1"}
+
+
+class MemberProfile(NamedTuple):
+    name: str                       # 파싱한 닉네임 (캐시 검증용)
+    riot_id: Optional[str]          # "소환사명#태그" (없으면 None)
+    opgg_name: str                  # OP.GG 멀티서치용 이름
+    tier: Tuple[int, int]           # 정렬 키 (티어 순위, 세부), 없으면 (999, 999)
+    strength: Optional[float]       # 자동 밸런스 점수 (티어 없으면 None)
+    lanes: Tuple[str, ...]          # 선호 라인 (없으면 빈 튜플)
+
+
+def _riot_id(name: str) -> Optional[str]:
+    """디스플레이 네임에서 '소환사명#태그'만 추출하고 태그 오탈자 보정."""
+    m = _RIOT_ID_RE.search(name)
+    if not m:
+        return None
+    riot = m.group("riot").strip()
+    if "#" not in riot:
+        return None
+    summoner, tag = riot.split("#", 1)
+    tag = tag.strip().upper()
+    return f"{summoner.strip()}#{_TAG_FIXES.get(tag, tag)}"
+
+
+def _tier(parts: list[str]) -> Tuple[Tuple[int, int], Optional[float]]:
+    """티어 칸(두 번째 '/' 구간)을 우선 검색 → (정렬 키, 밸런스 점수)"""
+    upper = [p.upper() for p in parts]
+    for part in (upper[1:2] + upper) if len(upper) > 1 else upper:
+        match = _TIER_RE.search(part)
+        if match:
+            break
+    else:
+        return UNRANKED_TIER, None
+    tier, num = match.groups()
+    num = int(num)
+    if tier in ("C", "GM", "M"):
+        return (TIER_ORDER[tier], -num), float(_APEX_BASE + num)
+    return (TIER_ORDER[tier], num), float(_TIER_BASE[tier] + (4 - min(max(num, 1), 4)) * 100)
+
+
+def _lanes(parts: list[str]) -> Tuple[str, ...]:
+    if len(parts) < 3:
+        return ()
+    lanes: list[str] = []
+    for token in _LANE_SPLIT_RE.split(parts[2].upper()):
+        lane = LANE_ALIASES.get(token)
+        if lane and lane not in lanes:
+            lanes.append(lane)
+    return tuple(lanes)
+
+
+def parse_profile(display_name: str) -> MemberProfile:
+    name = display_name or ""
+    parts = name.split("/")
+    tier, strength = _tier(parts)
+    return MemberProfile(
+        name=name,
+        riot_id=_riot_id(name),
+        opgg_name=_OPGG_STRIP_RE.sub("", name).split("/")[0].strip(),
+        tier=tier,
+        strength=strength,
+        lanes=_lanes(parts),
+    )
+
+
+class ProfileCache:
+    """member.id → MemberProfile"""
+
+    def __init__(self):
+        self._cache: dict[int, MemberProfile] = {}
+
+    def get(self, member: discord.abc.User) -> MemberProfile:
+        profile = self._cache.get(member.id)
+        if profile is None or profile.name != member.display_name:  # 변경 이벤트를 놓쳐도 닉네임이 다르면 재파싱
+            profile = self._cache[member.id] = parse_profile(member.display_name)
+        return profile
+
+    def of(self, guild: discord.Guild, user_id: int) -> Optional[MemberProfile]:
+        member = guild.get_member(user_id)
+        return self.get(member) if member else None
+
+    def invalidate(self, user_id: int) -> None:
+        self._cache.pop(user_id, None)
+
+    def warm(self, members: Iterable[discord.abc.User]) -> int:
+        """미리 파싱 (on_ready). 파싱한 수 반환."""
+        count = 0
+        for member in members:
+            self.get(member)
+            count += 1
+        return count
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+profiles = ProfileCache()
@@ -0,0 +1,61 @@
+# utils/rankings.py
+"""
+랭킹 목록 캐시.
+
+!내전랭킹/!판수랭킹 은 누를 때마다 전적 전체를 정렬하고 유저마다 get_member 를 부르던 것을
+(랭킹 종류, 길드) 별로 한 번만 만들어 두고 페이지 넘김/반복 조회는 그 목록을 그대로 쓴다.
+- 목록은 만들 때 현재 길드 멤버만 남기므로 순위 번호에 빈칸이 없다.
+- 결과 기록/시즌 초기화 때 전체, 멤버 입장/퇴장 때 그 길드 목록을 무효화한다.
+- 기간 랭킹은 키에 날짜/시즌을 넣어 날짜가 바뀌면 자연히 새로 만든다.
+"""
+from __future__ import annotations
+from typing import Callable, Hashable, NamedTuple
+
+
+class RankRow(NamedTuple):
+    user_id: int
+    value: str       # 표시 문자열 (이름은 페이지를 그릴 때 조회)
+
+
+class Ranking(NamedTuple):
+    rows: list[RankRow]
+    positions: dict[int, int]   # uid → 순위(1부터)
+
+    def page(self, index: int, size: int) -> list[tuple[int, RankRow]]:
+        start = index * size
+        return list(enumerate(self.rows[start:start + size], start + 1))
+
+    def pages(self, size: int) -> int:
+        return max(1, -(-len(self.rows) // size))
+
+
+class RankingCache:
+    def __init__(self):
+        self._entries: dict[tuple[int, Hashable], Ranking] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, guild_id: int, key: Hashable, build: Callable[[], list[RankRow]]) -> Ranking:
+        entry = self._entries.get((guild_id, key))
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        rows = build()
+        entry = self._entries[(guild_id, key)] = Ranking(rows, {row.user_id: i for i, row in enumerate(rows, 1)})
+        return entry
+
+    def invalidate(self, guild_id: int | None = None) -> None:
+        """guild_id 없으면 전체"""
+        if guild_id is None:
+            self._entries.clear()
+        else:
+            for key in [k for k in self._entries if k[0] == guild_id]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 봇 전역 랭킹 캐시
+rankings = RankingCache()
@@ -0,0 +1,133 @@
+# utils/rating.py
+"""
+내전 레이팅 (팀 Elo).
+
+팀 레이팅 = 팀원 레이팅 평균. 두 팀 평균으로 기대 승률을 구하고
+결과와의 차이 × K 만큼 팀원 전원에게 같은 폭으로 반영한다.
+값은 user_stats.json 유저 레코드의 "레이팅"/"레이팅판수"에 참여/승리/패배와 함께 저장하고,
+!레이팅랭킹 용 정렬 인덱스는 결과 기록 때마다 증분 갱신한다.
+
+파라미터(RATING_START / RATING_K / RATING_SCALE)를 바꾸면
+python -m tools.rating_replay 로 내전 기록 전체를 다시 계산할 수 있다.
+"""
+from __future__ import annotations
+from bisect import bisect_left, insort
+from typing import Iterable
+
+from utils.stats import load_stats, save_stats, ensure_user
+
+RATING_START = 1500.0
+RATING_K = 32.0
+RATING_SCALE = 400.0
+RATING_MIN_GAMES = 5    # 랭킹에 올릴 최소 레이팅 반영 판수
+
+
+def expected_score(rating_a: float, rating_b: float, scale: float = RATING_SCALE) -> float:
+    """a가 b를 이길 기대 확률"""
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / scale))
+
+
+def team_rating(ratings: Iterable[float]) -> float:
+    ratings = list(ratings)
+    return sum(ratings) / len(ratings) if ratings else RATING_START
+
+
+def elo_delta(team1: Iterable[float], team2: Iterable[float], winner: int,
+              k: float = RATING_K, scale: float = RATING_SCALE) -> float:
+    """1팀 팀원 각자에게 더할 변동량 (2팀은 부호 반대)"""
+    e1 = expected_score(team_rating(team1), team_rating(team2), scale)
+    s1 = 1.0 if winner == 1 else 0.0
+    return k * (s1 - e1)
+
+
+class RatingStore:
+    """user_stats.json의 레이팅 필드 + (-레이팅, uid) 정렬 인덱스"""
+
+    def __init__(self):
+        self._ratings: dict[str, float] | None = None
+        self._games: dict[str, int] = {}
+        self._rank: list[tuple[float, str]] = []
+
+    def _load(self) -> dict[str, float]:
+        if self._ratings is None:
+            self._ratings, self._games = {}, {}
+            for uid, rec in load_stats().items():
+                if rec.get("레이팅판수"):
+                    self._ratings[uid] = float(rec.get("레이팅", RATING_START))
+                    self._games[uid] = int(rec["레이팅판수"])
+            self._rank = sorted((-r, uid) for uid, r in self._ratings.items())
+        return self._ratings
+
+    def _reindex(self, uid: str, rating: float) -> None:
+        old = self._ratings.get(uid)
+        if old is not None:
+            i = bisect_left(self._rank, (-old, uid))
+            if i < len(self._rank) and self._rank[i] == (-old, uid):
+                del self._rank[i]
+        self._ratings[uid] = rating
+        insort(self._rank, (-rating, uid))
+
+    def get(self, user_id: int | str) -> float:
+        return self._load().get(str(user_id), RATING_START)
+
+    def games(self, user_id: int | str) -> int:
+        self._load()
+        return self._games.get(str(user_id), 0)
+
+    def apply_result(self, team1: Iterable[int], team2: Iterable[int], winner: int) -> float:
+        """결과 1판 반영. 1팀 팀원 변동량 반환 (2팀은 -값)."""
+        self._load()
+        team1 = [str(u) for u in team1]
+        team2 = [str(u) for u in team2]
+        delta = elo_delta([self.get(u) for u in team1], [self.get(u) for u in team2], winner)
+
+        stats = load_stats()
+        for uids, d in ((team1, delta), (team2, -delta)):
+            for uid in uids:
+                rec = ensure_user(stats, uid)
+                rating = round(float(rec.get("레이팅", RATING_START)) + d, 2)
+                rec["레이팅"] = rating
+                rec["레이팅판수"] = int(rec.get("레이팅판수", 0)) + 1
+                self._games[uid] = rec["레이팅판수"]
+                self._reindex(uid, rating)
+        save_stats(stats)
+        return delta
+
+    def replace_all(self, ratings: dict[str, tuple[float, int]]) -> None:
+        """오프라인 재계산 결과로 전체 교체 {uid: (레이팅, 판수)}"""
+        stats = load_stats()
+        for uid, rec in stats.items():
+            rec.pop("레이팅", None)
+            rec.pop("레이팅판수", None)
+        for uid, (rating, games) in ratings.items():
+            rec = ensure_user(stats, uid)
+            rec["레이팅"] = round(float(rating), 2)
+            rec["레이팅판수"] = int(games)
+        save_stats(stats)
+        self._ratings = None  # 다음 조회 때 인덱스 재구성
+
+    def leaderboard(self, k: int = 20, min_games: int = RATING_MIN_GAMES) -> list[tuple[int, float, int]]:
+        """레이팅 상위 k명 [(uid, 레이팅, 판수)] — 판수 미달은 건너뜀"""
+        self._load()
+        out = []
+        for neg, uid in self._rank:
+            games = self._games.get(uid, 0)
+            if games < min_games:
+                continue
+            out.append((int(uid), -neg, games))
+            if len(out) >= k:
+                break
+        return out
+
+    def rank_of(self, user_id: int | str, min_games: int = RATING_MIN_GAMES) -> int | None:
+        """판수 기준을 채운 유저 중 순위(1부터)"""
+        self._load()
+        uid = str(user_id)
+        if self._games.get(uid, 0) < min_games:
+            return None
+        rating = self._ratings[uid]
+        i = bisect_left(self._rank, (-rating, uid))
+        return 1 + sum(1 for _, other in self._rank[:i] if self._games.get(other, 0) >= min_games)
+
+
+ratings = RatingStore()
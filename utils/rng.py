@@ -0,0 +1,99 @@
+# utils/rng.py
+"""
+게임용 난수 서비스.
+
+판(세션)마다 시드를 하나 발급하고, 그 시드로 만든 카운터 기반 PRNG로만 결과를 뽑는다.
+n번째 출력은 (시드, n)만으로 결정되므로 로그에 남긴 시드로 분쟁 판을 그대로 재현할 수 있다.
+RNG.reseed(마스터시드)를 호출하면 이후 발급되는 시드도 결정적이 되어
+벤치마크/테스트에서 게임 흐름 전체를 재현 가능하게 돌릴 수 있다.
+"""
+from __future__ import annotations
+import random
+import secrets
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+def splitmix64(x: int) -> int:
+    """SplitMix64 혼합 함수 (64비트 입력 → 64비트 출력)"""
+    x = (x + _GOLDEN) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class CounterRNG(random.Random):
+    """
+    카운터 기반 PRNG: n번째 64비트 출력 = splitmix64(seed + n * GOLDEN).
+    random.Random을 상속하므로 choice/choices/sample/shuffle/uniform 등을 그대로 쓴다.
+    """
+
+    def __init__(self, seed: int):
+        self._seed = 0
+        self.counter = 0
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2) -> None:  # random.Random.__init__에서 호출
+        self._seed = int(a or 0) & _MASK64
+        self.counter = 0
+
+    @property
+    def initial_seed(self) -> int:
+        """이 PRNG를 만든 시드 (로그/재현용)"""
+        return self._seed
+
+    def getstate(self):
+        return (self._seed, self.counter)
+
+    def setstate(self, state) -> None:
+        self._seed, self.counter = state
+
+    def _next64(self) -> int:
+        self.counter += 1
+        return splitmix64((self._seed + self.counter * _GOLDEN) & _MASK64)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 0:
+            return 0
+        out, bits = 0, 0
+        while bits < k:
+            out |= self._next64() << bits
+            bits += 64
+        return out & ((1 << k) - 1)
+
+
+class RNGService:
+    """세션별 시드 발급기"""
+
+    def __init__(self, master_seed: int | None = None):
+        self.reseed(master_seed)
+
+    def reseed(self, master_seed: int | None = None) -> None:
+        """마스터 시드 지정 시 이후 발급 시드가 결정적. None이면 OS 난수 사용."""
+        self._master = CounterRNG(master_seed) if master_seed is not None else None
+
+    def new_seed(self) -> int:
+        if self._master is not None:
+            return self._master.getrandbits(64)
+        return secrets.randbits(64)
+
+    def session(self, seed: int | None = None) -> CounterRNG:
+        """새 세션용 PRNG. seed를 주면 그 판을 재현."""
+        return CounterRNG(self.new_seed() if seed is None else seed)
+
+
+def format_seed(seed: int) -> str:
+    return f"{seed:016x}"
+
+
+def parse_seed(text: str) -> int:
+    """로그에 찍힌 16진 시드 문자열 → 정수"""
+    return int(text.strip().lower().removeprefix("0x"), 16)
+
+
+# 봇 전역 난수 서비스
+RNG = RNGService()
@@ -0,0 +1,226 @@
+# utils/rollups.py
+"""
+기간별(오늘/이번주/이번달/시즌) 전적·포인트 집계.
+
+user_stats.json 카운터는 누적값뿐이라, 결과/포인트 이벤트를 KST 날짜 기준 시간 버킷에 따로 더해 둔다.
+- 이벤트는 그날 일 버킷(d:YYYY-MM-DD)과 현재 시즌 버킷(s:N)에만 더한다.
+- 날짜가 바뀌면 지난 일 버킷을 주(w:YYYY-Www)/월(m:YYYY-MM) 버킷에 접어 넣고(compact),
+  DAY_RETENTION 일이 지난 일 버킷과 WEEK_RETENTION 주가 지난 주 버킷은 지운다.
+- 기간 조회 = 접힌 버킷 1개 + 아직 안 접힌 일 버킷(보통 오늘 하나)의 합 → 기록을 훑지 않는다.
+- 시즌 초기화는 시즌 번호만 올린다 (끝난 시즌 버킷은 s:N 그대로 보관).
+- 집계는 메모리에 들고 파일 쓰기는 ROLLUPS_SAVE_DELAY 초에 한 번으로 모은다 (!출석 몰림/배팅 정산 때
+  유저마다 파일 전체를 다시 쓰지 않게). 봇 종료(StatsCog 언로드) 때 flush, 이벤트 루프 밖(도구)에서는 바로 저장.
+
+저장 형식 (data/stat_rollups.json):
+    {"season": {"id": 2, "started": "2026-10-01"},
+     "seasons": [{"id": 1, "started": "...", "ended": "..."}],
+     "folded": "2026-10-18",       # 이 날짜까지의 일 버킷은 주/월 버킷에 반영됨
+     "buckets": {"d:2026-10-19": {"<uid>": {"참여": 1, "승리": 1, "포인트": 1500}}, ...}}
+"""
+from __future__ import annotations
+import asyncio
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterable
+from zoneinfo import ZoneInfo
+
+from utils.stats import DATA_DIR, RESULT_KEYS, _read_json, _write_json, on_points_changed
+from utils.timers import timers
+
+ROLLUPS_PATH = DATA_DIR / "stat_rollups.json"
+KST = ZoneInfo("Asia/Seoul")
+
+DAY_RETENTION = 35     # 일 버킷 보관 일수 (주/월 버킷에 접힌 뒤)
+WEEK_RETENTION = 53    # 주 버킷 보관 주수
+ROLLUPS_SAVE_DELAY = 5.0   # 변경을 모아 파일에 쓰는 간격(초)
+WINDOWS = ("오늘", "이번주", "이번달", "지난주", "지난달", "시즌", "지난시즌")
+
+
+def today_kst() -> date:
+    return datetime.now(KST).date()
+
+
+def _day_key(d: date) -> str:
+    return f"d:{d.isoformat()}"
+
+
+def _week_key(d: date) -> str:
+    year, week, _ = d.isocalendar()
+    return f"w:{year}-W{week:02d}"
+
+
+def _month_key(d: date) -> str:
+    return f"m:{d.year}-{d.month:02d}"
+
+
+def _merge(dst: dict, src: dict) -> None:
+    """버킷 src를 dst에 더함 {uid: {키: 값}}"""
+    for uid, counters in src.items():
+        rec = dst.setdefault(uid, {})
+        for key, value in counters.items():
+            rec[key] = rec.get(key, 0) + value
+
+
+class StatRollups:
+    def __init__(self, path=ROLLUPS_PATH):
+        self.path = path
+        self._data: dict | None = None
+        self._dirty = False
+        self.timer_key = f"rollups:{Path(path).name}:save"
+
+    def _load(self) -> dict:
+        if self._data is None:
+            data = _read_json(self.path)
+            data.setdefault("season", {"id": 1, "started": today_kst().isoformat()})
+            data.setdefault("seasons", [])
+            data.setdefault("folded", None)
+            data.setdefault("buckets", {})
+            self._data = data
+        return self._data
+
+    def _save(self) -> None:
+        """저장 예약 (이미 예약돼 있으면 그 저장이 최신 상태를 씀)"""
+        self._dirty = True
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:   # 이벤트 루프 밖 (도구/스크립트)
+            self.flush()
+            return
+        if self.timer_key not in timers:
+            timers.schedule(self.timer_key, ROLLUPS_SAVE_DELAY, self._flush_later)
+
+    async def _flush_later(self) -> None:
+        self.flush()
+
+    def flush(self) -> None:
+        """밀린 변경을 지금 파일에 씀"""
+        timers.cancel(self.timer_key)
+        if self._dirty:
+            _write_json(self.path, self._data)
+            self._dirty = False
+
+    @property
+    def season(self) -> dict:
+        return self._load()["season"]
+
+    # ───────── 접기 ─────────
+    def compact(self, today: date | None = None) -> bool:
+        """어제까지의 일 버킷을 주/월 버킷에 접고 오래된 버킷 정리. 바뀐 게 있으면 True."""
+        data = self._load()
+        today = today or today_kst()
+        yesterday = today - timedelta(days=1)
+        folded = data["folded"]
+        if folded is not None and folded >= yesterday.isoformat():
+            return False
+
+        buckets = data["buckets"]
+        for key in sorted(k for k in buckets if k.startswith("d:")):
+            day = date.fromisoformat(key[2:])
+            if day >= today or (folded is not None and key[2:] <= folded):
+                continue
+            _merge(buckets.setdefault(_week_key(day), {}), buckets[key])
+            _merge(buckets.setdefault(_month_key(day), {}), buckets[key])
+
+        oldest_day = _day_key(today - timedelta(days=DAY_RETENTION))
+        oldest_week = _week_key(today - timedelta(weeks=WEEK_RETENTION))
+        for key in list(buckets):
+            if (key.startswith("d:") and key < oldest_day) or (key.startswith("w:") and key < oldest_week):
+                del buckets[key]
+        data["folded"] = yesterday.isoformat()
+        return True
+
+    # ───────── 기록 ─────────
+    def _add(self, changes: Iterable[tuple[int | str, str, int]], today: date | None = None) -> None:
+        today = today or today_kst()
+        self.compact(today)
+        data = self._load()
+        day = data["buckets"].setdefault(_day_key(today), {})
+        season = data["buckets"].setdefault(f"s:{data['season']['id']}", {})
+        for uid, key, value in changes:
+            for bucket in (day, season):
+                rec = bucket.setdefault(str(uid), {})
+                rec[key] = rec.get(key, 0) + value
+        self._save()
+
+    def record_results(self, winners, losers, mode: str = "내전", today: date | None = None) -> None:
+        played, won, lost = RESULT_KEYS[mode]
+        changes = []
+        for uids, key in ((winners, won), (losers, lost)):
+            for uid in uids:
+                changes += [(uid, played, 1), (uid, key, 1)]
+        self._add(changes, today)
+
+    def record_points(self, amounts: dict, today: date | None = None) -> None:
+        """포인트 증감 {uid: 증감} (utils.stats 포인트 함수가 호출)"""
+        changes = [(uid, "포인트", int(amount)) for uid, amount in amounts.items() if amount]
+        if changes:
+            self._add(changes, today)
+
+    # ───────── 조회 ─────────
+    def window_keys(self, window: str, today: date | None = None) -> list[str]:
+        """기간을 덮는 버킷 키 (접힌 버킷 + 아직 안 접힌 일 버킷)"""
+        today = today or today_kst()
+        data = self._load()
+        if window == "시즌":
+            return [f"s:{data['season']['id']}"]
+        if window == "지난시즌":
+            return [f"s:{data['season']['id'] - 1}"] if data["season"]["id"] > 1 else []
+        if window == "오늘":
+            return [_day_key(today)]
+
+        if window in ("이번주", "지난주"):
+            anchor = today if window == "이번주" else today - timedelta(weeks=1)
+            period_key, same_period = _week_key(anchor), (lambda d: _week_key(d) == period_key)
+        elif window in ("이번달", "지난달"):
+            anchor = today if window == "이번달" else today.replace(day=1) - timedelta(days=1)
+            period_key, same_period = _month_key(anchor), (lambda d: _month_key(d) == period_key)
+        else:
+            raise ValueError(f"알 수 없는 기간: {window}")
+
+        folded = data["folded"] or ""
+        return [period_key] + [k for k in data["buckets"]
+                               if k.startswith("d:") and k[2:] > folded and same_period(date.fromisoformat(k[2:]))]
+
+    def totals(self, window: str, today: date | None = None) -> dict[str, dict]:
+        """기간 합계 {uid: {키: 값}} (조회 전용)"""
+        if self.compact(today):
+            self._save()
+        buckets = self._load()["buckets"]
+        keys = [k for k in self.window_keys(window, today) if k in buckets]
+        if len(keys) == 1:
+            return buckets[keys[0]]
+        out: dict[str, dict] = {}
+        for key in keys:
+            _merge(out, buckets[key])
+        return out
+
+    def user(self, user_id: int | str, window: str, today: date | None = None) -> dict:
+        uid = str(user_id)
+        if self.compact(today):
+            self._save()
+        buckets = self._load()["buckets"]
+        out: dict = {}
+        for key in self.window_keys(window, today):
+            for name, value in buckets.get(key, {}).get(uid, {}).items():
+                out[name] = out.get(name, 0) + value
+        return out
+
+    # ───────── 시즌 ─────────
+    def reset_season(self, today: date | None = None) -> dict:
+        """현재 시즌을 보관하고 새 시즌 시작 → 끝난 시즌 정보 반환"""
+        data = self._load()
+        today = (today or today_kst()).isoformat()
+        ended = dict(data["season"], ended=today)
+        data["seasons"].append(ended)
+        data["season"] = {"id": ended["id"] + 1, "started": today}
+        self._dirty = True
+        self.flush()
+        return ended
+
+    def bucket_count(self) -> int:
+        return len(self._load()["buckets"])
+
+
+# 봇 전역 기간 집계 (utils.stats 포인트 변동 구독)
+rollups = StatRollups()
+on_points_changed(rollups.record_points)
@@ -11,7 +11,13 @@ DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
 STATS_PATH = DATA_DIR / "user_stats.json"
-MANG_PATH = DATA_DIR / "mang.json"  # 기존 'mang.json'도 같은 폴더로
+
+# 전적 모드별 카운터 키: 내전은 기존 키 그대로, 스크림은 "스크림_" 접두사
+MODES = ("내전", "스크림")
+RESULT_KEYS = {
+    "내전": ("참여", "승리", "패배"),
+    "스크림": ("스크림_참여", "스크림_승리", "스크림_패배"),
+}
 
 # 유저 기본 레코드
 DEFAULT_USER = {
@@ -39,11 +45,30 @@ def _write_json(path: Path, data: dict) -> None:
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
+# 읽기 전용 캐시: 파일 변경(mtime/크기)이나 save_stats가 없으면 다시 파싱하지 않음
+_cache: dict = {"sig": None, "data": None}
+
+def _file_sig(path: Path):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 def load_stats() -> dict:
     return _read_json(STATS_PATH)
 
 def save_stats(data: dict) -> None:
     _write_json(STATS_PATH, data)
+    _cache["sig"] = None
+
+def cached_stats() -> dict:
+    """조회 전용 (수정 금지). 변경이 필요하면 load_stats/save_stats."""
+    sig = _file_sig(STATS_PATH)
+    if _cache["data"] is None or sig is None or sig != _cache["sig"]:
+        _cache["data"] = load_stats()
+        _cache["sig"] = _file_sig(STATS_PATH)
+    return _cache["data"]
 
 def ensure_user(stats: dict, uid: str) -> dict:
     """해당 유저 레코드를 보장하고 누락 키를 채움."""
@@ -59,28 +84,34 @@ def ensure_user(stats: dict, uid: str) -> dict:
 def format_num(n: int | float) -> str:
     return f"{n:,}"
 
-def update_result_dual(user_id: str, won: bool) -> None:
-    """
-    내전/멸망(스크림) 결과를 양쪽 파일(user_stats.json, mang.json)에 업데이트.
-    새 스키마(포인트/경험치/출석)도 자동 보강.
-    """
-    for path in (STATS_PATH, MANG_PATH):
-        stats = _read_json(path)
-        if user_id not in stats:
-            stats[user_id] = DEFAULT_USER.copy()
-        else:
-            for k, v in DEFAULT_USER.items():
-                stats[user_id].setdefault(k, v)
-
-        stats[user_id]["참여"] += 1
-        if won:
-            stats[user_id]["승리"] += 1
-        else:
-            stats[user_id]["패배"] += 1
-
-        _write_json(path, stats)
+def record_results(winners, losers, mode: str = "내전") -> None:
+    """한 판 결과를 모드별 카운터에 한 번의 읽기/쓰기로 반영."""
+    played, won, lost = RESULT_KEYS[mode]
+    stats = load_stats()
+    for uids, key in ((winners, won), (losers, lost)):
+        for uid in uids:
+            rec = ensure_user(stats, str(uid))
+            rec[played] = int(rec.get(played, 0)) + 1
+            rec[key] = int(rec.get(key, 0)) + 1
+    save_stats(stats)
+
+def result_record(user_id: int | str, mode: str = "내전") -> tuple[int, int, int]:
+    """(참여, 승리, 패배) — !전적/!스크림 공용 조회"""
+    rec = cached_stats().get(str(user_id), {})
+    return tuple(int(rec.get(k, 0)) for k in RESULT_KEYS[mode])
 
 # --- points helpers ---
+# 포인트 증감 구독자 (기간별 집계 utils.rollups 가 등록) — hook({uid: 증감})
+_point_hooks: list = []
+
+def on_points_changed(hook) -> None:
+    _point_hooks.append(hook)
+
+def notify_points(changes: dict) -> None:
+    """포인트를 직접 고친 곳(출석/지급 등)에서도 호출해 증감을 알림"""
+    for hook in _point_hooks:
+        hook(changes)
+
 def get_points(user_id: int | str) -> int:
     stats = load_stats()
     rec = ensure_user(stats, str(user_id))
@@ -90,10 +121,27 @@ def add_points(user_id: int | str, amount: int) -> int:
     """양수/음수 모두 허용. 음수면 차감, 최소 0 보장."""
     stats = load_stats()
     rec = ensure_user(stats, str(user_id))
-    rec["포인트"] = max(0, int(rec.get("포인트", 0)) + int(amount))
+    before = int(rec.get("포인트", 0))
+    rec["포인트"] = max(0, before + int(amount))
     save_stats(stats)
+    notify_points({user_id: rec["포인트"] - before})
     return rec["포인트"]
 
+def add_points_many(amounts: dict) -> dict:
+    """여러 유저 포인트를 한 번의 읽기/쓰기로 반영 {uid: 증감}. 새 잔액 dict 반환."""
+    stats = load_stats()
+    balances, changes = {}, {}
+    for user_id, amount in amounts.items():
+        rec = ensure_user(stats, str(user_id))
+        before = int(rec.get("포인트", 0))
+        rec["포인트"] = max(0, before + int(amount))
+        balances[user_id] = rec["포인트"]
+        changes[user_id] = rec["포인트"] - before
+    if amounts:
+        save_stats(stats)
+        notify_points(changes)
+    return balances
+
 def can_spend_points(user_id: int | str, amount: int) -> bool:
     return get_points(user_id) >= int(amount)
 
@@ -106,4 +154,5 @@ def spend_points(user_id: int | str, amount: int) -> bool:
         return False
     rec["포인트"] = int(rec.get("포인트", 0)) - amount
     save_stats(stats)
+    notify_points({user_id: -amount})
     return True
\ No newline at end of file
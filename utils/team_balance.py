@@ -0,0 +1,140 @@
+# utils/team_balance.py
+"""
+자동 팀 밸런스 (팀장 드래프트 대신 쓰는 선택 모드).
+
+참가자 실력 점수 합의 차이가 가장 작은 두 팀 분할을 찾는다.
+- 라인 제약: 각 팀이 선호 라인만으로 TOP/JG/MID/AD/SUP 를 모두 채울 수 있는 분할을 우선한다.
+  (라인 정보가 없는 참가자는 아무 라인이나 가능으로 본다)
+- EXHAUSTIVE_MAX 명 이하: 첫 참가자를 1팀에 고정하고 모든 분할을 탐색 (10명이면 C(9,4)=126가지)
+- 그보다 많으면: 강한 순 탐욕 배치 후 두 팀 간 1:1 교환으로 개선하는 휴리스틱
+
+python -m tools.balance_bench 로 응답 시간을 확인할 것 (목표 50ms 이하).
+"""
+from __future__ import annotations
+from functools import lru_cache
+from itertools import combinations
+from typing import NamedTuple, Sequence
+
+LANES = ("TOP", "JG", "MID", "AD", "SUP")
+ALL_LANES = (1 << len(LANES)) - 1
+EXHAUSTIVE_MAX = 14
+
+
+class Player(NamedTuple):
+    uid: int
+    strength: float
+    lanes: int = ALL_LANES    # 선호 라인 비트마스크 (LANES 순서)
+
+
+class BalanceResult(NamedTuple):
+    team1: list[Player]
+    team2: list[Player]
+    diff: float               # |1팀 합 - 2팀 합|
+    lanes_ok: bool            # 두 팀 모두 라인 구성이 가능한지
+    exhaustive: bool
+
+
+def lane_mask(lanes: Sequence[str]) -> int:
+    """["TOP", "JG"] → 비트마스크 (빈 목록이면 전 라인)"""
+    mask = 0
+    for lane in lanes:
+        if lane in LANES:
+            mask |= 1 << LANES.index(lane)
+    return mask or ALL_LANES
+
+
+@lru_cache(maxsize=4096)
+def _lanes_coverable(masks: tuple[int, ...]) -> bool:
+    """정렬된 마스크 튜플: 서로 다른 라인을 하나씩 배정해 LANES를 모두 채울 수 있는가"""
+    need = min(len(masks), len(LANES))
+
+    @lru_cache(maxsize=None)
+    def assign(i: int, used: int) -> int:
+        # i번째 이후 참가자로 추가로 채울 수 있는 최대 라인 수
+        if i == len(masks):
+            return 0
+        best = assign(i + 1, used)  # 이 참가자는 라인 없이(남는 인원)
+        free = masks[i] & ~used
+        while free and best < need:
+            bit = free & -free
+            best = max(best, 1 + assign(i + 1, used | bit))
+            free ^= bit
+        return best
+
+    return assign(0, 0) >= need
+
+
+def lanes_ok(team: Sequence[Player]) -> bool:
+    return _lanes_coverable(tuple(sorted(p.lanes for p in team)))
+
+
+def _exhaustive(players: Sequence[Player], size1: int) -> BalanceResult:
+    total = sum(p.strength for p in players)
+    n = len(players)
+    best_key, best_idx = None, None
+    # 0번을 1팀에 고정 (양 팀 크기가 같을 때 대칭 분할 중복 제거)
+    first_fixed = n - size1 == size1
+    pool = range(1, n) if first_fixed else range(n)
+    k = size1 - 1 if first_fixed else size1
+    for combo in combinations(pool, k):
+        idx = (0, *combo) if first_fixed else combo
+        s1 = sum(players[i].strength for i in idx)
+        diff = abs(total - 2 * s1)
+        if best_key is not None and (0, diff) >= best_key:
+            continue  # 라인까지 맞아도 더 나을 수 없음
+        chosen = set(idx)
+        t1 = [players[i] for i in idx]
+        t2 = [players[i] for i in range(n) if i not in chosen]
+        key = ((not lanes_ok(t1)) + (not lanes_ok(t2)), diff)
+        if best_key is None or key < best_key:
+            best_key, best_idx = key, idx
+    chosen = set(best_idx)
+    t1 = [players[i] for i in best_idx]
+    t2 = [players[i] for i in range(n) if i not in chosen]
+    return BalanceResult(t1, t2, best_key[1], best_key[0] == 0, True)
+
+
+def _heuristic(players: Sequence[Player], size1: int) -> BalanceResult:
+    order = sorted(players, key=lambda p: -p.strength)
+    size2 = len(players) - size1
+    t1: list[Player] = []
+    t2: list[Player] = []
+    s1 = s2 = 0.0
+    for p in order:  # 강한 사람부터, 자리가 남은 팀 중 합이 작은 쪽에
+        if len(t2) >= size2 or (len(t1) < size1 and s1 <= s2):
+            t1.append(p)
+            s1 += p.strength
+        else:
+            t2.append(p)
+            s2 += p.strength
+
+    def cost(a: list[Player], b: list[Player]) -> tuple[int, float]:
+        return ((not lanes_ok(a)) + (not lanes_ok(b)),
+                abs(sum(p.strength for p in a) - sum(p.strength for p in b)))
+
+    best = cost(t1, t2)
+    improved = True
+    while improved:  # 1:1 교환 언덕 오르기
+        improved = False
+        for i in range(len(t1)):
+            for j in range(len(t2)):
+                t1[i], t2[j] = t2[j], t1[i]
+                c = cost(t1, t2)
+                if c < best:
+                    best, improved = c, True
+                else:
+                    t1[i], t2[j] = t2[j], t1[i]
+    return BalanceResult(t1, t2, best[1], best[0] == 0, False)
+
+
+def balance_teams(players: Sequence[Player]) -> BalanceResult:
+    """두 팀으로 분할 (1팀이 n//2명). 각 팀은 실력 내림차순 정렬."""
+    if len(players) < 2:
+        raise ValueError("참가자가 2명 이상이어야 합니다.")
+    size1 = len(players) // 2
+    if len(players) <= EXHAUSTIVE_MAX:
+        result = _exhaustive(list(players), size1)
+    else:
+        result = _heuristic(list(players), size1)
+    by_strength = lambda team: sorted(team, key=lambda p: -p.strength)
+    return result._replace(team1=by_strength(result.team1), team2=by_strength(result.team2))
@@ -0,0 +1,170 @@
+# utils/timers.py
+"""
+봇 전역 타이머 스케줄러.
+
+내전 결과 타임아웃(3시간), 배팅 마감, 도박 세션 시간 초과, 청소 확인창 만료처럼
+'언젠가 한 번 실행할 콜백'을 작업 하나(최소 힙)에서 관리한다.
+타이머마다 잠자는 태스크를 만들지 않으므로 취소/조회가 가능하고, Cog 언로드 시 접두사로 한 번에 정리한다.
+
+키 규칙: "<cog>:<대상>:<용도>" (예: match:12:result, gamble:<sid>:timeout)
+같은 키로 다시 예약하면 기존 타이머를 대체한다(= 타임아웃 연장).
+
+테스트/도구: TimerScheduler(clock=...) 로 시계를 주입하면 실행기를 띄우지 않고,
+시계를 옮긴 뒤 run_due() 로 마감이 지난 타이머를 직접 돌린다 (잠들지 않음).
+"""
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+from typing import Any, Awaitable, Callable
+
+TimerCallback = Callable[..., Awaitable[Any]]
+
+
+class _Timer:
+    __slots__ = ("key", "deadline", "seq", "callback", "args", "cancelled")
+
+    def __init__(self, key: str, deadline: float, seq: int, callback: TimerCallback, args: tuple):
+        self.key = key
+        self.deadline = deadline
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def __lt__(self, other: "_Timer") -> bool:
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+
+class TimerScheduler:
+    """
+    (마감 시각, 순번) 최소 힙 + 키 인덱스.
+    취소는 표시만 하고 힙에서 꺼낼 때 버린다(지연 삭제). 실행기는 가장 이른 마감까지만 잔다.
+    """
+
+    def __init__(self, clock: Callable[[], float] | None = None):
+        self._clock = clock                        # None 이면 이벤트 루프 시계 + 실행기
+        self._heap: list[_Timer] = []
+        self._timers: dict[str, _Timer] = {}
+        self._seq = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._runner: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()   # 실행 중인 콜백 (종료 시 취소)
+
+    def _now(self) -> float:
+        return self._clock() if self._clock else asyncio.get_running_loop().time()
+
+    # ───────── 조회 ─────────
+    @property
+    def pending(self) -> int:
+        """대기 중인 타이머 수"""
+        return len(self._timers)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._timers
+
+    def remaining(self, key: str) -> float | None:
+        """남은 초 (없으면 None)"""
+        timer = self._timers.get(key)
+        if timer is None:
+            return None
+        return max(0.0, timer.deadline - self._now())
+
+    # ───────── 예약/취소 ─────────
+    def schedule(self, key: str, delay: float, callback: TimerCallback, *args: Any) -> None:
+        """delay초 뒤 await callback(*args). 같은 키가 있으면 대체."""
+        self.cancel(key)
+        timer = _Timer(key, self._now() + max(0.0, delay), next(self._seq), callback, args)
+        self._timers[key] = timer
+        heapq.heappush(self._heap, timer)
+        if self._clock:   # 시계 주입: run_due() 로 직접 실행
+            return
+        self._ensure_runner()
+        if self._heap[0] is timer:  # 더 이른 마감이 생겼으면 실행기를 깨움
+            self._wakeup.set()
+
+    def cancel(self, key: str) -> bool:
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        timer.cancelled = True
+        return True
+
+    def cancel_prefix(self, prefix: str) -> int:
+        """접두사로 일괄 취소 (Cog 언로드/내전 종료용). 취소한 수 반환."""
+        keys = [k for k in self._timers if k.startswith(prefix)]
+        for key in keys:
+            self.cancel(key)
+        return len(keys)
+
+    async def close(self) -> None:
+        """모든 타이머와 실행기 정리"""
+        for key in list(self._timers):
+            self.cancel(key)
+        self._heap.clear()
+        tasks = [t for t in (self._runner, *self._running) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._runner = None
+        self._running.clear()
+
+    async def run_due(self) -> int:
+        """마감이 지난 타이머를 (마감, 예약 순) 차례로 실행하고 끝날 때까지 기다림 → 실행 수"""
+        fired = 0
+        while (timer := self._pop_due()) is not None:
+            self._forget(timer)
+            await self._call(timer)
+            fired += 1
+        return fired
+
+    # ───────── 실행기 ─────────
+    def _pop_due(self) -> _Timer | None:
+        """취소된 항목을 버리고 마감이 지난 맨 앞 타이머를 꺼냄 (없으면 None)"""
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
+        if self._heap and self._heap[0].deadline <= self._now():
+            return heapq.heappop(self._heap)
+        return None
+
+    def _forget(self, timer: _Timer) -> None:
+        if self._timers.get(timer.key) is timer:
+            del self._timers[timer.key]
+
+    def _ensure_runner(self) -> None:
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            timer = self._pop_due()
+            if timer is not None:
+                self._fire(timer)
+                continue
+
+            timeout = self._heap[0].deadline - self._now() if self._heap else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _fire(self, timer: _Timer) -> None:
+        self._forget(timer)
+        task = asyncio.get_running_loop().create_task(self._call(timer))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    @staticmethod
+    async def _call(timer: _Timer) -> None:
+        try:
+            await timer.callback(*timer.args)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # 콜백 하나의 실패가 다른 타이머를 막지 않도록
+            print(f"[timers] {timer.key} 실패: {e!r}")
+
+
+# 봇 전역 타이머
+timers = TimerScheduler()